@@ -0,0 +1,137 @@
+"""
+Requests per second of a burst of concurrent requests over HTTP/1.1 (a pool of keep-alive connections) and over HTTP/2
+(one multiplexed connection), against local stub servers answering like the exchange after a fixed delay.
+The sync Transport sends from a thread pool and the AsyncTransport from as many concurrent tasks.
+
+    pip install python-bingx[http2]
+    python benchmarks/bench_http2.py
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+
+from bingX.aio.transport import AsyncTransport
+from bingX.transport import Transport
+
+BODY = b'{"code":0,"msg":"","data":{"serverTime":1700000000000}}'
+DELAY = 0.02
+REQUESTS = 400
+WORKERS = 50
+POOL_SIZE = 10
+
+
+class HTTP1Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        time.sleep(DELAY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class HTTP2Protocol(asyncio.Protocol):
+    """
+    A cleartext HTTP/2 server (prior knowledge) answering every stream after DELAY seconds
+    """
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        self.connection = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        self.connection.initiate_connection()
+        self.connection.update_settings({h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 1000})
+        self.transport.write(self.connection.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        for event in self.connection.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                asyncio.get_running_loop().call_later(DELAY, self.respond, event.stream_id)
+        self.transport.write(self.connection.data_to_send())
+
+    def respond(self, stream_id: int) -> None:
+        headers = [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(BODY)))]
+        self.connection.send_headers(stream_id, headers)
+        self.connection.send_data(stream_id, BODY, end_stream=True)
+        self.transport.write(self.connection.data_to_send())
+
+
+def serve_http1() -> str:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), HTTP1Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def serve_http2() -> str:
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(loop.create_server(HTTP2Protocol, "127.0.0.1", 0))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+
+def burst(transport: Transport) -> float:
+    def send(_: int) -> None:
+        response = transport.request("GET", Transport.PREWARM_ENDPOINT, "")
+        assert response.status_code == 200 and response.content == BODY
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        list(executor.map(send, range(WORKERS))) # connect before measuring
+        started = time.perf_counter()
+        list(executor.map(send, range(REQUESTS)))
+        return time.perf_counter() - started
+
+
+async def async_burst(transport: AsyncTransport) -> float:
+    semaphore = asyncio.Semaphore(WORKERS)
+
+    async def send(_: int) -> None:
+        async with semaphore:
+            response = await transport.request("GET", Transport.PREWARM_ENDPOINT, "")
+        assert response.status_code == 200 and response.content == BODY
+
+    async def no_wait(method: str, endpoint: str) -> float:
+        return 0.0
+
+    transport.rate_limiter.acquire_async = no_wait # measure the transport only
+    await asyncio.gather(*(send(i) for i in range(WORKERS))) # connect before measuring
+    started = time.perf_counter()
+    await asyncio.gather(*(send(i) for i in range(REQUESTS)))
+    seconds = time.perf_counter() - started
+    await transport.close()
+    return seconds
+
+
+def report(name: str, seconds: float, concurrency: str) -> None:
+    print(f"{name:>14}: {REQUESTS / seconds:>8,.0f} requests/s  {seconds / REQUESTS * 1e3:.2f} ms/request  ({WORKERS} {concurrency}, {DELAY * 1e3:.0f} ms server delay)")
+
+
+def main() -> None:
+    http1_url, http2_url = serve_http1(), serve_http2()
+    for name, transport in (
+        ("sync http/1.1", Transport(pool_maxsize=POOL_SIZE, base_url=http1_url)),
+        ("sync http/2", Transport(pool_maxsize=POOL_SIZE, base_url=http2_url, http2=True)),
+    ):
+        transport.rate_limiter.acquire = lambda method, endpoint: 0.0 # measure the transport only
+        seconds = burst(transport)
+        transport.close()
+        report(name, seconds, "threads")
+
+    for name, url, http2 in (("async http/1.1", http1_url, False), ("async http/2", http2_url, True)):
+        report(name, asyncio.run(async_burst(AsyncTransport(max_connections=POOL_SIZE, base_url=url, http2=http2))), "tasks")
+
+
+if __name__ == "__main__":
+    main()
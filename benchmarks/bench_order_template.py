@@ -0,0 +1,61 @@
+"""
+Client-side overhead of one order of a market making loop, from the price and quantity to the signed query string,
+building an Order every time against patching an OrderTemplate. "e2e" adds the whole create call against an in-process
+MockExchange with no latency, which includes the exchange's own parsing and signature check.
+
+    python benchmarks/bench_order_template.py
+"""
+import itertools
+import timeit
+
+from bingX._http_manager import _HTTPManager
+from bingX.main import BingX
+from bingX.perpetual.v2.template import OrderTemplate
+from bingX.perpetual.v2.types import Order, OrderType, PositionSide, Side
+from bingX.rate_limiter import RateLimiter
+from bingX.testing import MockExchange
+
+SECRET_KEY = "s" * 64
+TIMESTAMP = 1700000000000
+NUMBER = 100_000
+
+http_manager = _HTTPManager("api_key", SECRET_KEY, recv_window=5000)
+prices = itertools.cycle([64000.5 + i / 10 for i in range(100)])
+
+
+def order(price: float) -> Order:
+    return Order(symbol="BTC-USDT", side=Side.BUY, positionSide=PositionSide.LONG, type=OrderType.LIMIT, quantity=0.001, price=price)
+
+
+template = OrderTemplate(order(64000.5), http_manager)
+
+
+def prepare_order() -> str:
+    return http_manager._generate_query_string(order(next(prices)).to_dict(), TIMESTAMP)
+
+
+def prepare_template() -> str:
+    return http_manager._generate_query_string(template.payload(price=next(prices)), TIMESTAMP)
+
+
+def e2e() -> tuple:
+    unlimited = RateLimiter({group: (1e9, 1e9) for group in RateLimiter.DEFAULT_GROUPS}, ip_limit=(1e9, 1e9))
+    trade = BingX("api_key", SECRET_KEY, MockExchange(secret_key=SECRET_KEY, listings=5).transport(rate_limiter=unlimited)).perpetual_v2.trade
+    e2e_template = trade.order_template(order(64000.5))
+    return lambda: trade.create_order(order(next(prices))), lambda: trade.create_order_from_template(e2e_template, price=next(prices))
+
+
+def main() -> None:
+    expected = http_manager._generate_query_string(order(64000.5).to_dict(), TIMESTAMP).split("&")[:-1]
+    assert sorted(http_manager._generate_query_string(template.payload(), TIMESTAMP).split("&")[:-1]) == sorted(expected)
+    e2e_order, e2e_template = e2e()
+    for name, function, number in (
+        ("order", prepare_order, NUMBER), ("template", prepare_template, NUMBER),
+        ("e2e order", e2e_order, NUMBER // 10), ("e2e template", e2e_template, NUMBER // 10),
+    ):
+        seconds = min(timeit.repeat(function, number=number, repeat=5))
+        print(f"{name:>12}: {seconds / number * 1e6:>8.2f} us/order {number / seconds:>12,.0f} orders/s")
+
+
+if __name__ == "__main__":
+    main()
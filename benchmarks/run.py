@@ -0,0 +1,226 @@
+"""
+The benchmark suite of the client's hot paths, run offline against canned payloads and a local MockExchange.
+
+    python benchmarks/run.py                          # run every benchmark and save the results
+    python benchmarks/run.py -k decode                # only the benchmarks whose name contains "decode"
+    python benchmarks/run.py --compare results/abc1234.json
+
+Results are saved to benchmarks/results/<commit>.json (with a -dirty suffix for uncommitted changes). With --compare,
+every benchmark slower than the baseline by more than --threshold is reported and the exit status is 1, so a release
+job can fail on performance regressions. Only compare results measured on the same machine.
+
+The bench_*.py scripts compare one optimization against the code it replaced, bench_http2.py needs pip install h2.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from bingX._helpers import JSON_DECODERS, get_json_decoder
+from bingX._http_manager import _HTTPManager
+from bingX.aio import AsyncBingX, AsyncTransport
+from bingX.main import BingX
+from bingX.perpetual.v2.models import Ticker
+from bingX.perpetual.v2.template import OrderTemplate
+from bingX.perpetual.v2.types import Order, OrderType, PositionSide, Side
+from bingX.rate_limiter import RateLimiter
+from bingX.testing import MockExchange
+from bingX.transport import Transport
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+PAYLOAD = {"symbol": "BTC-USDT", "side": "BUY", "positionSide": "LONG", "type": "LIMIT", "price": 64000.5, "quantity": 0.001}
+E2E_REQUESTS = 300
+E2E_THREADS = 16
+
+
+
+def unlimited() -> RateLimiter:
+    # the default budgets would pace the end-to-end benchmarks to the exchange's limits
+    return RateLimiter({group: (1e9, 1e9) for group in RateLimiter.DEFAULT_GROUPS}, ip_limit=(1e9, 1e9))
+
+
+exchange = MockExchange()
+http_manager = _HTTPManager("api_key", "s" * 64, exchange.transport(rate_limiter=unlimited()))
+TICKERS = exchange.handle("GET", "/openApi/swap/v2/quote/ticker").content
+CONTRACTS = exchange.handle("GET", "/openApi/swap/v2/quote/contracts").content
+QUERY_STRING = "symbol=BTC-USDT&side=BUY&positionSide=LONG&type=LIMIT&price=64000.5&quantity=0.001&timestamp=1700000000000"
+decode = get_json_decoder()
+
+
+class CannedResponse:
+    status_code = 200
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+
+TICKERS_RESPONSE = CannedResponse(TICKERS)
+
+
+def parse_tickers() -> float:
+    return sum(ticker.last_price for ticker in Ticker.from_list(decode(TICKERS)["data"]))
+
+
+def to_dict() -> dict[str, Any]:
+    return Order(symbol="BTC-USDT", side=Side.BUY, positionSide=PositionSide.LONG, type=OrderType.LIMIT, quantity=0.001, price=64000.5, client_order_id="abc").to_dict()
+
+
+def order_template() -> Callable[[], str]:
+    template = OrderTemplate(Order(symbol="BTC-USDT", side=Side.BUY, positionSide=PositionSide.LONG, type=OrderType.LIMIT, quantity=0.001, price=64000.5), http_manager)
+    return lambda: http_manager._generate_query_string(template.payload(price=64000.5, client_order_id="abc"), 1700000000000)
+
+
+def kline_frame() -> Any:
+    from bench_kline import convert_after # requires numpy
+
+    return convert_after
+
+
+def served() -> str:
+    global base_url
+    if base_url is None:
+        base_url = exchange.serve()
+    return base_url
+
+
+base_url: str | None = None
+
+
+def e2e_inprocess() -> Callable[[], None]:
+    client = BingX("api_key", "secret_key", exchange.transport(rate_limiter=unlimited()))
+    return lambda: client.perpetual_v2.market.get_ticker("BTC-USDT")
+
+
+def e2e_sync(base_url: str) -> Callable[[], None]:
+    client = BingX("api_key", "secret_key", Transport(base_url=base_url, rate_limiter=unlimited()))
+    return lambda: client.perpetual_v2.market.get_ticker("BTC-USDT")
+
+
+def e2e_threads(base_url: str) -> Callable[[], None]:
+    client = BingX("api_key", "secret_key", Transport(base_url=base_url, pool_maxsize=E2E_THREADS, rate_limiter=unlimited()))
+    executor = ThreadPoolExecutor(max_workers=E2E_THREADS)
+
+    def burst() -> None:
+        list(executor.map(lambda _: client.perpetual_v2.market.get_ticker("BTC-USDT"), range(E2E_REQUESTS)))
+
+    return burst
+
+
+def e2e_async(base_url: str) -> Callable[[], None]:
+    loop = asyncio.new_event_loop() # the client's connections belong to the loop, they are kept across runs
+    client = AsyncBingX("api_key", "secret_key", AsyncTransport(base_url=base_url, max_connections=E2E_THREADS, rate_limiter=unlimited()))
+
+    async def burst() -> None:
+        await asyncio.gather(*(client.perpetual_v2.market.get_ticker("BTC-USDT") for _ in range(E2E_REQUESTS)))
+
+    return lambda: loop.run_until_complete(burst())
+
+
+# name: (a function returning the function to time, the number of operations per call)
+BENCHMARKS: dict[str, tuple[Callable[[], Callable[[], Any]], int]] = {
+    "sign": (lambda: lambda: http_manager._generate_signature(QUERY_STRING), 1),
+    "query_string": (lambda: lambda: http_manager._generate_query_string(dict(PAYLOAD), 1700000000000), 1),
+    "order_to_dict": (lambda: to_dict, 1),
+    "order_signed": (lambda: lambda: http_manager._generate_query_string(to_dict(), 1700000000000), 1),
+    "order_template_signed": (order_template, 1),
+    **{f"decode_tickers_{name}": (lambda decoder=decoder: lambda: decoder(TICKERS), 1) for name, decoder in JSON_DECODERS.items()},
+    "decode_contracts": (lambda: lambda: decode(CONTRACTS), 1),
+    "handle_response_tickers": (lambda: lambda: http_manager._handle_response(TICKERS_RESPONSE, decode), 1),
+    "parse_tickers": (lambda: parse_tickers, 1),
+    "kline_frame": (kline_frame, 1),
+    "e2e_inprocess": (e2e_inprocess, 1),
+    "e2e_http_sync": (lambda: e2e_sync(served()), 1),
+    "e2e_http_threads": (lambda: e2e_threads(served()), E2E_REQUESTS),
+    "e2e_http_async": (lambda: e2e_async(served()), E2E_REQUESTS),
+}
+
+
+def measure(function: Callable[[], Any], operations: int, repeat: int, budget: float) -> float:
+    """
+    It returns the best number of seconds per operation of `repeat` runs lasting about `budget` seconds each
+    """
+
+    number = 1
+    while (elapsed := timeit.timeit(function, number=number)) < budget / 10: # calibrate the number of calls per run
+        number *= 10 if elapsed < budget / 100 else 2
+    number = max(1, int(number * budget / max(elapsed, 1e-9)))
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number / operations
+
+
+def commit() -> str:
+    try:
+        sha = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "local"
+    return f"{sha}-dirty" if dirty else sha
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """
+    It prints every benchmark next to its baseline and returns the names of the ones slower by more than the threshold
+    """
+
+    regressions = []
+    for name, seconds in results.items():
+        if name not in baseline:
+            continue
+        change = seconds / baseline[name] - 1
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<28} {baseline[name] * 1e6:>12.3f} -> {seconds * 1e6:>12.3f} us/op  {change:>+8.1%}{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="filter", default="", help="only run the benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of runs of every benchmark, the best one is kept")
+    parser.add_argument("--budget", type=float, default=0.2, help="the duration of one run in seconds")
+    parser.add_argument("--output", help="the file the results are saved to, results/<commit>.json by default")
+    parser.add_argument("--compare", help="a results file to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1, help="the slowdown reported as a regression, 0.1 for 10%%")
+    args = parser.parse_args()
+
+    results: dict[str, float] = {}
+    for name, (setup, operations) in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        try:
+            function = setup()
+        except ImportError as e:
+            print(f"{name:<28} skipped: {e}")
+            continue
+        results[name] = measure(function, operations, args.repeat, args.budget)
+        print(f"{name:<28} {results[name] * 1e6:>12.3f} us/op {1 / results[name]:>14,.0f} ops/s")
+    exchange.close()
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit()}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "commit": commit(), "date": datetime.now(timezone.utc).isoformat(timespec="seconds"), "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()} {platform.processor()}".strip(), "seconds_per_op": results,
+        }, f, indent=2)
+    print(f"saved to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\ncompared with {baseline['commit']} ({baseline['date']})")
+        if regressions := compare(results, baseline["seconds_per_op"], args.threshold):
+            print(f"{len(regressions)} regressions: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
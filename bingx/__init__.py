@@ -1,2 +1,7 @@
-from bingX.exceptions import ClientError, ServerError
+from bingX.exceptions import ClientError, NetworkError, ServerError
+from bingX.keep_warm import KeepWarm
 from bingX.main import BingX
+from bingX.rate_limiter import RateLimiter
+from bingX.retry import RetryPolicy
+from bingX.time_sync import TimeSync
+from bingX.transport import Transport
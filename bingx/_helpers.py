@@ -1,18 +1,66 @@
 import hashlib
 import hmac
+import json
 import time
-from dataclasses import asdict
+from dataclasses import fields
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
+from urllib.parse import quote
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+JSONDecoder = Callable[[bytes], Any]
+
+
+def camel_case(name: str) -> str:
+    """
+    It returns the api name of a snake_case field, i.e. stopPrice for stop_price
+    """
+
+    head, *words = name.split("_")
+    return head + "".join(word[:1].upper() + word[1:] for word in words)
+
+
+def _compile_to_dict(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """
+    It generates the to_dict function of a dataclass, reading every field once without copying the instance
+    """
+
+    lines = ["def to_dict(self):", "    payload = {}"]
+    for f in fields(cls):
+        name = f.metadata.get("name", camel_case(f.name)) # field(metadata={"name": ...}) overrides the api name
+        lines += [
+            f"    value = self.{f.name}",
+            "    if value is not None:",
+            f"        payload[{name!r}] = value.value if isinstance(value, Enum) else value",
+        ]
+    lines.append("    return payload")
+    namespace: dict[str, Any] = {}
+    exec("\n".join(lines), {"Enum": Enum}, namespace)
+    return namespace["to_dict"]
+
+
+_TO_DICT: dict[type, Callable[[Any], dict[str, Any]]] = {}
 
 
 class DictMixin:
     def to_dict(self) -> dict[str, Any]:
-        def convert_value(value):
-            if isinstance(value, Enum):
-                return value.value
-            return value
-        return {k: convert_value(v) for k, v in asdict(self).items() if v is not None}
+        """
+        It returns the payload of the request: fields by their camelCase api name, enums by their value, without None values
+        """
+
+        to_dict = _TO_DICT.get(type(self))
+        if to_dict is None:
+            to_dict = _TO_DICT[type(self)] = _compile_to_dict(type(self))
+        return to_dict(self)
 
 
 def generate_timestamp() -> int:
@@ -30,3 +78,165 @@ def generate_hash(key: str, query_string: str) -> hmac.HMAC:
     :param query_string: The query string that you want to sign
     """
     return hmac.new(key.encode(), query_string.encode(), hashlib.sha256)
+
+
+_INNER_PAD = bytes(x ^ 0x36 for x in range(256))
+_OUTER_PAD = bytes(x ^ 0x5C for x in range(256))
+
+
+class Signer:
+    """
+    It signs query strings with HMAC-SHA256.
+    The inner and outer SHA256 states keyed with the padded secret key are computed once and copied for every signature,
+    which is cheaper than copying an hmac object.
+    """
+
+    __slots__ = ("__inner", "__outer")
+
+    def __init__(self, key: str) -> None:
+        """
+        :param key: The secret key that you'll use to sign
+        """
+
+        key_bytes = key.encode()
+        if len(key_bytes) > 64: # the block size of SHA256, longer keys are hashed first as in RFC 2104
+            key_bytes = hashlib.sha256(key_bytes).digest()
+        key_bytes = key_bytes.ljust(64, b"\0")
+        self.__inner = hashlib.sha256(key_bytes.translate(_INNER_PAD))
+        self.__outer = hashlib.sha256(key_bytes.translate(_OUTER_PAD))
+
+    def sign(self, query_string: str) -> str:
+        """
+        It returns the hex signature of the query string
+
+        :param query_string: The query string that you want to sign
+        """
+
+        inner = self.__inner.copy()
+        inner.update(query_string.encode())
+        outer = self.__outer.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
+
+    def extended(self, prefix: str) -> "Signer":
+        """
+        It returns a signer of the query strings starting with the prefix, which is hashed once here:
+        the returned signer is given the rest of the query string only
+
+        :param prefix: The beginning shared by the query strings
+        """
+
+        signer = object.__new__(Signer)
+        signer.__inner = self.__inner.copy()
+        signer.__inner.update(prefix.encode())
+        signer.__outer = self.__outer
+        return signer
+
+
+class PresignedPayload(dict):
+    """
+    A payload whose static part is already encoded and hashed, built by OrderTemplate.
+    It holds every field of the request, so the retry policy reads it as any other payload,
+    but signing it only formats and hashes the patched fields and the timestamp.
+    """
+
+    __slots__ = ("prefix", "signer", "suffix", "encoded_suffix")
+
+    def sign(self, timestamp: int) -> str:
+        """
+        It returns the encoded and signed query string of the payload
+
+        :param timestamp: The timestamp of the request in milliseconds
+        """
+
+        suffix = f"{self.suffix}&timestamp={timestamp}"
+        return f"{self.prefix}{self.encoded_suffix}&timestamp={timestamp}&signature={self.signer.sign(suffix)}"
+
+
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":")).encode
+_SAFE_VALUE_BYTES = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.~-"
+
+
+# the payload fields whose values are lists or dicts, sent as JSON
+_JSON_FIELDS = frozenset(("batchOrders", "orderIdList", "oids"))
+
+
+def _query_items(payload: dict[str, Any]) -> list[str]:
+    if _JSON_FIELDS.isdisjoint(payload):
+        return [f"{k}={v}" for k, v in payload.items() if v]
+    return [f"{k}={_JSON_ENCODER(v) if k in _JSON_FIELDS else v}" for k, v in payload.items() if v]
+
+
+def _encode_items(payload: dict[str, Any], items: list[str], query_string: str) -> str:
+    # once the safe bytes are removed, a query string whose values need no encoding is left with exactly
+    # one "=" per field and one "&" between them, a value holding either one would add parameters to the request
+    if query_string.encode().translate(None, _SAFE_VALUE_BYTES) == b"=&" * (len(items) - 1) + b"=" * bool(items):
+        return query_string
+    return "&".join([f"{k}={quote(_JSON_ENCODER(v) if k in _JSON_FIELDS else str(v), safe='')}" for k, v in payload.items() if v])
+
+
+def generate_query_strings(payload: dict[str, Any]) -> tuple[str, str]:
+    """
+    It returns the query string that is signed and the same query string with its values URL encoded, which is sent.
+    Empty values are skipped and the list fields (batchOrders, orderIdList, oids) are sent as JSON.
+    The values are only encoded when one of them contains unsafe characters.
+
+    :param payload: The payload that you want to convert to a query string
+    """
+
+    items = _query_items(payload)
+    query_string = "&".join(items)
+    return query_string, _encode_items(payload, items, query_string)
+
+
+def generate_query_string(payload: dict[str, Any]) -> str:
+    """
+    It joins the payload into the query string that is signed, empty values are skipped and the list fields are sent as JSON
+
+    :param payload: The payload that you want to convert to a query string
+    """
+
+    return "&".join(_query_items(payload))
+
+
+def encode_query_string(payload: dict[str, Any], query_string: str) -> str:
+    """
+    It returns the query string with its values URL encoded, the query string itself if none of them needs encoding
+
+    :param payload: The payload of the query string
+    :param query_string: The raw query string built by generate_query_string
+    """
+
+    return _encode_items(payload, [v for v in payload.values() if v], query_string)
+
+
+def _msgspec_loads(content: bytes) -> Any:
+    try:
+        return _msgspec_decoder.decode(content)
+    except msgspec.DecodeError as e: # keep the ValueError contract of json.loads
+        raise ValueError(str(e)) from e
+
+
+if msgspec is not None:
+    _msgspec_decoder = msgspec.json.Decoder()
+
+JSON_DECODERS: dict[str, JSONDecoder] = {"json": json.loads}
+if msgspec is not None:
+    JSON_DECODERS["msgspec"] = _msgspec_loads
+if orjson is not None:
+    JSON_DECODERS["orjson"] = orjson.loads
+
+
+def get_json_decoder(name: str | None = None) -> JSONDecoder:
+    """
+    It returns a function decoding a JSON response body, the fastest installed one (orjson, msgspec, json) if no name is given.
+    Every decoder raises ValueError on invalid JSON.
+
+    :param name: The name of the decoder, "orjson", "msgspec" or "json"
+    """
+
+    if name is None:
+        name = next(name for name in ("orjson", "msgspec", "json") if name in JSON_DECODERS)
+    if name not in JSON_DECODERS:
+        raise ValueError(f"JSON decoder {name} is not installed, available decoders: {', '.join(JSON_DECODERS)}")
+    return JSON_DECODERS[name]
@@ -1,19 +1,33 @@
-from json.decoder import JSONDecodeError
+import time
 from typing import Any
 
-import requests
-
-from bingX._helpers import generate_hash, generate_timestamp
-from bingX.exceptions import ClientError, InvalidMethodException, ServerError
-
-
-class _HTTPManager:
-    __BASE_URL = "https://open-api.bingx.com"
-
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.__secret_key = secret_key
-        self.__session = requests.Session()
-        self.__session.headers.update({'X-BX-APIKEY': api_key})
+from bingX._helpers import (
+    JSONDecoder,
+    PresignedPayload,
+    Signer,
+    generate_query_strings,
+    generate_timestamp,
+)
+from bingX.exceptions import (
+    ClientError,
+    InvalidMethodException,
+    NetworkError,
+    ServerError,
+)
+from bingX.instrumentation import RequestRecord, _error_code
+from bingX.retry import RetryAction
+from bingX.transport import Transport
+
+
+class _BaseHTTPManager:
+    """
+    Signing, query string and response handling shared by the sync and the async http managers
+    """
+
+    def __init__(self, api_key: str, secret_key: str, recv_window: int | None = None) -> None:
+        self.__signer = Signer(secret_key)
+        self.__headers = {'X-BX-APIKEY': api_key}
+        self.__recv_window = recv_window
 
     def _generate_signature(self, query_string: str) -> str:
         """
@@ -23,105 +37,202 @@ class _HTTPManager:
         :return: A string of the signature
         """
 
-        hmac = generate_hash(self.__secret_key, query_string)
-        signature = hmac.hexdigest()
-        return signature
+        return self.__signer.sign(query_string)
 
-    def _generate_query_string(self, payload: dict[str, Any] = {}) -> str:
+    def _generate_query_string(self, payload: dict[str, Any] | None = None, timestamp: int | None = None) -> str:
         """
-        It takes a payload and returns a query string
+        It takes a payload and returns a query string, the payload is not modified
 
         :param payload: The payload that you want to convert to a query string
+        :param timestamp: The timestamp of the request in milliseconds, the local time if not given
         :return: A string of the query string
         """
 
-        payload["timestamp"] = generate_timestamp()
-        query_string = '&'.join(f'{k}={v}' for k, v in payload.items() if v)
-        query_string += f"&signature={self._generate_signature(query_string)}"
-        return query_string
+        if isinstance(payload, PresignedPayload):
+            return payload.sign(timestamp if timestamp is not None else generate_timestamp())
+        payload = {**payload} if payload else {}
+        if self.__recv_window is not None and payload.get("recvWindow") is None:
+            payload["recvWindow"] = self.__recv_window
+        payload["timestamp"] = timestamp if timestamp is not None else generate_timestamp()
+        query_string, encoded = generate_query_strings(payload)
+        return f"{encoded}&signature={self._generate_signature(query_string)}"
 
-    def _request(self, method: str, endpoint: str, payload: dict[str, Any] = {}, headers: dict[str, Any] = {}) -> requests.Response:
+    def _presign(self, payload: dict[str, Any]) -> tuple[str, str, Signer]:
         """
-        It takes a method, endpoint, payload, and headers, and returns a response
+        It returns the raw and the encoded query strings of the static part of a payload and a signer that already hashed
+        the raw one, the default recvWindow is added to a copy of the payload as in _generate_query_string
+
+        :param payload: The fields sent unchanged with every request
+        """
+
+        payload = {**payload}
+        if self.__recv_window is not None and payload.get("recvWindow") is None:
+            payload["recvWindow"] = self.__recv_window
+        query_string, encoded = generate_query_strings(payload)
+        return query_string, encoded, self.__signer.extended(query_string)
+
+    def _prepare_request(self, method: str, payload: dict[str, Any], headers: dict[str, Any], timestamp: int | None = None, record: RequestRecord | None = None) -> tuple[str, dict[str, Any]]:
+        """
+        It validates the method and returns the signed query string and the headers of the request
 
         :param method: The HTTP method to use (GET, POST, PUT, DELETE)
-        :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
         :param payload: The data to be sent to the server
         :param headers: This is a dictionary of headers that will be sent with the request
+        :param timestamp: The timestamp of the request in milliseconds, the local time if not given
+        :param record: If given, the signing time and the query string size are added to it
+        """
+
+        if method not in ("GET", "POST", "PUT", "DELETE"):
+            raise InvalidMethodException(f"Invalid method used: {method}")
+
+        if record is None:
+            return self._generate_query_string(payload, timestamp), {**self.__headers, **headers}
+        started = time.perf_counter()
+        query_string = self._generate_query_string(payload, timestamp)
+        record.add("sign", time.perf_counter() - started)
+        record.request_bytes += len(query_string)
+        return query_string, {**self.__headers, **headers}
+
+    def _handle_response(self, req: Any, json_decoder: JSONDecoder, record: RequestRecord | None = None) -> Any:
+        """
+        It decodes the response body once and raises ServerError or ClientError if the exchange rejected the request,
+        otherwise it returns the decoded body, None if the body is not JSON
+
+        :param req: A requests or httpx response
+        :param json_decoder: The function decoding the response body
+        :param record: If given, the decoding time is added to it
         """
-        if headers:
-            self.__session.headers.update(headers)
-
-        url = f"{self.__BASE_URL}{endpoint}?{self._generate_query_string(payload)}"
-        match method:
-            case "GET":
-                req = self.__session.get(url)
-            case "POST":
-                req = self.__session.post(url)
-            case "PUT":
-                req = self.__session.put(url)
-            case "DELETE":
-                req = self.__session.delete(url)
-            case _:
-                raise InvalidMethodException(f"Invalid method used: {method}")
 
         if req.status_code != 200:
             raise ServerError(req.status_code, req.text)
 
         try:
-            req_json: dict[str, Any] = req.json()
-        except JSONDecodeError: # i.e. sometimes it return just int status code
-            return req
-        else:
-            if isinstance(req_json, dict):
-                if req_json.get("code") is not None and req_json.get("code") != 0:
-                    raise ClientError(req_json.get("code"), req_json.get("msg"))
-            return req
+            if record is None:
+                req_json = json_decoder(req.content)
+            else:
+                started = time.perf_counter()
+                try:
+                    req_json = json_decoder(req.content)
+                finally:
+                    record.add("decode", time.perf_counter() - started)
+        except ValueError: # i.e. sometimes it return just int status code
+            return None
+        if isinstance(req_json, dict):
+            if req_json.get("code") is not None and req_json.get("code") != 0:
+                raise ClientError(req_json.get("code"), req_json.get("msg"))
+        return req_json
+
+
+class _HTTPManager(_BaseHTTPManager):
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        super().__init__(api_key, secret_key, recv_window)
+        self.__transport = transport if transport is not None else Transport.default()
+
+    def _request(self, method: str, endpoint: str, payload: dict[str, Any] | None = None, headers: dict[str, Any] = {}) -> Any:
+        """
+        It takes a method, endpoint, payload, and headers, and returns the decoded response body
+
+        :param method: The HTTP method to use (GET, POST, PUT, DELETE)
+        :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
+        :param payload: The data to be sent to the server
+        :param headers: This is a dictionary of headers that will be sent with the request
+        """
+
+        payload = payload if payload is not None else {}
+        instruments = self.__transport.instruments
+        if not instruments:
+            return self.__send(method, endpoint, payload, headers)
 
-    def get(self, endpoint: str, payload: dict[str, Any] = {}, headers: dict[str, Any] = {}) -> requests.Response:
+        record = RequestRecord(method, endpoint)
+        for instrument in instruments:
+            instrument.before_request(record)
+        try:
+            return self.__send(method, endpoint, payload, headers, record)
+        except Exception as e:
+            record.error = e
+            raise
+        finally:
+            record.duration = time.perf_counter() - record.started
+            for instrument in instruments:
+                instrument.after_request(record)
+
+    def __send(self, method: str, endpoint: str, payload: dict[str, Any], headers: dict[str, Any], record: RequestRecord | None = None) -> Any:
+        policy = self.__transport.retry_policy
+        policy.budget.deposit()
+        attempt = 0
+        while True:
+            query_string, request_headers = self._prepare_request(method, payload, headers, self.__transport.timestamp(), record)
+            try:
+                req = self.__transport.request(method, endpoint, query_string, request_headers, record)
+                return self._handle_response(req, self.__transport.json_decoder, record)
+            except (NetworkError, ServerError, ClientError) as e:
+                if record is not None:
+                    record.error_codes.append(_error_code(e))
+                match policy.decide(method, endpoint, payload, e, attempt):
+                    case RetryAction.RETRY:
+                        time.sleep(policy.backoff(attempt))
+                        attempt += 1
+                        if record is not None:
+                            record.retries += 1
+                    case RetryAction.RECONCILE:
+                        status_endpoint, status_payload = policy.reconciliation_request(endpoint, payload)
+                        try:
+                            return self._request("GET", status_endpoint, status_payload)
+                        except ClientError as status_error:
+                            # the order was not placed, it is resent as any other retry: within the budget, after the backoff
+                            if status_error.error_code != policy.ORDER_NOT_FOUND_ERROR_CODE or attempt >= policy.max_retries or not policy.budget.withdraw():
+                                raise e from status_error
+                        time.sleep(policy.backoff(attempt))
+                        attempt += 1
+                        if record is not None:
+                            record.retries += 1
+                    case _:
+                        raise
+
+    def get(self, endpoint: str, payload: dict[str, Any] | None = None, headers: dict[str, Any] = {}) -> Any:
         """
         It makes a GET request to the given endpoint with the given payload and headers
 
         :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
         :param payload: The data to be sent to the server
         :param headers: This is a dictionary of headers that will be sent with the request
-        :return: A response object
+        :return: The decoded response body
         """
 
         return self._request("GET", endpoint, payload, headers)
 
-    def post(self, endpoint: str, payload: dict[str, Any] = {}, headers: dict[str, Any] = {}) -> requests.Response:
+    def post(self, endpoint: str, payload: dict[str, Any] | None = None, headers: dict[str, Any] = {}) -> Any:
         """
         It makes a POST request to the given endpoint with the given payload and headers
 
         :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
         :param payload: The data to be sent to the server
         :param headers: This is a dictionary of headers that will be sent with the request
-        :return: A response object
+        :return: The decoded response body
         """
 
         return self._request("POST", endpoint, payload, headers)
 
-    def put(self, endpoint: str, payload: dict[str, Any] = {}, headers: dict[str, Any] = {}) -> requests.Response:
+    def put(self, endpoint: str, payload: dict[str, Any] | None = None, headers: dict[str, Any] = {}) -> Any:
         """
         It makes a PUT request to the given endpoint with the given payload and headers
 
         :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
         :param payload: The data to be sent to the server
         :param headers: This is a dictionary of headers that will be sent with the request
-        :return: A response object
+        :return: The decoded response body
         """
 
         return self._request("PUT", endpoint, payload, headers)
 
-    def delete(self, endpoint: str, payload: dict[str, Any] = {}, headers: dict[str, Any] = {}) -> requests.Response:
+    def delete(self, endpoint: str, payload: dict[str, Any] | None = None, headers: dict[str, Any] = {}) -> Any:
         """
         It makes a DELETE request to the given endpoint with the given payload and headers
 
         :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
         :param payload: The data to be sent to the server
         :param headers: This is a dictionary of headers that will be sent with the request
-        :return: A response object
+        :return: The decoded response body
         """
 
         return self._request("DELETE", endpoint, payload, headers)
\ No newline at end of file
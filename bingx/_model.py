@@ -0,0 +1,135 @@
+from typing import Any, Iterable
+
+
+_UNSET = object()
+
+
+def _lookup(raw: Any, key: str | int) -> Any:
+    try:
+        return raw[key]
+    except (KeyError, IndexError):
+        return None
+
+
+def _to_float(value: Any) -> float | None:
+    return float(value) if value is not None and value != "" else None
+
+
+class Field:
+    """
+    A value of the response returned as it was decoded from JSON
+    """
+
+    __slots__ = ("key", "name")
+
+    def __init__(self, key: str | int) -> None:
+        """
+        :param key: The key of the value in the response, or its index if the response is a list
+        """
+
+        self.key = key
+        self.name = str(key)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: "Model | None", owner: type) -> Any:
+        if instance is None:
+            return self
+        return _lookup(instance.raw, self.key)
+
+
+class Number(Field):
+    """
+    A numeric value of the response, sent as a string by the exchange and returned as a float.
+    It is decoded on the first access and cached on the model.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, key: str | int) -> None:
+        super().__init__(key)
+        self.index = -1
+
+    @staticmethod
+    def decode(value: Any) -> Any:
+        return _to_float(value)
+
+    def __get__(self, instance: "Model | None", owner: type) -> Any:
+        if instance is None:
+            return self
+        values = instance._values
+        if values is None:
+            values = instance._values = [_UNSET] * len(instance._numbers)
+        value = values[self.index]
+        if value is _UNSET:
+            value = values[self.index] = self.decode(_lookup(instance.raw, self.key))
+        return value
+
+
+class Levels(Number):
+    """
+    A list of [price, quantity] levels of the response returned as a list of (price, quantity) float tuples
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def decode(value: Any) -> Any:
+        return [(float(price), float(quantity)) for price, quantity, *_ in value] if value else []
+
+
+class Model:
+    """
+    A read-only view of one response object with typed attributes.
+
+    The decoded JSON object stays available as `raw`, numbers are only parsed when they are read.
+    """
+
+    __slots__ = ("raw", "_values")
+
+    _fields: tuple[Field, ...] = ()
+    _numbers: tuple[Number, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        fields = [value for value in cls.__dict__.values() if isinstance(value, Field)]
+        numbers = list(cls._numbers)
+        for field in fields:
+            if isinstance(field, Number):
+                field.index = len(numbers)
+                numbers.append(field)
+        cls._fields = cls._fields + tuple(fields)
+        cls._numbers = tuple(numbers)
+
+    def __init__(self, raw: Any) -> None:
+        """
+        :param raw: The decoded JSON object, i.e. one element of the data returned by an endpoint method
+        """
+
+        self.raw = raw
+        self._values: list[Any] | None = None
+
+    @classmethod
+    def from_list(cls, raws: Iterable[Any]) -> list[Any]:
+        """
+        It returns a model for every object of a list returned by an endpoint method
+
+        :param raws: The decoded JSON objects
+        """
+
+        return [cls(raw) for raw in raws]
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        It returns every attribute of the model with its decoded value
+        """
+
+        return {field.name: getattr(self, field.name) for field in self._fields}
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and other.raw == self.raw
+
+    def __repr__(self) -> str:
+        attributes = ", ".join(f"{name}={value!r}" for name, value in self.to_dict().items())
+        return f"{type(self).__name__}({attributes})"
@@ -0,0 +1,2 @@
+from bingX.aio.main import AsyncBingX
+from bingX.aio.transport import AsyncTransport
@@ -0,0 +1,126 @@
+import asyncio
+import time
+from typing import Any
+
+from bingX._http_manager import _BaseHTTPManager
+from bingX.aio.transport import AsyncTransport
+from bingX.exceptions import ClientError, NetworkError, ServerError
+from bingX.instrumentation import RequestRecord, _error_code
+from bingX.retry import RetryAction
+
+
+class _AsyncHTTPManager(_BaseHTTPManager):
+    def __init__(self, api_key: str, secret_key: str, transport: AsyncTransport | None = None, recv_window: int | None = None) -> None:
+        super().__init__(api_key, secret_key, recv_window)
+        self.__transport = transport
+
+    async def _request(self, method: str, endpoint: str, payload: dict[str, Any] | None = None, headers: dict[str, Any] = {}) -> Any:
+        """
+        It takes a method, endpoint, payload, and headers, and returns the decoded response body
+
+        :param method: The HTTP method to use (GET, POST, PUT, DELETE)
+        :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
+        :param payload: The data to be sent to the server
+        :param headers: This is a dictionary of headers that will be sent with the request
+        """
+
+        payload = payload if payload is not None else {}
+        transport = self.__transport if self.__transport is not None else AsyncTransport.default()
+        await transport.start()
+        instruments = transport.instruments
+        if not instruments:
+            return await self.__send(transport, method, endpoint, payload, headers)
+
+        record = RequestRecord(method, endpoint)
+        for instrument in instruments:
+            instrument.before_request(record)
+        try:
+            return await self.__send(transport, method, endpoint, payload, headers, record)
+        except Exception as e:
+            record.error = e
+            raise
+        finally:
+            record.duration = time.perf_counter() - record.started
+            for instrument in instruments:
+                instrument.after_request(record)
+
+    async def __send(self, transport: AsyncTransport, method: str, endpoint: str, payload: dict[str, Any], headers: dict[str, Any], record: RequestRecord | None = None) -> Any:
+        policy = transport.retry_policy
+        policy.budget.deposit()
+        attempt = 0
+        while True:
+            query_string, request_headers = self._prepare_request(method, payload, headers, transport.timestamp(), record)
+            try:
+                req = await transport.request(method, endpoint, query_string, request_headers, record)
+                return self._handle_response(req, transport.json_decoder, record)
+            except (NetworkError, ServerError, ClientError) as e:
+                if record is not None:
+                    record.error_codes.append(_error_code(e))
+                match policy.decide(method, endpoint, payload, e, attempt):
+                    case RetryAction.RETRY:
+                        await asyncio.sleep(policy.backoff(attempt))
+                        attempt += 1
+                        if record is not None:
+                            record.retries += 1
+                    case RetryAction.RECONCILE:
+                        status_endpoint, status_payload = policy.reconciliation_request(endpoint, payload)
+                        try:
+                            return await self._request("GET", status_endpoint, status_payload)
+                        except ClientError as status_error:
+                            # the order was not placed, it is resent as any other retry: within the budget, after the backoff
+                            if status_error.error_code != policy.ORDER_NOT_FOUND_ERROR_CODE or attempt >= policy.max_retries or not policy.budget.withdraw():
+                                raise e from status_error
+                        await asyncio.sleep(policy.backoff(attempt))
+                        attempt += 1
+                        if record is not None:
+                            record.retries += 1
+                    case _:
+                        raise
+
+    async def get(self, endpoint: str, payload: dict[str, Any] | None = None, headers: dict[str, Any] = {}) -> Any:
+        """
+        It makes a GET request to the given endpoint with the given payload and headers
+
+        :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
+        :param payload: The data to be sent to the server
+        :param headers: This is a dictionary of headers that will be sent with the request
+        :return: The decoded response body
+        """
+
+        return await self._request("GET", endpoint, payload, headers)
+
+    async def post(self, endpoint: str, payload: dict[str, Any] | None = None, headers: dict[str, Any] = {}) -> Any:
+        """
+        It makes a POST request to the given endpoint with the given payload and headers
+
+        :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
+        :param payload: The data to be sent to the server
+        :param headers: This is a dictionary of headers that will be sent with the request
+        :return: The decoded response body
+        """
+
+        return await self._request("POST", endpoint, payload, headers)
+
+    async def put(self, endpoint: str, payload: dict[str, Any] | None = None, headers: dict[str, Any] = {}) -> Any:
+        """
+        It makes a PUT request to the given endpoint with the given payload and headers
+
+        :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
+        :param payload: The data to be sent to the server
+        :param headers: This is a dictionary of headers that will be sent with the request
+        :return: The decoded response body
+        """
+
+        return await self._request("PUT", endpoint, payload, headers)
+
+    async def delete(self, endpoint: str, payload: dict[str, Any] | None = None, headers: dict[str, Any] = {}) -> Any:
+        """
+        It makes a DELETE request to the given endpoint with the given payload and headers
+
+        :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
+        :param payload: The data to be sent to the server
+        :param headers: This is a dictionary of headers that will be sent with the request
+        :return: The decoded response body
+        """
+
+        return await self._request("DELETE", endpoint, payload, headers)
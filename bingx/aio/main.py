@@ -0,0 +1,27 @@
+from bingX.aio.perpetual.v2 import PerpetualV2
+from bingX.aio.spot import Spot
+from bingX.aio.standard import Standard
+from bingX.aio.transport import AsyncTransport
+
+
+class AsyncBingX:
+    def __init__(self, api_key: str, secret_key: str, transport: AsyncTransport | None = None, recv_window: int | None = None) -> None:
+        self.__owns_transport = transport is None
+        self.transport = transport if transport is not None else AsyncTransport()
+        self.perpetual_v2 = PerpetualV2(api_key, secret_key, self.transport, recv_window)
+        self.spot = Spot(api_key, secret_key, self.transport, recv_window)
+        self.standard = Standard(api_key, secret_key, self.transport, recv_window)
+
+    async def close(self) -> None:
+        """
+        It closes the connections of the transport created by this client, a transport passed in is left open
+        """
+
+        if self.__owns_transport:
+            await self.transport.close()
+
+    async def __aenter__(self) -> "AsyncBingX":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
@@ -0,0 +1 @@
+from .perpetual import PerpetualV2
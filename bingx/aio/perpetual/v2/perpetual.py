@@ -0,0 +1,13 @@
+from bingX.aio.perpetual.v2.account import Account
+from bingX.aio.perpetual.v2.market import Market
+from bingX.aio.perpetual.v2.other import Other
+from bingX.aio.perpetual.v2.trade import Trade
+from bingX.aio.transport import AsyncTransport
+
+
+class PerpetualV2:
+    def __init__(self, api_key: str, secret_key: str, transport: AsyncTransport | None = None, recv_window: int | None = None) -> None:
+        self.account = Account(api_key, secret_key, transport, recv_window)
+        self.market = Market(api_key, secret_key, transport, recv_window)
+        self.trade = Trade(api_key, secret_key, transport, recv_window)
+        self.other = Other(api_key, secret_key, transport, recv_window)
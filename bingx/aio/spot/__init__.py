@@ -0,0 +1 @@
+from bingX.aio.spot.spot import Spot
@@ -0,0 +1,11 @@
+from bingX.aio.spot.market import Market
+from bingX.aio.spot.trade import Trade
+from bingX.aio.spot.transfer import Transfer
+from bingX.aio.transport import AsyncTransport
+
+
+class Spot:
+    def __init__(self, api_key: str, secret_key: str, transport: AsyncTransport | None = None, recv_window: int | None = None) -> None:
+        self.trade = Trade(api_key, secret_key, transport, recv_window)
+        self.market = Market(api_key, secret_key, transport, recv_window)
+        self.transfer = Transfer(api_key, secret_key, transport, recv_window)
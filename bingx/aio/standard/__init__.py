@@ -0,0 +1 @@
+from bingX.aio.standard.standard import Standard
@@ -0,0 +1,44 @@
+from typing import Any
+
+from bingX.aio._http_manager import _AsyncHTTPManager
+from bingX.aio.transport import AsyncTransport
+from bingX.perpetual.v2.types import HistoryOrder
+
+
+class Standard:
+    def __init__(self, api_key: str, secret_key: str, transport: AsyncTransport | None = None, recv_window: int | None = None) -> None:
+        self.__http_manager = _AsyncHTTPManager(api_key, secret_key, transport, recv_window)
+
+    async def get_all_positions(self) -> list[dict[str, Any]]:
+        """
+
+        https://bingx-api.github.io/docs/standard/contract-interface.html#position
+        """
+
+        endpoint =  "/openApi/contract/v1/allPosition"
+
+        response = await self.__http_manager.get(endpoint)
+        return response["data"]
+
+    async def get_orders_history(self, order: HistoryOrder) -> list[dict[str, Any]]:
+        """
+
+        https://bingx-api.github.io/docs/standard/contract-interface.html#historical-order
+        """
+
+        endpoint =  "/openApi/contract/v1/allOrders"
+        payload = order.to_dict()
+
+        response = await self.__http_manager.get(endpoint, payload)
+        return response["data"]
+
+    async def get_account_details(self) -> list[dict[str, Any]]:
+        """
+
+        https://bingx-api.github.io/docs/standard/contract-interface.html#query-standard-contract-balance
+        """
+
+        endpoint = "/openApi/contract/v1/balance"
+
+        response = await self.__http_manager.get(endpoint)
+        return response["data"]
@@ -0,0 +1,138 @@
+import asyncio
+import time
+import weakref
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from bingX._helpers import JSONDecoder, generate_timestamp, get_json_decoder
+from bingX.exceptions import NetworkError
+from bingX.instrumentation import HTTPXTrace, Instrument, RequestRecord
+from bingX.rate_limiter import RateLimiter
+from bingX.retry import RetryPolicy
+from bingX.time_sync import TimeSync
+from bingX.transport import RATE_LIMITED_STATUS_CODES, Transport, retry_after
+
+
+class AsyncTransport:
+    """
+    A pooled, non-blocking HTTP transport shared by every sub-client of an AsyncBingX instance.
+
+    The underlying httpx.AsyncClient belongs to the event loop it is first used on. The time sync, if any,
+    is started by the first request, off the event loop.
+    """
+
+    BASE_URL = Transport.BASE_URL
+
+    _defaults: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncTransport]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, max_connections: int = 100, max_keepalive_connections: int = 20, keepalive_expiry: float = 30.0, base_url: str = BASE_URL, rate_limiter: RateLimiter | None = None, retry_policy: RetryPolicy | None = None, time_sync: TimeSync | None = None, json_decoder: JSONDecoder | None = None, http2: bool = False, client_factory: Callable[[], httpx.AsyncClient] | None = None, send_hook: Callable[[str, str, dict[str, Any]], Awaitable[Any]] | None = None, instruments: list[Instrument] | None = None) -> None:
+        """
+        :param max_connections: The maximum number of concurrent connections
+        :param max_keepalive_connections: The maximum number of idle connections kept alive
+        :param keepalive_expiry: The number of seconds an idle connection is kept alive
+        :param base_url: The url of the exchange api
+        :param rate_limiter: The rate limiter of every request sent through this transport, one with the default budgets if not given
+        :param retry_policy: The timeouts and retries of every request sent through this transport, the default policy if not given
+        :param time_sync: If given, requests are stamped with the exchange server time instead of the local time, it is started by the first request
+        :param json_decoder: The function decoding response bodies, the fastest installed JSON library if not given
+        :param http2: If True, concurrent requests are multiplexed over one HTTP/2 connection per host, requires pip install python-bingx[http2]
+        :param client_factory: A function returning the client requests are sent through, the pooled client if not given
+        :param send_hook: A coroutine function sending every request instead of the client, i.e. bingX.testing.MockExchange.async_send
+        :param instruments: The hooks called before and after every request, requests are not timed if not given
+        """
+
+        self.base_url = base_url
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.time_sync = time_sync
+        self.json_decoder = json_decoder if json_decoder is not None else get_json_decoder()
+        self.__time_sync_start: asyncio.Task[None] | None = None
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections, keepalive_expiry=keepalive_expiry)
+        # no pool timeout, requests queue for a free connection
+        timeout = httpx.Timeout(self.retry_policy.read_timeout, connect=self.retry_policy.connect_timeout, pool=None)
+        self.send_hook = send_hook
+        self.instruments = list(instruments) if instruments else []
+        if client_factory is not None:
+            self.client = client_factory()
+        else:
+            # plain http has no protocol negotiation, HTTP/2 is then spoken with prior knowledge
+            self.client = httpx.AsyncClient(limits=limits, timeout=timeout, http1=not (http2 and base_url.startswith("http://")), http2=http2)
+
+    @classmethod
+    def default(cls) -> "AsyncTransport":
+        """
+        It returns the transport shared by clients that were not given one, one per running event loop
+        """
+
+        loop = asyncio.get_running_loop()
+        transport = cls._defaults.get(loop)
+        if transport is None:
+            transport = cls._defaults[loop] = cls()
+        return transport
+
+    async def start(self) -> None:
+        """
+        It waits until the time sync, if any, has measured the offset once. Only the first call syncs, in a thread,
+        the calls made meanwhile wait for it
+        """
+
+        if self.time_sync is None:
+            return
+        if self.__time_sync_start is None:
+            self.__time_sync_start = asyncio.ensure_future(self.time_sync.start_async())
+        if not self.__time_sync_start.done():
+            await asyncio.shield(self.__time_sync_start)
+
+    def timestamp(self) -> int:
+        """
+        It returns the timestamp of a new request in milliseconds, corrected by the time sync if there is one
+        """
+
+        return self.time_sync.now() if self.time_sync is not None else generate_timestamp()
+
+    async def request(self, method: str, endpoint: str, query_string: str, headers: dict[str, Any] = {}, record: RequestRecord | None = None) -> Any:
+        """
+        It waits for the rate limiter and sends a request through the shared client
+
+        :param method: The HTTP method to use (GET, POST, PUT, DELETE)
+        :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
+        :param query_string: The signed query string of the request
+        :param headers: The headers of this request only
+        :param record: If given, the rate limiter wait, the network phases and the response size are added to it
+        """
+
+        waited = await self.rate_limiter.acquire_async(method, endpoint)
+        url = f"{self.base_url}{endpoint}?{query_string}"
+        if record is not None:
+            record.add("rate_limit", waited)
+            started = time.perf_counter()
+        try:
+            if self.send_hook is not None:
+                response = await self.send_hook(method, url, headers)
+            elif record is not None:
+                response = await self.client.request(method, url, headers=headers, extensions={"trace": HTTPXTrace(record).trace_async})
+            else:
+                response = await self.client.request(method, url, headers=headers)
+        except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+            raise NetworkError(str(e), request_sent=False) from e
+        except httpx.TransportError as e:
+            raise NetworkError(str(e), request_sent=True) from e
+        if record is not None:
+            record.add("send", time.perf_counter() - started)
+            record.status_code = response.status_code
+            record.response_bytes += len(response.content)
+        if response.status_code in RATE_LIMITED_STATUS_CODES:
+            self.rate_limiter.penalize(retry_after(response.headers, response.status_code))
+        return response
+
+    async def close(self) -> None:
+        """
+        It stops the time sync refresh and closes every pooled connection
+        """
+
+        if self.time_sync is not None:
+            if self.__time_sync_start is not None and not self.__time_sync_start.done():
+                self.__time_sync_start.cancel()
+            await asyncio.to_thread(self.time_sync.stop) # the refresh thread may be in the middle of a sync
+        await self.client.aclose()
@@ -0,0 +1,176 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from bingX.exceptions import OrderException, OrderValidationError
+from bingX.perpetual.v1.trade import Trade as PerpetualV1Trade
+from bingX.perpetual.v2.types import Order
+
+
+@dataclass
+class BulkOrderResult:
+    orders: list[dict[str, Any] | None]
+    errors: dict[int, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def placed(self) -> list[dict[str, Any]]:
+        return [order for order in self.orders if order is not None]
+
+
+class BulkOrderEngine:
+    """
+    It places any number of perpetual v2 orders by splitting them into batchOrders requests of the exchange's maximum size
+    and sending the batches concurrently. The transport's rate limiter paces them like any order request.
+
+    The result lists the exchange's answer for every order at the index of the order, and the error of every order
+    that was not placed, so a failed batch does not hide the batches that went through.
+    """
+
+    BATCH_SIZE = 5
+
+    def __init__(self, trade: Any, batch_size: int = BATCH_SIZE, max_workers: int = 8, validator: Any | None = None) -> None:
+        """
+        :param trade: A bingX.perpetual.v2.trade.Trade client
+        :param batch_size: The maximum number of orders of one batchOrders request
+        :param max_workers: The maximum number of batches sent at the same time
+        :param validator: An OrderValidator, if given every order is rounded and checked before it is sent
+        """
+
+        self.trade = trade
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.validator = validator
+
+    def place(self, orders: list[Order], recv_window: int | None = None) -> BulkOrderResult:
+        """
+        It places the orders and returns the result of every one of them
+
+        :param orders: The orders to place
+        :param recv_window: The number of milliseconds every request is valid for
+        """
+
+        result = BulkOrderResult(orders=[None] * len(orders))
+        indexes = list(range(len(orders)))
+        if self.validator is not None:
+            orders, indexes = self.__validate(orders, result)
+
+        batches = [(indexes[i:i + self.batch_size], orders[i:i + self.batch_size]) for i in range(0, len(orders), self.batch_size)]
+
+        def send(batch: tuple[list[int], list[Order]]) -> None:
+            batch_indexes, batch_orders = batch
+            try:
+                data = self.trade.bulk_create_order(batch_orders, recv_window)
+            except Exception as e:
+                result.errors.update((index, e) for index in batch_indexes)
+                return
+
+            placed = (data or {}).get("orders") or []
+            for position, index in enumerate(batch_indexes):
+                if position < len(placed) and placed[position]:
+                    result.orders[index] = placed[position]
+                else:
+                    result.errors[index] = OrderException(f"the exchange returned no order for {batch_orders[position].symbol}")
+
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+                list(executor.map(send, batches))
+        return result
+
+    def __validate(self, orders: list[Order], result: BulkOrderResult) -> tuple[list[Order], list[int]]:
+        try:
+            return self.validator.validate_batch(orders), list(range(len(orders)))
+        except OrderValidationError as e:
+            for index, reason in e.errors.items():
+                result.errors[index] = OrderValidationError(reason)
+            valid = [index for index in range(len(orders)) if index not in e.errors]
+            return self.validator.validate_batch([orders[index] for index in valid]), valid
+
+
+@dataclass
+class MassCancelResult:
+    results: dict[str, list[Any]] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+    latency: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class MassCanceller:
+    """
+    It cancels orders across many symbols at once, i.e. in a risk-off event.
+
+    Order ids are grouped into batch cancel requests of the maximum size and every request runs in parallel.
+    Cancellations are trade requests, which the rate limiter serves before market and account requests.
+    The latency of a symbol is the time from the call until its last request completed.
+    """
+
+    BATCH_SIZE = 10
+    ALL = "all"
+
+    def __init__(self, trade: Any, batch_size: int = BATCH_SIZE, max_workers: int = 32) -> None:
+        """
+        :param trade: A bingX.perpetual.v2.trade.Trade or a bingX.perpetual.v1.trade.Trade client
+        :param batch_size: The maximum number of order ids of one batch cancel request
+        :param max_workers: The maximum number of requests sent at the same time
+        """
+
+        self.trade = trade
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+
+    def cancel(self, orders: dict[str, list[int] | str]) -> MassCancelResult:
+        """
+        It cancels the given orders and returns the responses, errors and latency of every symbol
+
+        :param orders: The order ids to cancel by symbol, or "all" to cancel every open order of the symbol,
+            on perpetual v1 the pending orders of the symbol are listed and cancelled by id
+        """
+
+        is_v1 = isinstance(self.trade, PerpetualV1Trade)
+        # (symbol, a function sending the requests and returning their responses)
+        requests: list[tuple[str, Callable[[], list[Any]]]] = []
+        for symbol, order_ids in orders.items():
+            if order_ids == self.ALL:
+                if is_v1: # perpetual v1 only cancels every order of the account at once, the symbol's orders are listed instead
+                    requests.append((symbol, lambda symbol=symbol: self.__cancel_pending_v1(symbol)))
+                else:
+                    requests.append((symbol, lambda symbol=symbol: [self.trade.cancel_all_orders(symbol)]))
+                continue
+            for i in range(0, len(order_ids), self.batch_size):
+                batch = list(order_ids[i:i + self.batch_size])
+                requests.append((symbol, lambda symbol=symbol, batch=batch: [self.trade.cancel_batch_orders(batch, symbol)]))
+
+        result = MassCancelResult(results={symbol: [] for symbol in orders})
+        started = time.monotonic()
+        lock = threading.Lock()
+
+        def send(request: tuple[str, Callable[[], list[Any]]]) -> None:
+            symbol, cancel = request
+            try:
+                responses, error = cancel(), None
+            except Exception as e:
+                responses, error = [], e
+            elapsed = time.monotonic() - started
+            with lock:
+                if error is not None:
+                    result.errors.setdefault(symbol, error)
+                result.results[symbol].extend(responses)
+                result.latency[symbol] = max(result.latency.get(symbol, 0.0), elapsed)
+
+        if requests:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(requests))) as executor:
+                list(executor.map(send, requests))
+        return result
+
+    def __cancel_pending_v1(self, symbol: str) -> list[Any]:
+        pending = self.trade.get_unfilled_order_acquisition(symbol) or {}
+        order_ids = [order["orderId"] for order in pending.get("orders") or []]
+        return [self.trade.cancel_batch_orders(order_ids[i:i + self.batch_size], symbol) for i in range(0, len(order_ids), self.batch_size)]
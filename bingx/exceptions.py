@@ -13,6 +13,29 @@ class HistoryOrderException(Exception):
     pass
 
 
+class OrderValidationError(OrderException):
+    """Raised when an order breaks the price, quantity or notional filters of its symbol, errors maps the index of every invalid order of a batch to its reason"""
+
+    def __init__(self, error_message: str, errors: dict[int, str] | None = None) -> None:
+        self.error_message = error_message
+        self.errors = errors if errors is not None else {}
+        super().__init__(self.error_message)
+
+
+class OrderBookSequenceError(Exception):
+    """Raised when an order book misses an update and cannot be resynced"""
+    pass
+
+
+class NetworkError(Exception):
+    """Raised when a request fails before a response is received, request_sent tells if it may have reached the exchange"""
+
+    def __init__(self, error_message: str, request_sent: bool) -> None:
+        self.error_message = error_message
+        self.request_sent = request_sent
+        super().__init__(self.error_message)
+
+
 class ClientError(Exception):
     BUISNESS_ERROR_CODES = {
         100001: "signature verification failed",
@@ -0,0 +1,164 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from bingX.kline import KlineFrame
+
+MINUTE = 60 * 1000
+INTERVALS = {
+    "1m": MINUTE, "3m": 3 * MINUTE, "5m": 5 * MINUTE, "15m": 15 * MINUTE, "30m": 30 * MINUTE,
+    "1h": 60 * MINUTE, "2h": 120 * MINUTE, "4h": 240 * MINUTE, "6h": 360 * MINUTE, "8h": 480 * MINUTE, "12h": 720 * MINUTE,
+    "1d": 1440 * MINUTE, "3d": 3 * 1440 * MINUTE, "1w": 7 * 1440 * MINUTE, "1M": 31 * 1440 * MINUTE,
+}
+# months have no fixed length, their pages are split on 31 days and their gaps are not checked
+VARIABLE_INTERVALS = frozenset({"1M"})
+
+
+def open_time(row: Any) -> int:
+    """
+    It returns the open time of a perpetual v2 (dict) or spot (list) kline
+
+    :param row: The kline as returned by get_k_line_data
+    """
+
+    return int(row["time"] if isinstance(row, dict) else row[0])
+
+
+def find_gaps(open_times: list[int], interval_ms: int, start_time: int | None = None, end_time: int | None = None) -> list[tuple[int, int]]:
+    """
+    It returns the (first missing, last missing) open times of every gap in a sorted series.
+    Given the range [start_time, end_time) of the series, the missing head and tail are gaps too.
+
+    :param open_times: The sorted open times of the series
+    :param interval_ms: The interval of the series in milliseconds
+    :param start_time: The start of the range in milliseconds, only the gaps between open times are found if not given
+    :param end_time: The end of the range in milliseconds, exclusive
+    """
+
+    gaps = [(previous + interval_ms, current - interval_ms) for previous, current in zip(open_times, open_times[1:]) if current - previous > interval_ms]
+    if start_time is None or end_time is None:
+        return gaps
+    if not open_times: # nothing tells the phase of the candles, the range is assumed to start on one
+        return [(start_time, start_time + (end_time - 1 - start_time) // interval_ms * interval_ms)] if start_time < end_time else []
+
+    first, last = open_times[0], open_times[-1]
+    if first - interval_ms >= start_time:
+        gaps.insert(0, (first - (first - start_time) // interval_ms * interval_ms, first - interval_ms))
+    if last + interval_ms < end_time:
+        gaps.append((last + interval_ms, last + (end_time - 1 - last) // interval_ms * interval_ms))
+    return gaps
+
+
+@dataclass
+class KlineHistory:
+    symbol: str
+    interval: str
+    rows: list[Any]
+    gaps: list[tuple[int, int]] = field(default_factory=list)
+
+    @property
+    def is_contiguous(self) -> bool:
+        return not self.gaps
+
+    def to_frame(self) -> KlineFrame:
+        """
+        It returns the series as NumPy columns, requires numpy
+        """
+
+        if self.rows and isinstance(self.rows[0], dict):
+            return KlineFrame.from_perpetual_v2(self.rows)
+        return KlineFrame.from_spot(self.rows)
+
+
+class KlineDownloader:
+    """
+    It downloads a long kline history by splitting the time range into pages of the maximum size and fetching them concurrently.
+
+    Requests go through the market's transport, so its rate limiter paces the pages. Boundary candles returned by two pages
+    are kept once. With a checkpoint file every finished page is saved as it arrives, and an interrupted download that is
+    started again with the same file only fetches the missing pages.
+    """
+
+    PAGE_SIZE = 1440
+
+    def __init__(self, market: Any, max_workers: int = 8, page_size: int = PAGE_SIZE) -> None:
+        """
+        :param market: A bingX.perpetual.v2.market.Market or a bingX.spot.market.Market client
+        :param max_workers: The maximum number of pages fetched at the same time
+        :param page_size: The number of candles per request, maximum 1440
+        """
+
+        self.market = market
+        self.max_workers = max_workers
+        self.page_size = page_size
+
+    def pages(self, interval: str, start_time: int, end_time: int) -> list[tuple[int, int]]:
+        """
+        It returns the (start, end) times of the requests covering the range, both inclusive
+
+        :param interval: The interval of the klines
+        :param start_time: The start of the range in milliseconds
+        :param end_time: The end of the range in milliseconds, exclusive
+        """
+
+        if interval not in INTERVALS:
+            raise ValueError(f"Invalid interval {interval}, valid intervals are: {', '.join(INTERVALS)}")
+        span = INTERVALS[interval] * self.page_size
+        return [(start, min(start + span, end_time) - 1) for start in range(start_time, end_time, span)]
+
+    def download(self, symbol: str, interval: str, start_time: int, end_time: int, checkpoint: str | None = None) -> KlineHistory:
+        """
+        It returns every kline with an open time in [start_time, end_time), sorted and de-duplicated, along with the gaps found
+
+        :param symbol: The trading pair you want to get the Kline data for
+        :param interval: The interval of the klines, possible values: 1m, 3m, 5m, 15m, 30m, 1h, 2h, 4h, 6h, 8h, 12h, 1d, 3d, 1w, 1M
+        :param start_time: The start of the range in milliseconds
+        :param end_time: The end of the range in milliseconds, exclusive
+        :param checkpoint: The path of a file where finished pages are saved, to resume an interrupted download
+        """
+
+        pages = self.pages(interval, start_time, end_time)
+        done = self.__load_checkpoint(checkpoint, symbol, interval) if checkpoint is not None else {}
+        lock = threading.Lock()
+
+        def fetch(page: tuple[int, int]) -> None:
+            rows = self.market.get_k_line_data(symbol, interval, page[0], page[1], self.page_size)
+            rows = [rows] if isinstance(rows, dict) else rows or []
+            with lock:
+                done[page] = rows
+                if checkpoint is not None:
+                    with open(checkpoint, "a") as f:
+                        f.write(json.dumps({"symbol": symbol, "interval": interval, "start": page[0], "end": page[1], "rows": rows}) + "\n")
+
+        missing = [page for page in pages if page not in done]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                list(executor.map(fetch, missing))
+
+        unique: dict[int, Any] = {}
+        for page in pages:
+            for row in done[page]:
+                time = open_time(row)
+                if start_time <= time < end_time:
+                    unique[time] = row
+        open_times = sorted(unique)
+        gaps = [] if interval in VARIABLE_INTERVALS else find_gaps(open_times, INTERVALS[interval], start_time, end_time)
+        return KlineHistory(symbol, interval, [unique[time] for time in open_times], gaps)
+
+    @staticmethod
+    def __load_checkpoint(path: str, symbol: str, interval: str) -> dict[tuple[int, int], list[Any]]:
+        done: dict[tuple[int, int], list[Any]] = {}
+        if not os.path.exists(path):
+            return done
+        with open(path) as f:
+            for line in f:
+                try:
+                    page = json.loads(line)
+                except ValueError: # the last line of an interrupted write
+                    continue
+                if page["symbol"] == symbol and page["interval"] == interval:
+                    done[(page["start"], page["end"])] = page["rows"]
+        return done
@@ -0,0 +1,312 @@
+import bisect
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:
+    otel_metrics = None
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+RETRY_BUCKETS = (0, 1, 2, 3, 5, 10)
+# httpx trace events: phase
+_TRACE_PHASES = {"connect_tcp": "connect", "start_tls": "tls"}
+
+
+@dataclass
+class RequestRecord:
+    """
+    The timings and sizes of one request, from the first attempt to the decoded response.
+
+    Phases are in seconds and summed over attempts: sign, rate_limit (waiting for the rate limiter), connect and tls
+    (httpx transports only), ttfb (sending until the response headers), send (the whole exchange with the server)
+    and decode. Error codes are the ClientError code, the ServerError status or "network" of every failed attempt.
+    """
+
+    method: str
+    endpoint: str
+    started: float = field(default_factory=time.perf_counter)
+    duration: float = 0.0
+    status_code: int | None = None
+    retries: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    error_codes: list[str] = field(default_factory=list)
+    error: Exception | None = None
+    phases: dict[str, float] = field(default_factory=dict)
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+
+class Instrument:
+    """
+    The base of instrumentation hooks, every hook does nothing. Subclasses override the ones they need and are passed
+    to a transport with instruments=[...]. A transport without instruments does not time requests at all.
+
+    Hooks run on the thread (or the event loop) sending the request, so they should be quick.
+    """
+
+    def before_request(self, record: RequestRecord) -> None:
+        """
+        It is called before the first attempt of a request
+
+        :param record: The record of the request, only method, endpoint and started are set
+        """
+
+    def after_request(self, record: RequestRecord) -> None:
+        """
+        It is called once the request returned or raised
+
+        :param record: The complete record of the request
+        """
+
+
+def _error_code(error: Exception) -> str:
+    return str(getattr(error, "error_code", "network"))
+
+
+class HTTPXTrace:
+    """
+    An httpx "trace" extension recording the connect, tls and ttfb phases of a request into its record
+    """
+
+    __slots__ = ("record", "__started")
+
+    def __init__(self, record: RequestRecord) -> None:
+        self.record = record
+        self.__started: dict[str, float] = {}
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        name, _, state = event_name.rpartition(".")
+        step = name.rpartition(".")[2]
+        if state == "started":
+            self.__started[step] = time.perf_counter()
+        elif state == "complete":
+            if step in _TRACE_PHASES and step in self.__started:
+                self.record.add(_TRACE_PHASES[step], time.perf_counter() - self.__started[step])
+            elif step == "receive_response_headers" and "send_request_headers" in self.__started:
+                self.record.add("ttfb", time.perf_counter() - self.__started["send_request_headers"])
+
+    async def trace_async(self, event_name: str, info: dict[str, Any]) -> None:
+        self(event_name, info)
+
+
+class Histogram:
+    """
+    A thread-safe histogram with fixed upper bounds, values above the last bound fall in an overflow bucket
+    """
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """
+        :param bounds: The sorted upper bounds of the buckets
+        """
+
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.__lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        with self.__lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+            self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """
+        It returns an estimate of the q-quantile, interpolated inside its bucket
+
+        :param q: The quantile between 0 and 1, i.e. 0.99
+        """
+
+        with self.__lock:
+            counts, count, maximum = list(self.counts), self.count, self.max
+        if count == 0:
+            return 0.0
+
+        rank = q * count
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else maximum
+                return min(lower + (upper - lower) * (rank - seen) / bucket_count, maximum)
+            seen += bucket_count
+        return maximum
+
+    def summary(self) -> dict[str, float]:
+        """
+        It returns the count, mean, median, 90th and 99th percentiles and maximum
+        """
+
+        return {
+            "count": self.count, "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5), "p90": self.quantile(0.9), "p99": self.quantile(0.99), "max": self.max,
+        }
+
+
+class EndpointMetrics:
+    def __init__(self, latency_buckets: tuple[float, ...], size_buckets: tuple[float, ...]) -> None:
+        self.latency = Histogram(latency_buckets)
+        self.request_bytes = Histogram(size_buckets)
+        self.response_bytes = Histogram(size_buckets)
+        self.retries = Histogram(RETRY_BUCKETS)
+        self.phases: dict[str, Histogram] = {}
+        self.errors: Counter[str] = Counter()
+        self.__latency_buckets = latency_buckets
+        self.__lock = threading.Lock()
+
+    def observe(self, record: RequestRecord) -> None:
+        self.latency.observe(record.duration)
+        self.request_bytes.observe(record.request_bytes)
+        self.response_bytes.observe(record.response_bytes)
+        self.retries.observe(record.retries)
+        for phase, seconds in record.phases.items():
+            histogram = self.phases.get(phase)
+            if histogram is None:
+                with self.__lock:
+                    histogram = self.phases.setdefault(phase, Histogram(self.__latency_buckets))
+            histogram.observe(seconds)
+        if record.error_codes:
+            with self.__lock:
+                self.errors.update(record.error_codes)
+
+
+class MetricsRecorder(Instrument):
+    """
+    It keeps in-process histograms of the latency, phases, payload sizes and retries and counts the error codes
+    of every endpoint, keyed by "METHOD /endpoint".
+    """
+
+    def __init__(self, latency_buckets: tuple[float, ...] = LATENCY_BUCKETS, size_buckets: tuple[float, ...] = SIZE_BUCKETS) -> None:
+        """
+        :param latency_buckets: The upper bounds of the latency buckets in seconds
+        :param size_buckets: The upper bounds of the payload size buckets in bytes
+        """
+
+        self.latency_buckets = latency_buckets
+        self.size_buckets = size_buckets
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.__lock = threading.Lock()
+
+    def after_request(self, record: RequestRecord) -> None:
+        key = f"{record.method} {record.endpoint}"
+        metrics = self.endpoints.get(key)
+        if metrics is None:
+            with self.__lock:
+                metrics = self.endpoints.setdefault(key, EndpointMetrics(self.latency_buckets, self.size_buckets))
+        metrics.observe(record)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        It returns the summary of every endpoint: latency, phases, sizes and retries summaries and error counts
+        """
+
+        return {
+            key: {
+                "latency": metrics.latency.summary(),
+                "phases": {phase: histogram.summary() for phase, histogram in metrics.phases.items()},
+                "request_bytes": metrics.request_bytes.summary(),
+                "response_bytes": metrics.response_bytes.summary(),
+                "retries": metrics.retries.summary(),
+                "errors": dict(metrics.errors),
+            }
+            for key, metrics in list(self.endpoints.items())
+        }
+
+    def slowest(self, n: int = 10, q: float = 0.99) -> list[tuple[str, float]]:
+        """
+        It returns the n endpoints with the highest latency quantile
+
+        :param n: The number of endpoints to return
+        :param q: The latency quantile the endpoints are ranked by
+        """
+
+        latencies = [(key, metrics.latency.quantile(q)) for key, metrics in list(self.endpoints.items())]
+        return sorted(latencies, key=lambda item: item[1], reverse=True)[:n]
+
+
+class PrometheusExporter(Instrument):
+    """
+    It exports the latency, phases, payload sizes, retries and errors of every endpoint as Prometheus metrics,
+    requires pip install python-bingx[prometheus]
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "bingx", latency_buckets: tuple[float, ...] = LATENCY_BUCKETS, size_buckets: tuple[float, ...] = SIZE_BUCKETS) -> None:
+        """
+        :param registry: The prometheus_client registry of the metrics, the default registry if not given
+        :param namespace: The prefix of the metric names
+        :param latency_buckets: The upper bounds of the latency buckets in seconds
+        :param size_buckets: The upper bounds of the payload size buckets in bytes
+        """
+
+        if prometheus_client is None:
+            raise ImportError("PrometheusExporter requires prometheus_client, install it with: pip install python-bingx[prometheus]")
+        registry = registry if registry is not None else prometheus_client.REGISTRY
+        labels = ("method", "endpoint")
+        self.latency = prometheus_client.Histogram("request_duration_seconds", "Duration of BingX requests including retries", labels, namespace=namespace, buckets=latency_buckets, registry=registry)
+        self.phases = prometheus_client.Histogram("request_phase_seconds", "Duration of the phases of BingX requests", (*labels, "phase"), namespace=namespace, buckets=latency_buckets, registry=registry)
+        self.request_bytes = prometheus_client.Histogram("request_size_bytes", "Size of the query strings of BingX requests", labels, namespace=namespace, buckets=size_buckets, registry=registry)
+        self.response_bytes = prometheus_client.Histogram("response_size_bytes", "Size of the bodies of BingX responses", labels, namespace=namespace, buckets=size_buckets, registry=registry)
+        self.retries = prometheus_client.Counter("request_retries", "Retries of BingX requests", labels, namespace=namespace, registry=registry)
+        self.errors = prometheus_client.Counter("request_errors", "Failed attempts of BingX requests by error code", (*labels, "code"), namespace=namespace, registry=registry)
+
+    def after_request(self, record: RequestRecord) -> None:
+        labels = (record.method, record.endpoint)
+        self.latency.labels(*labels).observe(record.duration)
+        self.request_bytes.labels(*labels).observe(record.request_bytes)
+        self.response_bytes.labels(*labels).observe(record.response_bytes)
+        for phase, seconds in record.phases.items():
+            self.phases.labels(*labels, phase).observe(seconds)
+        if record.retries:
+            self.retries.labels(*labels).inc(record.retries)
+        for code in record.error_codes:
+            self.errors.labels(*labels, code).inc()
+
+
+class OpenTelemetryExporter(Instrument):
+    """
+    It records the latency, phases, payload sizes, retries and errors of every endpoint with OpenTelemetry instruments,
+    requires pip install python-bingx[opentelemetry]
+    """
+
+    def __init__(self, meter: Any = None) -> None:
+        """
+        :param meter: The meter creating the instruments, the "bingX" meter of the global meter provider if not given
+        """
+
+        if otel_metrics is None:
+            raise ImportError("OpenTelemetryExporter requires opentelemetry-api, install it with: pip install python-bingx[opentelemetry]")
+        meter = meter if meter is not None else otel_metrics.get_meter("bingX")
+        self.latency = meter.create_histogram("bingx.request.duration", unit="s", description="Duration of BingX requests including retries")
+        self.phases = meter.create_histogram("bingx.request.phase.duration", unit="s", description="Duration of the phases of BingX requests")
+        self.request_bytes = meter.create_histogram("bingx.request.size", unit="By", description="Size of the query strings of BingX requests")
+        self.response_bytes = meter.create_histogram("bingx.response.size", unit="By", description="Size of the bodies of BingX responses")
+        self.retries = meter.create_counter("bingx.request.retries", description="Retries of BingX requests")
+        self.errors = meter.create_counter("bingx.request.errors", description="Failed attempts of BingX requests by error code")
+
+    def after_request(self, record: RequestRecord) -> None:
+        attributes = {"http.request.method": record.method, "bingx.endpoint": record.endpoint}
+        self.latency.record(record.duration, attributes)
+        self.request_bytes.record(record.request_bytes, attributes)
+        self.response_bytes.record(record.response_bytes, attributes)
+        for phase, seconds in record.phases.items():
+            self.phases.record(seconds, {**attributes, "bingx.phase": phase})
+        if record.retries:
+            self.retries.add(record.retries, attributes)
+        for code in record.error_codes:
+            self.errors.add(1, {**attributes, "error.type": code})
@@ -0,0 +1,201 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from weakref import WeakKeyDictionary
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError
+from urllib3.util.connection import is_connection_dropped
+
+from bingX.exceptions import NetworkError
+
+
+@dataclass
+class ConnectionHealth:
+    """
+    The health of one pooled connection, as last seen by KeepWarm
+    """
+
+    connection: int
+    address: str = ""
+    opened_at: float | None = None
+    last_ping_at: float | None = None
+    round_trip_time: float | None = None
+    pings: int = 0
+    failures: int = 0
+    replaced: int = 0
+    healthy: bool = False
+
+
+class KeepWarm:
+    """
+    It keeps the connections of a transport open, so a request sent after an idle period, i.e. the first order
+    after a signal, does not pay DNS, TCP and TLS setup.
+
+    Every sweep checks out the idle connections of the pool, reopens the ones the server or a proxy dropped,
+    and sends a cheap request over each of the others, replacing the ones it fails on. Connections are opened
+    up to `connections` on start, and a daemon thread repeats the sweep every `interval` seconds.
+
+    Per-connection health is tracked for the default requests pool. Over HTTP/2 or a send hook, a sweep only
+    sends `connections` requests through the transport, as Transport.prewarm.
+    """
+
+    def __init__(self, connections: int = 4, interval: float = 15.0, timeout: float = 5.0) -> None:
+        """
+        :param connections: The number of connections kept open, capped at the pool_maxsize of the transport
+        :param interval: The number of seconds between sweeps, 0 to sweep only when sweep is called
+        :param timeout: The timeout of opening a connection and of each ping
+        """
+
+        self.connections = connections
+        self.interval = interval
+        self.timeout = timeout
+        self.replaced = 0
+        self.__transport: Any = None
+        self.__health: WeakKeyDictionary[Any, ConnectionHealth] = WeakKeyDictionary()
+        self.__ids = 0
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread: threading.Thread | None = None
+
+    def start(self, transport: Any) -> None:
+        """
+        It opens the connections of the transport and starts the sweeps in the background
+
+        :param transport: The Transport whose connections are kept open
+        """
+
+        self.__transport = transport
+        self.connections = min(self.connections, transport.pool_maxsize)
+        self.sweep()
+        if self.interval > 0 and self.__thread is None:
+            self.__stop.clear()
+            self.__thread = threading.Thread(target=self.__refresh, name="bingx-keep-warm", daemon=True)
+            self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        It stops the background sweeps
+        """
+
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def health(self) -> list[ConnectionHealth]:
+        """
+        It returns the health of every pooled connection seen by the sweeps, oldest first
+        """
+
+        with self.__lock:
+            return sorted(self.__health.values(), key=lambda health: health.connection)
+
+    def sweep(self) -> list[ConnectionHealth]:
+        """
+        It pings every idle connection concurrently, opens the missing ones, replaces the dead ones
+        and returns their health
+        """
+
+        transport = self.__transport
+        if transport is None:
+            raise RuntimeError("KeepWarm.start was not called")
+        pool = self.__pool(transport)
+        if pool is None:
+            transport.prewarm(self.connections)
+            return []
+
+        # the idle connections are checked out so that requests never get one while it is pinged,
+        # each one is put back as soon as its ping is done
+        checked_out = []
+        while len(checked_out) < self.connections:
+            try:
+                checked_out.append(pool.pool.get(block=False))
+            except (queue.Empty, AttributeError): # AttributeError: the pool was closed
+                break
+        if not checked_out:
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(checked_out)) as executor:
+            return list(executor.map(lambda conn: self.__ping(transport, pool, conn), checked_out))
+
+    def __pool(self, transport: Any) -> Any:
+        # the pool requests sends the transport's requests through, None if it does not use one
+        if transport.send_hook is not None or not isinstance(transport.session, requests.Session):
+            return None
+        url = f"{transport.base_url}{transport.PREWARM_ENDPOINT}"
+        adapter = transport.session.get_adapter(url)
+        if not isinstance(adapter, HTTPAdapter):
+            return None
+        if hasattr(adapter, "get_connection_with_tls_context"): # requests >= 2.32
+            return adapter.get_connection_with_tls_context(requests.Request("GET", url).prepare(), transport.session.verify, cert=transport.session.cert)
+        return adapter.get_connection(url)
+
+    def __ping(self, transport: Any, pool: Any, conn: Any) -> ConnectionHealth:
+        if conn is None: # a free slot of the pool, it gets a new connection
+            conn = pool._new_conn()
+        with self.__lock:
+            health = self.__health.get(conn)
+            if health is None:
+                self.__ids += 1
+                health = self.__health[conn] = ConnectionHealth(self.__ids)
+
+        try:
+            for attempt in range(2):
+                try:
+                    if conn.sock is None or is_connection_dropped(conn):
+                        self.__open(conn, health, replaced=conn.sock is not None or health.opened_at is not None)
+                    self.__request(transport, conn, health)
+                    break
+                except (OSError, HTTPError, NetworkError) as e:
+                    health.failures += 1
+                    health.healthy = False
+                    conn.close()
+                    if attempt == 1 or isinstance(e, NetworkError): # the exchange could not be reached, retry on the next sweep
+                        break
+        finally:
+            pool._put_conn(conn) # urllib3 reopens a closed connection on its next request
+        return health
+
+    def __open(self, conn: Any, health: ConnectionHealth, replaced: bool) -> None:
+        conn.close()
+        conn.timeout = self.timeout
+        try:
+            conn.connect()
+        except (OSError, HTTPError) as e:
+            raise NetworkError(str(e), request_sent=False) from e
+        if replaced:
+            health.replaced += 1
+            with self.__lock:
+                self.replaced += 1
+        health.opened_at = time.monotonic()
+        host, port = conn.sock.getsockname()[:2]
+        health.address = f"{host}:{port}"
+
+    def __request(self, transport: Any, conn: Any, health: ConnectionHealth) -> None:
+        transport.rate_limiter.acquire("GET", transport.PREWARM_ENDPOINT)
+        if not health.address: # connections opened by requests are first seen here
+            host, port = conn.sock.getsockname()[:2]
+            health.address = f"{host}:{port}"
+        conn.sock.settimeout(self.timeout)
+        started = time.perf_counter()
+        conn.request("GET", transport.PREWARM_ENDPOINT, headers={"Connection": "keep-alive"})
+        response = conn.getresponse()
+        response.read()
+        health.round_trip_time = time.perf_counter() - started
+        health.last_ping_at = time.monotonic()
+        health.pings += 1
+        if response.headers.get("Connection", "").lower() == "close": # the server closes it after this response
+            self.__open(conn, health, replaced=True)
+        health.healthy = True
+
+    def __refresh(self) -> None:
+        while not self.__stop.wait(self.interval):
+            try:
+                self.sweep()
+            except Exception: # a sweep is best effort, the next one may succeed
+                continue
@@ -0,0 +1,121 @@
+from itertools import chain
+from operator import itemgetter
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PERPETUAL_V2_COLUMNS = ("open", "high", "low", "close", "volume")
+PERPETUAL_V2_TIME = "time"
+SPOT_COLUMNS = (1, 2, 3, 4, 5)
+SPOT_TIME = 0
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("KlineFrame requires numpy, install it with: pip install python-bingx[numpy]")
+
+
+class KlineFrame:
+    """
+    Candles stored column by column: open time as int64 milliseconds and open, high, low, close and volume as float64 arrays.
+
+    It is built straight from the decoded kline payload without creating an object per candle.
+    Candles are sorted by open time, oldest first.
+    """
+
+    __slots__ = ("open_time", "open", "high", "low", "close", "volume")
+
+    def __init__(self, open_time: Any, open: Any, high: Any, low: Any, close: Any, volume: Any) -> None:
+        """
+        :param open_time: The open time of every candle in milliseconds
+        :param open: The open prices
+        :param high: The high prices
+        :param low: The low prices
+        :param close: The close prices
+        :param volume: The traded volumes
+        """
+
+        _require_numpy()
+        self.open_time = np.asarray(open_time, dtype=np.int64)
+        self.open = np.asarray(open, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.volume = np.asarray(volume, dtype=np.float64)
+
+    @classmethod
+    def _from_rows(cls, rows: list[Any], time_key: str | int, column_keys: tuple[str | int, ...]) -> "KlineFrame":
+        _require_numpy()
+        if isinstance(rows, dict):
+            rows = [rows]
+        size = len(rows)
+        open_time = np.fromiter(map(itemgetter(time_key), rows), dtype=np.int64, count=size)
+        # one flat pass, column after column, so every column is a contiguous row of the 2d array
+        values = chain.from_iterable(map(itemgetter(key), rows) for key in column_keys)
+        columns = np.fromiter(map(float, values), dtype=np.float64, count=size * len(column_keys)).reshape(len(column_keys), size)
+        if size > 1 and not np.all(open_time[1:] > open_time[:-1]):
+            order = np.argsort(open_time, kind="stable")
+            open_time, columns = open_time[order], columns.take(order, axis=1)
+        return cls(open_time, *columns)
+
+    @classmethod
+    def from_perpetual_v2(cls, rows: list[dict[str, Any]]) -> "KlineFrame":
+        """
+        It builds a frame from the data returned by bingX.perpetual.v2.market.Market.get_k_line_data
+
+        :param rows: The candles as dicts with time, open, high, low, close and volume
+        """
+
+        return cls._from_rows(rows, PERPETUAL_V2_TIME, PERPETUAL_V2_COLUMNS)
+
+    @classmethod
+    def from_spot(cls, rows: list[list[Any]]) -> "KlineFrame":
+        """
+        It builds a frame from the data returned by bingX.spot.market.Market.get_k_line_data
+
+        :param rows: The candles as [open time, open, high, low, close, volume, close time, quote volume] lists
+        """
+
+        return cls._from_rows(rows, SPOT_TIME, SPOT_COLUMNS)
+
+    @classmethod
+    def concat(cls, frames: list["KlineFrame"]) -> "KlineFrame":
+        """
+        It joins frames into one, sorted by open time
+
+        :param frames: The frames to join
+        """
+
+        _require_numpy()
+        if not frames:
+            return cls([], [], [], [], [], [])
+        open_time = np.concatenate([frame.open_time for frame in frames])
+        order = np.argsort(open_time, kind="stable")
+        return cls(open_time[order], *(np.concatenate([getattr(frame, name) for frame in frames])[order] for name in cls.__slots__[1:]))
+
+    def __len__(self) -> int:
+        return len(self.open_time)
+
+    def to_pandas(self) -> Any:
+        """
+        It returns the frame as a pandas DataFrame indexed by open time, requires pandas
+        """
+
+        import pandas as pd
+
+        return pd.DataFrame(
+            {name: getattr(self, name) for name in self.__slots__[1:]},
+            index=pd.to_datetime(self.open_time, unit="ms", utc=True).rename("open_time"),
+        )
+
+    def to_arrow(self) -> Any:
+        """
+        It returns the frame as a pyarrow Table, requires pyarrow
+        """
+
+        import pyarrow as pa
+
+        return pa.table({name: getattr(self, name) for name in self.__slots__})
@@ -0,0 +1,238 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Any, Callable, Iterable
+
+from bingX.exceptions import OrderBookSequenceError
+
+Levels = Iterable[Iterable[str | float]]
+
+
+class _BookSide:
+    """
+    The price levels of one side of the book, kept sorted from the best price outwards.
+
+    Prices are stored negated for bids, so both sides are ascending arrays and bisect works the same way.
+    Cumulative quantity and notional are rebuilt lazily, in O(n), on the first query after a change.
+    """
+
+    def __init__(self, is_bid: bool) -> None:
+        self.is_bid = is_bid
+        self.__sign = -1.0 if is_bid else 1.0
+        self.keys = array("d")
+        self.quantities = array("d")
+        self.__cumulative_quantity: list[float] | None = None
+        self.__cumulative_notional: list[float] | None = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def price(self, index: int) -> float:
+        return self.keys[index] * self.__sign
+
+    def clear(self) -> None:
+        self.keys = array("d")
+        self.quantities = array("d")
+        self.__invalidate()
+
+    def load(self, levels: Levels) -> None:
+        parsed = sorted((float(price) * self.__sign, float(quantity)) for price, quantity in levels)
+        self.keys = array("d", (key for key, quantity in parsed if quantity > 0))
+        self.quantities = array("d", (quantity for _, quantity in parsed if quantity > 0))
+        self.__invalidate()
+
+    def update(self, price: float, quantity: float) -> None:
+        key = price * self.__sign
+        index = bisect_left(self.keys, key)
+        exists = index < len(self.keys) and self.keys[index] == key
+        if quantity > 0:
+            if exists:
+                self.quantities[index] = quantity
+            else:
+                self.keys.insert(index, key)
+                self.quantities.insert(index, quantity)
+        elif exists:
+            del self.keys[index]
+            del self.quantities[index]
+        self.__invalidate()
+
+    def cumulative(self) -> tuple[list[float], list[float]]:
+        if self.__cumulative_quantity is None:
+            self.__cumulative_quantity = list(accumulate(self.quantities))
+            self.__cumulative_notional = list(accumulate(abs(key) * quantity for key, quantity in zip(self.keys, self.quantities)))
+        return self.__cumulative_quantity, self.__cumulative_notional
+
+    def depth_to(self, price: float) -> float:
+        index = bisect_right(self.keys, price * self.__sign)
+        return self.cumulative()[0][index - 1] if index > 0 else 0.0
+
+    def vwap(self, quantity: float) -> float:
+        if quantity <= 0:
+            raise ValueError(f"The quantity must be positive, got {quantity}")
+        cumulative_quantity, cumulative_notional = self.cumulative()
+        index = bisect_left(cumulative_quantity, quantity)
+        if index == len(cumulative_quantity):
+            raise ValueError(f"Not enough liquidity to fill {quantity}, the book holds {cumulative_quantity[-1] if cumulative_quantity else 0.0}")
+
+        filled_quantity = cumulative_quantity[index - 1] if index > 0 else 0.0
+        filled_notional = cumulative_notional[index - 1] if index > 0 else 0.0
+        return (filled_notional + (quantity - filled_quantity) * abs(self.keys[index])) / quantity
+
+    def __invalidate(self) -> None:
+        self.__cumulative_quantity = None
+        self.__cumulative_notional = None
+
+
+class OrderBook:
+    """
+    A local order book seeded from a REST depth snapshot and maintained from streamed depth updates.
+
+    Best bid/ask, mid and spread are O(1). Cumulative depth and VWAP bisect prefix sums in O(log n),
+    but the sums are rebuilt in O(n) by the first query after any update: queries are O(log n) only
+    amortised over the queries made between two updates.
+    """
+
+    def __init__(self, symbol: str, snapshot: Callable[[], dict[str, Any]] | None = None) -> None:
+        """
+        :param symbol: The symbol of the book
+        :param snapshot: A function returning a depth snapshot with "bids" and "asks", called to seed and to resync the book
+        """
+
+        self.symbol = symbol
+        self.bids = _BookSide(is_bid=True)
+        self.asks = _BookSide(is_bid=False)
+        self.last_update_id: int | None = None
+        self.__snapshot = snapshot
+
+        if snapshot is not None:
+            self.resync()
+
+    @classmethod
+    def from_perpetual_v2(cls, market: Any, symbol: str, limit: int = 1000) -> "OrderBook":
+        """
+        It creates a book seeded from bingX.perpetual.v2.market.Market.get_market_depth
+
+        :param market: A perpetual v2 Market client
+        :param symbol: The symbol of the book
+        :param limit: The number of price levels of the snapshot, optional value:[5, 10, 20, 50, 100, 500, 1000]
+        """
+
+        return cls(symbol, lambda: market.get_market_depth(symbol, limit))
+
+    @classmethod
+    def from_spot(cls, market: Any, symbol: str, limit: int = 100) -> "OrderBook":
+        """
+        It creates a book seeded from bingX.spot.market.Market.get_depth_details
+
+        :param market: A spot Market client
+        :param symbol: The symbol of the book
+        :param limit: The number of price levels of the snapshot, max 100
+        """
+
+        return cls(symbol, lambda: market.get_depth_details(symbol, limit))
+
+    def resync(self) -> None:
+        """
+        It reloads the whole book from a fresh snapshot
+        """
+
+        if self.__snapshot is None:
+            raise OrderBookSequenceError(f"{self.symbol} order book is out of sync and has no snapshot source")
+        self.load_snapshot(self.__snapshot())
+
+    def load_snapshot(self, snapshot: dict[str, Any]) -> None:
+        """
+        It replaces every level of the book, i.e. with a REST snapshot or a full depth stream event
+
+        :param snapshot: A depth snapshot with "bids" and "asks" lists of [price, quantity] and an optional "lastUpdateId"
+        """
+
+        self.bids.load(snapshot.get("bids") or [])
+        self.asks.load(snapshot.get("asks") or [])
+        self.last_update_id = snapshot.get("lastUpdateId")
+
+    def apply_update(self, bids: Levels = (), asks: Levels = (), first_update_id: int | None = None, last_update_id: int | None = None) -> bool:
+        """
+        It applies an incremental depth update, a quantity of 0 removes the level.
+        A gap in the update ids triggers a resync from a new snapshot.
+
+        :param bids: The changed bid levels as [price, quantity]
+        :param asks: The changed ask levels as [price, quantity]
+        :param first_update_id: The id of the first change in this update
+        :param last_update_id: The id of the last change in this update
+        :return: False if the update was stale and ignored or the book was resynced instead, True otherwise
+        """
+
+        if self.last_update_id is not None and last_update_id is not None:
+            if last_update_id <= self.last_update_id:
+                return False
+            if first_update_id is not None and first_update_id > self.last_update_id + 1:
+                self.resync()
+                return False
+
+        for price, quantity in bids:
+            self.bids.update(float(price), float(quantity))
+        for price, quantity in asks:
+            self.asks.update(float(price), float(quantity))
+
+        if last_update_id is not None:
+            self.last_update_id = last_update_id
+        return True
+
+    @property
+    def best_bid(self) -> tuple[float, float] | None:
+        return (self.bids.price(0), self.bids.quantities[0]) if len(self.bids) else None
+
+    @property
+    def best_ask(self) -> tuple[float, float] | None:
+        return (self.asks.price(0), self.asks.quantities[0]) if len(self.asks) else None
+
+    @property
+    def mid(self) -> float | None:
+        if not len(self.bids) or not len(self.asks):
+            return None
+        return (self.bids.price(0) + self.asks.price(0)) / 2
+
+    @property
+    def spread(self) -> float | None:
+        if not len(self.bids) or not len(self.asks):
+            return None
+        return self.asks.price(0) - self.bids.price(0)
+
+    def bid_depth(self, price: float) -> float:
+        """
+        It returns the total bid quantity at prices greater than or equal to the given price
+
+        :param price: The lowest price to include
+        """
+
+        return self.bids.depth_to(price)
+
+    def ask_depth(self, price: float) -> float:
+        """
+        It returns the total ask quantity at prices lower than or equal to the given price
+
+        :param price: The highest price to include
+        """
+
+        return self.asks.depth_to(price)
+
+    def buy_vwap(self, quantity: float) -> float:
+        """
+        It returns the average price of a market buy of the given quantity, walking the asks.
+        It raises ValueError if the quantity is not positive or exceeds the asks of the book.
+
+        :param quantity: The quantity to buy
+        """
+
+        return self.asks.vwap(quantity)
+
+    def sell_vwap(self, quantity: float) -> float:
+        """
+        It returns the average price of a market sell of the given quantity, walking the bids.
+        It raises ValueError if the quantity is not positive or exceeds the bids of the book.
+
+        :param quantity: The quantity to sell
+        """
+
+        return self.bids.vwap(quantity)
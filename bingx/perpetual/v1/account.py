@@ -1,11 +1,12 @@
 from typing import Any
 
 from bingX._http_manager import _HTTPManager
+from bingX.transport import Transport
 
 
 class Account:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.__http_manager = _HTTPManager(api_key, secret_key)
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.__http_manager = _HTTPManager(api_key, secret_key, transport, recv_window)
 
     def get_details(self, currency: str) -> dict[str, Any]:
         """
@@ -18,7 +19,7 @@ class Account:
         payload = {"currency": currency.upper()}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_swap_positions(self, symbol: str) -> dict[str, Any]:
         """
@@ -31,4 +32,4 @@ class Account:
         payload = {"symbol": symbol.upper()}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
\ No newline at end of file
+        return response["data"]
\ No newline at end of file
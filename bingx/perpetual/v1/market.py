@@ -1,11 +1,12 @@
 from typing import Any
 
 from bingX._http_manager import _HTTPManager
+from bingX.transport import Transport
 
 
 class Market:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.__http_manager = _HTTPManager(api_key, secret_key)
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.__http_manager = _HTTPManager(api_key, secret_key, transport, recv_window)
 
     def get_contract_info(self) -> list[dict[str, Any]]:
         """
@@ -17,7 +18,7 @@ class Market:
         endpoint =  "/api/v1/market/getAllContracts"
 
         response = self.__http_manager.get(endpoint)
-        return response.json()["data"]
+        return response["data"]
 
     def get_latest_price_of_trading_pair(self, symbol: str) -> dict[str, Any]:
         """
@@ -33,7 +34,7 @@ class Market:
         payload = {"symbol": symbol.upper()}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_market_depth(self, symbol: str, level: int = 5) -> dict[str, Any]:
         """
@@ -50,7 +51,7 @@ class Market:
         payload = {"symbol": symbol.upper(), "level": level}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_latest_trade_of_trading_pair(self, symbol: str) -> dict[str, Any]:
         """
@@ -66,7 +67,7 @@ class Market:
         payload = {"symbol": symbol.upper()}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_current_funding_rate(self, symbol: str) -> dict[str, Any]:
         """
@@ -81,7 +82,7 @@ class Market:
         payload = {"symbol": symbol.upper()}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_funding_rate_history(self, symbol: str) -> dict[str, Any]:
         """
@@ -96,7 +97,7 @@ class Market:
         payload = {"symbol": symbol.upper()}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_k_line_data(self, symbol: str, kline_type: str) -> dict[str, Any]:
         """
@@ -112,7 +113,7 @@ class Market:
         payload = {"symbol": symbol.upper(), "klineType": kline_type}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_k_line_data_history(self, symbol: str, kline_type: str, start_time: int, end_time: int) -> dict[str, Any]:
         """
@@ -130,7 +131,7 @@ class Market:
         payload = {"symbol": symbol.upper(), "klineType": kline_type, "startTime": start_time, "endTime": end_time}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_swap_open_positions(self, symbol: str) -> dict[str, Any]:
         """
@@ -145,7 +146,7 @@ class Market:
         payload = {"symbol": symbol.upper()}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_ticker(self, symbol: str | None = None) -> dict[str, Any] :
         """
@@ -161,4 +162,4 @@ class Market:
         payload = {} if symbol is None else {"symbol": symbol.upper()}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
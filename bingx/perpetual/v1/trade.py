@@ -2,11 +2,12 @@ from typing import Any
 
 from bingX._http_manager import _HTTPManager
 from bingX.perpetual.v1.types import MarginType, Order, PositionSide
+from bingX.transport import Transport
 
 
 class Trade:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.__http_manager = _HTTPManager(api_key, secret_key)
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.__http_manager = _HTTPManager(api_key, secret_key, transport, recv_window)
 
     def create_order(self, order: Order) -> dict[str, Any]:
         """
@@ -19,7 +20,7 @@ class Trade:
         payload = order.to_dict()
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def one_click_close_position(self, symbol: str, position_id: int) -> dict[str, Any]:
         """
@@ -32,7 +33,7 @@ class Trade:
         payload = {"symbol": symbol.upper(), "positionId": position_id}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def one_click_close_all_position(self, symbol: str, position_id: int) -> dict[str, Any]:
         """
@@ -44,7 +45,7 @@ class Trade:
         endpoint = "/api/v1/user/oneClickCloseAllPositions"
 
         response = self.__http_manager.post(endpoint)
-        return response.json()["data"]
+        return response["data"]
 
     def cancel_order(self, order_id: int, symbol: str) -> dict[str, Any]:
         """
@@ -57,7 +58,7 @@ class Trade:
         payload = {"orderId": order_id, "symbol": symbol.upper()}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def cancel_batch_orders(self, order_ids: list[int], symbol: str) -> dict[str, Any]:
         """
@@ -70,7 +71,7 @@ class Trade:
         payload = {"symbol": symbol.upper(), "oids": order_ids}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def cancel_all_orders(self) -> dict[str, Any]:
         """
@@ -82,7 +83,7 @@ class Trade:
         endpoint = "/api/v1/user/cancelAll"
 
         response = self.__http_manager.post(endpoint)
-        return response.json()["data"]
+        return response["data"]
 
     def get_unfilled_order_acquisition(self, symbol: str) -> dict[str, Any]:
         """
@@ -95,7 +96,7 @@ class Trade:
         payload = {"symbol": symbol.upper()}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_order(self, order_id: int, symbol: str) -> dict[str, Any]:
         """
@@ -108,7 +109,7 @@ class Trade:
         payload = {"symbol": symbol.upper(), "orderId": order_id}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_margin_mode(self, symbol: str) -> dict[str, Any]:
         """
@@ -121,7 +122,7 @@ class Trade:
         payload = {"symbol": symbol.upper()}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def change_margin_mode(self, symbol: str, margin_type: MarginType) -> dict[str, Any]:
         """
@@ -134,7 +135,7 @@ class Trade:
         payload = {"symbol": symbol, "marginMode": margin_type.value}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_leverage(self, symbol: str) -> dict[str, Any]:
         """
@@ -147,7 +148,7 @@ class Trade:
         payload = {"symbol": symbol.upper()}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def change_leverage(self, symbol: str, position_side: PositionSide, leverage: int, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -160,7 +161,7 @@ class Trade:
         payload = {"symbol": symbol.upper(), "side": position_side.value, "leverage": leverage}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_force_orders(self, symbol: str, auto_close_type, last_order_id: int, length: int) -> dict[str, Any]:
         """
@@ -173,7 +174,7 @@ class Trade:
         payload = {"symbol": symbol.upper(), "autoCloseType": auto_close_type, "lastOrderId": last_order_id, "length": length}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_orders_history(self, last_order_id: int, length: int, symbol: str | None = None) -> dict[str, Any]:
         """
@@ -187,7 +188,7 @@ class Trade:
         payload = {"lastOrderId": last_order_id, "length": length} if symbol is None else {"symbol": symbol, "lastOrderId": last_order_id, "length": length}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def place_stop_order(self, position_id: str, entrust_volume: float, order_id: str | None = None, stop_loss_price: float | None = None, take_profit_price: float | None = None) -> dict[str, Any]:
         """
@@ -199,7 +200,7 @@ class Trade:
         payload = {"positionId": position_id, "entrustVolume": entrust_volume, "orderId": order_id, "stopLossPrice": stop_loss_price, "takeProfitPrice": take_profit_price}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def cancel_stop_order(self, order_id: str) -> dict[str, Any]:
         """
@@ -211,7 +212,7 @@ class Trade:
         payload = {"orderId": order_id}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_stop_orders(self, symbol: str) -> dict[str, Any]:
         """
@@ -223,7 +224,7 @@ class Trade:
         payload = {"symbol": symbol.upper()}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_history_stop_orders(self, symbol: str, last_order_id: int, lenght: int) -> dict[str, Any]:
         """
@@ -235,4 +236,4 @@ class Trade:
         payload = {"symbol": symbol.upper(), "lastOrderId": last_order_id, "length": lenght}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
\ No newline at end of file
+        return response["data"]
\ No newline at end of file
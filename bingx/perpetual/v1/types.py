@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from bingX._helpers import DictMixin
@@ -41,7 +41,7 @@ class Order(DictMixin):
     side: Side
     entrust_price: float
     entrust_volume: float
-    type: OrderType
+    type: OrderType = field(metadata={"name": "tradeType"})
     action: Action
     taker_profit_price: float | None = None
     stop_loss_price: float | None = None
@@ -2,11 +2,12 @@ from typing import Any
 
 from bingX._http_manager import _HTTPManager
 from bingX.perpetual.v2.types import ProfitLossFundFlow
+from bingX.transport import Transport
 
 
 class Account:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.__http_manager = _HTTPManager(api_key, secret_key)
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.__http_manager = _HTTPManager(api_key, secret_key, transport, recv_window)
 
     def get_details(self, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -19,7 +20,7 @@ class Account:
         payload = {} if recvWindow is None else {"recvWindow": recvWindow}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_swap_positions(self, symbol: str | None = None, recvWindow: int | None = None) -> list[dict[str, Any]]:
         """
@@ -35,7 +36,7 @@ class Account:
             payload = {"symbol": symbol.upper()} if recvWindow is None else {"symbol": symbol.upper(), "recvWindow": recvWindow}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_profit_loss_fund_flow(self, profit_loss_fund_flow: ProfitLossFundFlow) -> list[dict[str, Any]]:
         """
@@ -50,4 +51,4 @@ class Account:
         payload = profit_loss_fund_flow.to_dict()
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
@@ -1,11 +1,13 @@
 from typing import Any
 
 from bingX._http_manager import _HTTPManager
+from bingX.kline import KlineFrame
+from bingX.transport import Transport
 
 
 class Market:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.__http_manager = _HTTPManager(api_key, secret_key)
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.__http_manager = _HTTPManager(api_key, secret_key, transport, recv_window)
 
     def get_contract_info(self) -> list[dict[str, Any]]:
         """
@@ -17,7 +19,7 @@ class Market:
         endpoint =  "/openApi/swap/v2/quote/contracts"
 
         response = self.__http_manager.get(endpoint)
-        return response.json()["data"]
+        return response["data"]
 
     def get_latest_price_of_trading_pair(self, symbol: str | None = None) -> list[dict[str, Any]] | dict[str, Any]:
         """
@@ -33,7 +35,7 @@ class Market:
         payload = {} if symbol is None else {"symbol": symbol.upper()}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_market_depth(self, symbol: str, limit: int = 20) -> dict[str, Any]:
         """
@@ -50,7 +52,7 @@ class Market:
         payload = {"symbol": symbol.upper(), "limit": limit}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_latest_trade_of_trading_pair(self, symbol: str, limit: int = 500) -> list[dict[str, Any]]:
         """
@@ -67,7 +69,7 @@ class Market:
         payload = {"symbol": symbol.upper(), "limit": limit}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_current_funding_rate(self, symbol: str | None = None) -> list[dict[str, Any]] | dict[str, Any]:
         """
@@ -82,7 +84,7 @@ class Market:
         payload = {} if symbol is None else {"symbol": symbol.upper()}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_funding_rate_history(self, symbol: str, start_time: int | None = None, end_time: int | None = None, limit: int = 100) -> list[dict[str, Any]]:
         """
@@ -102,7 +104,7 @@ class Market:
         payload = {"symbol": symbol.upper(), "limit": limit} if start_time is None or end_time is None else {"symbol": symbol.upper(), "startTime": start_time, "endTime": end_time, "limit": limit}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_k_line_data(self, symbol: str, interval: str, start_time: int | None = None, end_time: int | None = None, limit: int = 500) -> list[dict[str, Any]] | dict[str, Any]:
         """
@@ -122,7 +124,20 @@ class Market:
         payload = {"symbol": symbol.upper(), "interval": interval, "limit": limit} if start_time is None or end_time is None else {"symbol": symbol.upper(), "interval": interval, "startTime": start_time, "endTime": end_time, "limit": limit}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
+
+    def get_k_line_frame(self, symbol: str, interval: str, start_time: int | None = None, end_time: int | None = None, limit: int = 500) -> KlineFrame:
+        """
+        It returns the Kline data as NumPy columns instead of one object per candle, requires numpy
+
+        :param symbol: The trading pair you want to get the Kline data for
+        :param interval: The interval of the Kline data, possible values: 1m, 3m, 5m, 15m, 30m, 1h, 2h, 4h, 6h, 8h, 12h, 1d, 1w, 1M
+        :param start_time: The start time of the Kline data, in milliseconds
+        :param end_time: The end time of the Kline data, in milliseconds
+        :param limit: The number of Kline data to return, maximum 1440
+        """
+
+        return KlineFrame.from_perpetual_v2(self.get_k_line_data(symbol, interval, start_time, end_time, limit))
 
     def get_swap_open_positions(self, symbol: str) -> dict[str, Any]:
         """
@@ -137,7 +152,7 @@ class Market:
         payload = {"symbol": symbol.upper()}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_ticker(self, symbol: str | None = None) -> list[dict[str, Any]] | dict[str, Any] :
         """
@@ -153,4 +168,4 @@ class Market:
         payload = {} if symbol is None else {"symbol": symbol.upper()}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
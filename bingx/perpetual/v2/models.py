@@ -0,0 +1,126 @@
+from bingX._model import Field, Levels, Model, Number
+
+
+class Ticker(Model):
+    """
+    A 24 hour ticker returned by Market.get_ticker
+    """
+
+    __slots__ = ()
+
+    symbol = Field("symbol")
+    price_change = Number("priceChange")
+    price_change_percent = Number("priceChangePercent")
+    last_price = Number("lastPrice")
+    last_quantity = Number("lastQty")
+    high_price = Number("highPrice")
+    low_price = Number("lowPrice")
+    volume = Number("volume")
+    quote_volume = Number("quoteVolume")
+    open_price = Number("openPrice")
+    open_time = Field("openTime")
+    close_time = Field("closeTime")
+
+
+class Depth(Model):
+    """
+    An order book snapshot returned by Market.get_market_depth
+    """
+
+    __slots__ = ()
+
+    time = Field("T")
+    bids = Levels("bids")
+    asks = Levels("asks")
+
+
+class Trade(Model):
+    """
+    A trade returned by Market.get_latest_trade_of_trading_pair
+    """
+
+    __slots__ = ()
+
+    time = Field("time")
+    is_buyer_maker = Field("isBuyerMaker")
+    price = Number("price")
+    quantity = Number("qty")
+    quote_quantity = Number("quoteQty")
+
+
+class Kline(Model):
+    """
+    A candlestick returned by Market.get_k_line_data
+    """
+
+    __slots__ = ()
+
+    time = Field("time")
+    open = Number("open")
+    high = Number("high")
+    low = Number("low")
+    close = Number("close")
+    volume = Number("volume")
+
+
+class Position(Model):
+    """
+    A position returned by Account.get_swap_positions
+    """
+
+    __slots__ = ()
+
+    symbol = Field("symbol")
+    position_id = Field("positionId")
+    position_side = Field("positionSide")
+    isolated = Field("isolated")
+    leverage = Field("leverage")
+    position_amount = Number("positionAmt")
+    available_amount = Number("availableAmt")
+    average_price = Number("avgPrice")
+    initial_margin = Number("initialMargin")
+    unrealized_profit = Number("unrealizedProfit")
+    realised_profit = Number("realisedProfit")
+
+
+class Order(Model):
+    """
+    An order returned by the "order" and "orders" keys of the Trade methods
+    """
+
+    __slots__ = ()
+
+    symbol = Field("symbol")
+    order_id = Field("orderId")
+    client_order_id = Field("clientOrderId")
+    side = Field("side")
+    position_side = Field("positionSide")
+    type = Field("type")
+    status = Field("status")
+    time = Field("time")
+    update_time = Field("updateTime")
+    price = Number("price")
+    stop_price = Number("stopPrice")
+    quantity = Number("origQty")
+    executed_quantity = Number("executedQty")
+    average_price = Number("avgPrice")
+    cumulative_quote = Number("cumQuote")
+    profit = Number("profit")
+    commission = Number("commission")
+
+
+class Balance(Model):
+    """
+    The balance returned by the "balance" key of Account.get_details
+    """
+
+    __slots__ = ()
+
+    asset = Field("asset")
+    balance = Number("balance")
+    equity = Number("equity")
+    unrealized_profit = Number("unrealizedProfit")
+    realised_profit = Number("realisedProfit")
+    available_margin = Number("availableMargin")
+    used_margin = Number("usedMargin")
+    freezed_margin = Number("freezedMargin")
@@ -2,11 +2,12 @@ from bingX.perpetual.v2.account import Account
 from bingX.perpetual.v2.market import Market
 from bingX.perpetual.v2.other import Other
 from bingX.perpetual.v2.trade import Trade
+from bingX.transport import Transport
 
 
 class PerpetualV2:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.account = Account(api_key, secret_key)
-        self.market = Market(api_key, secret_key)
-        self.trade = Trade(api_key, secret_key)
-        self.other = Other(api_key, secret_key)
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.account = Account(api_key, secret_key, transport, recv_window)
+        self.market = Market(api_key, secret_key, transport, recv_window)
+        self.trade = Trade(api_key, secret_key, transport, recv_window)
+        self.other = Other(api_key, secret_key, transport, recv_window)
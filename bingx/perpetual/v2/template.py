@@ -0,0 +1,65 @@
+from typing import Any
+from urllib.parse import quote
+
+from bingX._helpers import _SAFE_VALUE_BYTES, PresignedPayload
+from bingX.perpetual.v2.types import Order
+
+
+class OrderTemplate:
+    """
+    An order sent over and over with a fixed symbol, side, position side and type, i.e. by a market making loop.
+    The prototype order is validated once and its static fields are encoded and hashed into the signature once,
+    every submission only formats the patched price, quantity, stop price and client order id and the timestamp.
+
+    template = client.perpetual_v2.trade.order_template(Order(symbol="BTC-USDT", side=Side.BUY, positionSide=PositionSide.LONG, type=OrderType.LIMIT, quantity=0.01, price=64000.0))
+    client.perpetual_v2.trade.create_order_from_template(template, price=64010.5)
+    """
+
+    PATCHED_FIELDS = ("price", "quantity", "stopPrice", "clientOrderID")
+
+    def __init__(self, order: Order, http_manager: Any) -> None:
+        """
+        :param order: The prototype order, its patched fields are the defaults of every submission
+        :param http_manager: The http manager of the client the orders are sent with, its secret key signs the template
+        """
+
+        self.order = order
+        payload = order.to_dict()
+        self.__defaults = {key: payload.pop(key, None) for key in self.PATCHED_FIELDS}
+        self.__static = payload
+        self.__prefix, self.__encoded_prefix, self.__signer = http_manager._presign(payload)
+
+    def payload(self, price: float | None = None, quantity: float | None = None, stop_price: float | None = None, client_order_id: str | None = None) -> PresignedPayload:
+        """
+        It returns the payload of one submission, the fields not given are the ones of the prototype order
+
+        :param price: The price of the order
+        :param quantity: The quantity of the order
+        :param stop_price: The trigger price of the order
+        :param client_order_id: The client order id of the order, give a new one to every submission
+        """
+
+        defaults = self.__defaults
+        patched = {
+            "price": defaults["price"] if price is None else price,
+            "quantity": defaults["quantity"] if quantity is None else quantity,
+            "stopPrice": defaults["stopPrice"] if stop_price is None else stop_price,
+            "clientOrderID": defaults["clientOrderID"] if client_order_id is None else client_order_id,
+        }
+        suffix, encoded_suffix = [], []
+        for k, v in patched.items(): # the patched fields are numbers and strings only
+            if v:
+                value = str(v)
+                suffix.append(f"&{k}={value}")
+                # every value is checked on its own, a client order id holding "&" or "=" would add parameters
+                encoded_suffix.append(f"&{k}={value if not value.encode().translate(None, _SAFE_VALUE_BYTES) else quote(value, safe='')}")
+        payload = PresignedPayload(self.__static)
+        payload.update(patched)
+        payload.prefix = self.__encoded_prefix
+        payload.signer = self.__signer
+        payload.suffix = "".join(suffix)
+        payload.encoded_suffix = "".join(encoded_suffix)
+        return payload
+
+    def __repr__(self) -> str:
+        return f"OrderTemplate({self.__prefix})"
@@ -8,11 +8,13 @@ from bingX.perpetual.v2.types import (
     Order,
     PositionSide,
 )
+from bingX.perpetual.v2.template import OrderTemplate
+from bingX.transport import Transport
 
 
 class Trade:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.__http_manager = _HTTPManager(api_key, secret_key)
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.__http_manager = _HTTPManager(api_key, secret_key, transport, recv_window)
 
     def create_order(self, order: Order) -> dict[str, Any]:
         """
@@ -30,7 +32,37 @@ class Trade:
         payload = order.to_dict()
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
+
+    def order_template(self, order: Order) -> OrderTemplate:
+        """
+        It returns a template of the order whose static fields are validated, encoded and signed once,
+        see create_order_from_template
+
+        :param order: The prototype order, its price, quantity, stop price and client order id can be patched
+        """
+
+        return OrderTemplate(order, self.__http_manager)
+
+    def create_order_from_template(self, template: OrderTemplate, price: float | None = None, quantity: float | None = None, stop_price: float | None = None, client_order_id: str | None = None) -> dict[str, Any]:
+        """
+        It places the order of a template patched with the given fields, as create_order without building,
+        validating and serialising an Order
+
+        :param template: A template returned by order_template
+        :param price: The price of the order, the one of the prototype order if not given
+        :param quantity: The quantity of the order, the one of the prototype order if not given
+        :param stop_price: The trigger price of the order, the one of the prototype order if not given
+        :param client_order_id: The client order id of the order, the one of the prototype order if not given
+
+        https://bingx-api.github.io/docs/swapV2/trade-api.html#_1-trade-order
+        """
+
+        endpoint = "/openApi/swap/v2/trade/order"
+        payload = template.payload(price, quantity, stop_price, client_order_id)
+
+        response = self.__http_manager.post(endpoint, payload)
+        return response["data"]
 
     def close_order(self, order: Order) -> dict[str, Any]:
         """
@@ -45,7 +77,7 @@ class Trade:
         payload = order.to_dict()
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def bulk_create_order(self, orders: list[Order], recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -58,7 +90,7 @@ class Trade:
         payload = {"batchOrders": [order.to_dict() for order in orders]} if recvWindow is None else {"batchOrders": [order.to_dict() for order in orders], "recvWindow": recvWindow}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def close_all_positions(self, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -71,7 +103,7 @@ class Trade:
         payload = {} if recvWindow is None else {"recvWindow": recvWindow}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def cancel_order(self, order_id: int, symbol: str, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -84,7 +116,7 @@ class Trade:
         payload = {"orderId": order_id, "symbol": symbol} if recvWindow is None else {"orderId": order_id, "symbol": symbol, "recvWindow": recvWindow}
 
         response = self.__http_manager.delete(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def cancel_batch_orders(self, order_ids: list[int], symbol: str, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -97,7 +129,7 @@ class Trade:
         payload = {"orderIdList": order_ids, "symbol": symbol} if recvWindow is None else {"orderIdList": order_ids, "symbol": symbol, "recvWindow": recvWindow}
 
         response = self.__http_manager.delete(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def cancel_all_orders(self, symbol: str, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -110,7 +142,7 @@ class Trade:
         payload = {"symbol": symbol} if recvWindow is None else {"symbol": symbol, "recvWindow": recvWindow}
 
         response = self.__http_manager.delete(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_open_orders(self, symbol: str | None = None, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -126,7 +158,7 @@ class Trade:
             payload = {"symbol": symbol} if recvWindow is None else {"symbol": symbol, "recvWindow": recvWindow}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_order(self, order_id: int, symbol: str, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -139,7 +171,7 @@ class Trade:
         payload = {"symbol": symbol, "orderId": order_id} if recvWindow is None else {"symbol": symbol, "orderId": order_id, "recvWindow": recvWindow}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_margin_mode(self, symbol: str, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -152,7 +184,7 @@ class Trade:
         payload = {"symbol": symbol} if recvWindow is None else {"symbol": symbol, "recvWindow": recvWindow}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def change_margin_mode(self, symbol: str, margin_type: MarginType, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -165,7 +197,7 @@ class Trade:
         payload = {"symbol": symbol, "marginType": margin_type.value} if recvWindow is None else {"symbol": symbol, "marginType": margin_type.value, "recvWindow": recvWindow}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_leverage(self, symbol: str, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -178,7 +210,7 @@ class Trade:
         payload = {"symbol": symbol} if recvWindow is None else {"symbol": symbol, "recvWindow": recvWindow}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def change_leverage(self, symbol: str, position_side: PositionSide, leverage: int, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -191,7 +223,7 @@ class Trade:
         payload = {"symbol": symbol, "side": position_side.value, "leverage": leverage} if recvWindow is None else {"symbol": symbol, "side": position_side.value, "leverage": leverage, "recvWindow": recvWindow}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_force_orders(self, force_order: ForceOrder) -> dict[str, Any]:
         """
@@ -205,7 +237,7 @@ class Trade:
         payload = force_order.to_dict()
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_orders_history(self, history_order: HistoryOrder) -> dict[str, Any]:
         """
@@ -219,7 +251,7 @@ class Trade:
         payload = history_order.to_dict()
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def change_isolated_margin(self, symbol: str, amount: float, type: int, position_side: PositionSide = PositionSide.LONG, recvWindow: int | None = None) -> dict[str, Any]:
         """
@@ -238,4 +270,4 @@ class Trade:
         payload = {"symbol": symbol, "amount": amount, "type": type, "positionSide": position_side.value} if recvWindow is None else {"symbol": symbol, "amount": amount, "type": type, "positionSide": position_side.value, "recvWindow": recvWindow}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()
+        return response
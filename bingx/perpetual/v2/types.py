@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
@@ -40,6 +40,7 @@ class Order(DictMixin):
     price: float | None = None
     stop_price: float | None = None
     recv_window: int | None = None
+    client_order_id: str | None = field(default=None, metadata={"name": "clientOrderID"})
 
     def __post_init__(self):
         if self.type == OrderType.LIMIT:
@@ -0,0 +1,178 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    A token bucket refilled continuously at `rate` tokens per second up to `capacity` tokens
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        :param rate: The number of tokens added per second
+        :param capacity: The maximum number of tokens, i.e. the largest burst
+        """
+
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.__updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.__updated) * self.rate)
+        self.__updated = now
+
+    def wait_time(self, cost: float = 1.0, reserve: float = 0.0) -> float:
+        """
+        It returns the number of seconds until `cost` tokens can be taken without going below `reserve` tokens
+
+        :param cost: The number of tokens needed
+        :param reserve: The number of tokens that must stay in the bucket
+        """
+
+        missing = cost + reserve - self.tokens
+        return missing / self.rate if missing > 0 else 0.0
+
+    def consume(self, cost: float = 1.0) -> None:
+        self.tokens -= cost
+
+
+class RateLimiter:
+    """
+    A client-side rate limiter shared by every request sent through a transport.
+
+    Each request takes a token from the bucket of its endpoint group (market, trade or account) and one from the
+    shared IP bucket. Requests wait for tokens instead of failing. Priority groups (trade by default) may use
+    the last `reserve` share of the IP bucket, and other requests yield to them while they are waiting.
+    """
+
+    MARKET = "market"
+    TRADE = "trade"
+    ACCOUNT = "account"
+
+    DEFAULT_GROUPS = {
+        MARKET: (10.0, 100.0),
+        TRADE: (10.0, 10.0),
+        ACCOUNT: (5.0, 10.0),
+    }
+    V1_TRADE_ENDPOINTS = frozenset({
+        "/api/v1/user/trade",
+        "/api/v1/user/oneClickClosePosition",
+        "/api/v1/user/oneClickCloseAllPositions",
+        "/api/v1/user/cancelOrder",
+        "/api/v1/user/batchCancelOrders",
+        "/api/v1/user/cancelAll",
+        "/api/v1/user/stopOrder",
+        "/api/v1/user/cancelStopOrder",
+    })
+
+    def __init__(self, groups: dict[str, tuple[float, float]] = DEFAULT_GROUPS, ip_limit: tuple[float, float] = (60.0, 600.0), reserve: float = 0.2, priority_groups: tuple[str, ...] = (TRADE,)) -> None:
+        """
+        :param groups: The (rate per second, burst) budget of each endpoint group
+        :param ip_limit: The (rate per second, burst) budget shared by every group
+        :param reserve: The share of the IP budget that only priority groups may use
+        :param priority_groups: The groups served first, order placement and cancellation by default
+        """
+
+        self.buckets = {group: TokenBucket(rate, capacity) for group, (rate, capacity) in groups.items()}
+        self.ip_bucket = TokenBucket(*ip_limit)
+        self.__reserve = ip_limit[1] * reserve
+        self.__priority_groups = frozenset(priority_groups)
+        self.__lock = threading.Lock()
+        self.__priority_waiting = 0
+        self.__blocked_until = 0.0
+
+    def classify(self, method: str, endpoint: str) -> str:
+        """
+        It returns the endpoint group of a request
+
+        :param method: The HTTP method of the request
+        :param endpoint: The endpoint of the request i.e. /openApi/swap/v2/trade/order
+        """
+
+        if "/quote/" in endpoint or "/market/" in endpoint or "/common/" in endpoint or "/server/" in endpoint:
+            return self.MARKET
+        if ("/trade/" in endpoint and method != "GET") or endpoint in self.V1_TRADE_ENDPOINTS:
+            return self.TRADE
+        return self.ACCOUNT
+
+    def penalize(self, seconds: float) -> None:
+        """
+        It holds every request for the given number of seconds, i.e. after a 429 or a 418 response
+
+        :param seconds: The number of seconds to wait
+        """
+
+        with self.__lock:
+            self.__blocked_until = max(self.__blocked_until, time.monotonic() + seconds)
+
+    def acquire(self, method: str, endpoint: str) -> float:
+        """
+        It blocks the calling thread until the request may be sent
+
+        :param method: The HTTP method of the request
+        :param endpoint: The endpoint of the request i.e. /openApi/swap/v2/trade/order
+        :return: The number of seconds waited
+        """
+
+        group = self.classify(method, endpoint)
+        started = time.monotonic()
+        waiting = False
+        try:
+            while (delay := self.__try_acquire(group, waiting)) > 0:
+                waiting = True
+                time.sleep(delay)
+        finally:
+            if waiting and group in self.__priority_groups:
+                with self.__lock:
+                    self.__priority_waiting -= 1
+        return time.monotonic() - started
+
+    async def acquire_async(self, method: str, endpoint: str) -> float:
+        """
+        It waits, without blocking the event loop, until the request may be sent
+
+        :param method: The HTTP method of the request
+        :param endpoint: The endpoint of the request i.e. /openApi/swap/v2/trade/order
+        :return: The number of seconds waited
+        """
+
+        group = self.classify(method, endpoint)
+        started = time.monotonic()
+        waiting = False
+        try:
+            while (delay := self.__try_acquire(group, waiting)) > 0:
+                waiting = True
+                await asyncio.sleep(delay)
+        finally:
+            if waiting and group in self.__priority_groups:
+                with self.__lock:
+                    self.__priority_waiting -= 1
+        return time.monotonic() - started
+
+    def __try_acquire(self, group: str, waiting: bool) -> float:
+        is_priority = group in self.__priority_groups
+        bucket = self.buckets.get(group)
+        with self.__lock:
+            now = time.monotonic()
+            delay = self.__blocked_until - now
+            if delay <= 0:
+                if not is_priority and self.__priority_waiting > 0:
+                    delay = 1 / self.ip_bucket.rate
+                else:
+                    self.ip_bucket.refill(now)
+                    delay = self.ip_bucket.wait_time(reserve=0.0 if is_priority else self.__reserve)
+                    if bucket is not None:
+                        bucket.refill(now)
+                        delay = max(delay, bucket.wait_time())
+
+            if delay <= 0:
+                self.ip_bucket.consume()
+                if bucket is not None:
+                    bucket.consume()
+                return 0.0
+
+            if is_priority and not waiting:
+                self.__priority_waiting += 1
+            return delay
@@ -0,0 +1,158 @@
+import threading
+import time
+from typing import Any, Callable
+
+
+def _records(data: Any) -> list[dict[str, Any]]:
+    """
+    It returns the list of records of a reference data response, i.e. {"symbols": [...]} for spot or a plain list for perpetual v2
+    """
+
+    if isinstance(data, dict):
+        for key in ("symbols", "contracts"):
+            if isinstance(data.get(key), list):
+                return data[key]
+        return [data]
+    return list(data or [])
+
+
+class ReferenceDataCache:
+    """
+    An in-memory cache of rarely changing symbol metadata (tick size, step size, minimum quantity...) indexed by symbol.
+
+    Lookups never wait for the exchange while the data is younger than `max_age`. After `ttl` seconds the cached data
+    is still served and a single background refresh replaces it ("stale-while-revalidate"). Only the first lookup,
+    and lookups after `max_age` seconds without a successful refresh, wait for the request, which concurrent
+    lookups share. A failed background refresh is retried after `retry_delay` seconds, doubled after every failure.
+    """
+
+    def __init__(self, fetch: Callable[[], Any], ttl: float = 300.0, max_age: float = 3600.0, key: str = "symbol", retry_delay: float = 5.0) -> None:
+        """
+        :param fetch: A function returning the reference data, i.e. bingX.perpetual.v2.market.Market.get_contract_info
+        :param ttl: The number of seconds after which the data is refreshed in the background
+        :param max_age: The number of seconds after which stale data is not served anymore and lookups wait for a refresh
+        :param key: The field of every record that it is indexed by
+        :param retry_delay: The number of seconds before retrying a failed background refresh, doubled up to ttl after every failure
+        """
+
+        self.ttl = ttl
+        self.max_age = max_age
+        self.__fetch = fetch
+        self.__key = key
+        self.__by_key: dict[str, dict[str, Any]] = {}
+        self.__updated: float | None = None
+        self.__lock = threading.Lock()
+        self.__load_lock = threading.Lock()
+        self.__refreshing = False
+        self.__retry_delay = retry_delay
+        self.__failures = 0
+        self.__retry_at = 0.0
+
+    @classmethod
+    def from_perpetual_v2(cls, market: Any, ttl: float = 300.0, max_age: float = 3600.0) -> "ReferenceDataCache":
+        """
+        It creates a cache of bingX.perpetual.v2.market.Market.get_contract_info
+
+        :param market: A perpetual v2 Market client
+        :param ttl: The number of seconds after which the data is refreshed in the background
+        :param max_age: The number of seconds after which stale data is not served anymore
+        """
+
+        return cls(market.get_contract_info, ttl, max_age)
+
+    @classmethod
+    def from_perpetual_v1(cls, market: Any, ttl: float = 300.0, max_age: float = 3600.0) -> "ReferenceDataCache":
+        """
+        It creates a cache of bingX.perpetual.v1.market.Market.get_contract_info
+
+        :param market: A perpetual v1 Market client
+        :param ttl: The number of seconds after which the data is refreshed in the background
+        :param max_age: The number of seconds after which stale data is not served anymore
+        """
+
+        return cls(market.get_contract_info, ttl, max_age)
+
+    @classmethod
+    def from_spot(cls, market: Any, ttl: float = 300.0, max_age: float = 3600.0) -> "ReferenceDataCache":
+        """
+        It creates a cache of bingX.spot.market.Market.get_symbols
+
+        :param market: A spot Market client
+        :param ttl: The number of seconds after which the data is refreshed in the background
+        :param max_age: The number of seconds after which stale data is not served anymore
+        """
+
+        return cls(market.get_symbols, ttl, max_age)
+
+    @property
+    def age(self) -> float | None:
+        """
+        It returns the number of seconds since the last successful refresh, None before the first one
+        """
+
+        return time.monotonic() - self.__updated if self.__updated is not None else None
+
+    def refresh(self) -> None:
+        """
+        It fetches the reference data and replaces the cached records
+        """
+
+        records = _records(self.__fetch())
+        by_key = {record[self.__key]: record for record in records if self.__key in record}
+        with self.__lock:
+            self.__by_key = by_key
+            self.__updated = time.monotonic()
+
+    def get(self, symbol: str) -> dict[str, Any] | None:
+        """
+        It returns the record of a symbol, None if the exchange does not list it
+
+        :param symbol: The symbol to look up i.e. BTC-USDT
+        """
+
+        return self.__current().get(symbol)
+
+    def __getitem__(self, symbol: str) -> dict[str, Any]:
+        record = self.get(symbol)
+        if record is None:
+            raise KeyError(symbol)
+        return record
+
+    def __contains__(self, symbol: str) -> bool:
+        return self.get(symbol) is not None
+
+    def all(self) -> dict[str, dict[str, Any]]:
+        """
+        It returns every record by symbol
+        """
+
+        return self.__current()
+
+    def __current(self) -> dict[str, dict[str, Any]]:
+        age = self.age
+        if age is None or age > self.max_age:
+            with self.__load_lock: # a single request for every waiting lookup
+                age = self.age
+                if age is None or age > self.max_age:
+                    self.refresh()
+        elif age > self.ttl:
+            self.__refresh_in_background()
+        return self.__by_key
+
+    def __refresh_in_background(self) -> None:
+        with self.__lock:
+            if self.__refreshing or time.monotonic() < self.__retry_at:
+                return
+            self.__refreshing = True
+
+        def refresh() -> None:
+            try:
+                self.refresh()
+                self.__failures = 0
+            except Exception: # the stale data is kept until max_age, a lookup after the backoff tries again
+                self.__retry_at = time.monotonic() + min(self.__retry_delay * 2 ** self.__failures, max(self.ttl, self.__retry_delay))
+                self.__failures += 1
+            finally:
+                self.__refreshing = False
+
+        threading.Thread(target=refresh, name="bingx-reference-refresh", daemon=True).start()
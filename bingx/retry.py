@@ -0,0 +1,167 @@
+import random
+import threading
+import time
+from enum import Enum
+from typing import Any
+
+from bingX.exceptions import ClientError, NetworkError, ServerError
+
+
+class RetryAction(Enum):
+    RAISE = "RAISE"
+    RETRY = "RETRY"
+    RECONCILE = "RECONCILE"
+
+
+class RetryBudget:
+    """
+    It caps retries to a share of the recent requests, so an outage does not multiply the load on the exchange.
+
+    Every request deposits `ratio` tokens and every retry withdraws one. `min_per_second` tokens are added
+    each second, so a quiet client can still retry.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 100.0) -> None:
+        """
+        :param ratio: The number of retries allowed per request sent
+        :param min_per_second: The number of retries allowed per second regardless of the traffic
+        :param max_tokens: The maximum number of retries that can be saved up
+        """
+
+        self.__ratio = ratio
+        self.__min_per_second = min_per_second
+        self.__max_tokens = max_tokens
+        self.__tokens = max_tokens
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self.__lock:
+            self.__tokens = min(self.__max_tokens, self.__tokens + self.__ratio)
+
+    def withdraw(self) -> bool:
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.__max_tokens, self.__tokens + (now - self.__updated) * self.__min_per_second)
+            self.__updated = now
+            if self.__tokens < 1:
+                return False
+            self.__tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Timeouts, jittered exponential backoff and idempotency-aware retries of a transport.
+
+    GET, PUT and DELETE requests are retried automatically. POST requests that create orders or move funds are
+    retried only when they carry a client order id, and a 504 on them triggers a lookup of the order status
+    by that id instead of a blind resend.
+    """
+
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    RETRYABLE_ERROR_CODES = frozenset({100500, 100503, 80012})
+    UNKNOWN_STATUS_CODE = 504
+    ORDER_NOT_FOUND_ERROR_CODE = 80016
+    NON_IDEMPOTENT_ENDPOINTS = frozenset({
+        "/openApi/swap/v2/trade/order",
+        "/openApi/swap/v2/trade/batchOrders",
+        "/openApi/swap/v2/trade/closeAllPositions",
+        "/openApi/swap/v2/trade/positionMargin",
+        "/openApi/spot/v1/trade/order",
+        "/openApi/api/v3/asset/transfer",
+        "/api/v1/user/trade",
+        "/api/v1/user/oneClickClosePosition",
+        "/api/v1/user/oneClickCloseAllPositions",
+        "/api/v1/user/stopOrder",
+    })
+    CLIENT_ORDER_ID_KEYS = ("clientOrderID", "clientOrderId", "newClientOrderId")
+    # create endpoint: (order status endpoint, client order id parameter of the status endpoint)
+    RECONCILIATION_ENDPOINTS = {
+        "/openApi/swap/v2/trade/order": ("/openApi/swap/v2/trade/order", "clientOrderId"),
+        "/openApi/spot/v1/trade/order": ("/openApi/spot/v1/trade/query", "clientOrderID"),
+    }
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.1, backoff_max: float = 5.0, connect_timeout: float = 3.05, read_timeout: float = 10.0, budget: RetryBudget | None = None) -> None:
+        """
+        :param max_retries: The maximum number of retries of one request, 0 to disable retries
+        :param backoff_base: The backoff before the first retry in seconds, doubled for every next retry
+        :param backoff_max: The maximum backoff in seconds
+        :param connect_timeout: The number of seconds to wait for a connection
+        :param read_timeout: The number of seconds to wait for the response
+        :param budget: The retry budget shared by every request of the transport
+        """
+
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        It returns a random delay between 0 and the exponential backoff of the attempt ("full jitter")
+
+        :param attempt: The number of retries done so far
+        """
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def client_order_id(self, payload: dict[str, Any]) -> str | None:
+        return next((payload[key] for key in self.CLIENT_ORDER_ID_KEYS if payload.get(key)), None)
+
+    def is_idempotent(self, method: str, endpoint: str, payload: dict[str, Any]) -> bool:
+        """
+        It returns True if sending the request twice has the same effect as sending it once
+
+        :param method: The HTTP method of the request
+        :param endpoint: The endpoint of the request i.e. /openApi/swap/v2/trade/order
+        :param payload: The payload of the request
+        """
+
+        if method != "POST" or endpoint not in self.NON_IDEMPOTENT_ENDPOINTS:
+            return True
+        return self.client_order_id(payload) is not None
+
+    def decide(self, method: str, endpoint: str, payload: dict[str, Any], error: Exception, attempt: int) -> RetryAction:
+        """
+        It decides what to do after a failed attempt
+
+        :param method: The HTTP method of the request
+        :param endpoint: The endpoint of the request i.e. /openApi/swap/v2/trade/order
+        :param payload: The payload of the request
+        :param error: The error raised by the attempt
+        :param attempt: The number of retries done so far
+        """
+
+        is_order = method == "POST" and endpoint in self.NON_IDEMPOTENT_ENDPOINTS
+        if isinstance(error, ServerError) and error.error_code == self.UNKNOWN_STATUS_CODE and is_order:
+            if self.client_order_id(payload) is not None and endpoint in self.RECONCILIATION_ENDPOINTS:
+                return RetryAction.RECONCILE
+            return RetryAction.RAISE
+
+        if isinstance(error, NetworkError):
+            retryable = not error.request_sent or self.is_idempotent(method, endpoint, payload)
+        elif isinstance(error, ServerError):
+            # a 429 is rejected before it is processed, so it is safe to resend
+            retryable = error.error_code in self.RETRYABLE_STATUS_CODES and (error.error_code == 429 or self.is_idempotent(method, endpoint, payload))
+        elif isinstance(error, ClientError):
+            retryable = error.error_code in self.RETRYABLE_ERROR_CODES and self.is_idempotent(method, endpoint, payload)
+        else:
+            retryable = False
+
+        if retryable and attempt < self.max_retries and self.budget.withdraw():
+            return RetryAction.RETRY
+        return RetryAction.RAISE
+
+    def reconciliation_request(self, endpoint: str, payload: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        """
+        It returns the endpoint and the payload of the order status request used after a 504
+
+        :param endpoint: The endpoint of the order request
+        :param payload: The payload of the order request
+        """
+
+        status_endpoint, id_key = self.RECONCILIATION_ENDPOINTS[endpoint]
+        return status_endpoint, {"symbol": payload.get("symbol"), id_key: self.client_order_id(payload)}
@@ -1,12 +1,14 @@
 from typing import Any
 
 from bingX._http_manager import _HTTPManager
+from bingX.kline import KlineFrame
 from bingX.spot.types import HistoryOrder, Order
+from bingX.transport import Transport
 
 
 class Market:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.__http_manager = _HTTPManager(api_key, secret_key)
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.__http_manager = _HTTPManager(api_key, secret_key, transport, recv_window)
 
     def get_symbols(self, symbol: str | None = None) -> dict[str, Any]:
         """
@@ -22,7 +24,7 @@ class Market:
         payload = {} if symbol is None else {"symbol": symbol}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_transaction_records(self, symbol: str, limit: int = 100) -> list[dict[str, Any]]:
         """
@@ -38,7 +40,7 @@ class Market:
         payload = {"symbol": symbol, "limit": limit}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_depth_details(self, symbol: str, limit: int = 20) -> dict[str, Any]:
         """
@@ -54,7 +56,7 @@ class Market:
         payload = {"symbol": symbol, "limit": limit}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_k_line_data(self, symbol: str, interval: str, start_time: int | None = None, end_time: int | None = None, limit: int = 1) -> list[dict[str, Any]] | dict[str, Any]:
         """
@@ -77,4 +79,17 @@ class Market:
         payload = {"symbol": symbol.upper(), "interval": interval, "limit": limit} if start_time is None or end_time is None else {"symbol": symbol.upper(), "interval": interval, "startTime": start_time, "endTime": end_time, "limit": limit}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
+
+    def get_k_line_frame(self, symbol: str, interval: str, start_time: int | None = None, end_time: int | None = None, limit: int = 1) -> KlineFrame:
+        """
+        It returns the Kline data as NumPy columns instead of one object per candle, requires numpy
+
+        :param symbol: The trading pair you want to get the Kline data for
+        :param interval: The interval of the Kline data, possible values: 1m, 3m, 5m, 15m, 30m, 1h, 2h, 4h, 6h, 8h, 12h, 1d, 1w, 1M
+        :param start_time: The start time of the Kline data, in milliseconds
+        :param end_time: The end time of the Kline data, in milliseconds
+        :param limit: The number of Kline data to return, maximum 1440
+        """
+
+        return KlineFrame.from_spot(self.get_k_line_data(symbol, interval, start_time, end_time, limit))
@@ -0,0 +1,76 @@
+from bingX._model import Field, Levels, Model, Number
+
+
+class Depth(Model):
+    """
+    An order book snapshot returned by Market.get_depth_details
+    """
+
+    __slots__ = ()
+
+    bids = Levels("bids")
+    asks = Levels("asks")
+
+
+class Trade(Model):
+    """
+    A trade returned by Market.get_transaction_records
+    """
+
+    __slots__ = ()
+
+    id = Field("id")
+    time = Field("time")
+    is_buyer_maker = Field("buyerMaker")
+    price = Number("price")
+    quantity = Number("qty")
+
+
+class Kline(Model):
+    """
+    A candlestick returned by Market.get_k_line_data, the exchange sends it as a list
+    """
+
+    __slots__ = ()
+
+    open_time = Field(0)
+    open = Number(1)
+    high = Number(2)
+    low = Number(3)
+    close = Number(4)
+    volume = Number(5)
+    close_time = Field(6)
+    quote_volume = Number(7)
+
+
+class Order(Model):
+    """
+    An order returned by Trade.create_order, Trade.get_order and the "orders" key of the other Trade methods
+    """
+
+    __slots__ = ()
+
+    symbol = Field("symbol")
+    order_id = Field("orderId")
+    client_order_id = Field("clientOrderID")
+    side = Field("side")
+    type = Field("type")
+    status = Field("status")
+    time = Field("time")
+    update_time = Field("updateTime")
+    price = Number("price")
+    quantity = Number("origQty")
+    executed_quantity = Number("executedQty")
+    cumulative_quote_quantity = Number("cummulativeQuoteQty")
+
+
+class Balance(Model):
+    """
+    A balance returned by the "balances" key of Trade.get_assets
+    """
+
+    __slots__ = ()
+
+    asset = Field("asset")
+    free = Number("free")
+    locked = Number("locked")
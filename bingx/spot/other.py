@@ -2,11 +2,12 @@ from typing import Any
 
 from bingX._http_manager import _HTTPManager
 from bingX.exceptions import ServerError
+from bingX.transport import Transport
 
 
 class Other:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.__http_manager = _HTTPManager(api_key, secret_key)
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.__http_manager = _HTTPManager(api_key, secret_key, transport, recv_window)
 
     def generate_listen_key(self) -> dict[str, Any]:
         """
@@ -18,7 +19,7 @@ class Other:
         endpoint =  "/openApi/user/auth/userDataStream"
 
         response = self.__http_manager.post(endpoint)
-        return response.json()
+        return response
 
     def extend_listen_key_validity_period(self, listen_key: str) -> int:
         """
@@ -35,10 +36,10 @@ class Other:
         payload = {"listenKey": listen_key}
 
         try:
-            response = self.__http_manager.put(endpoint, payload)
+            self.__http_manager.put(endpoint, payload)
         except ServerError as e:
             return e.error_code
-        return response.status_code
+        return 200
 
     def delete_listen_key(self, listen_key: str) -> int:
         """
@@ -55,7 +56,7 @@ class Other:
         payload = {"listenKey": listen_key}
 
         try:
-            response = self.__http_manager.delete(endpoint, payload)
+            self.__http_manager.delete(endpoint, payload)
         except ServerError as e:
             return e.error_code
-        return response.status_code
+        return 200
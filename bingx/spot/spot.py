@@ -1,10 +1,11 @@
 from bingX.spot.market import Market
 from bingX.spot.trade import Trade
 from bingX.spot.transfer import Transfer
+from bingX.transport import Transport
 
 
 class Spot:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.trade = Trade(api_key, secret_key)
-        self.market = Market(api_key, secret_key)
-        self.transfer = Transfer(api_key, secret_key)
\ No newline at end of file
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.trade = Trade(api_key, secret_key, transport, recv_window)
+        self.market = Market(api_key, secret_key, transport, recv_window)
+        self.transfer = Transfer(api_key, secret_key, transport, recv_window)
\ No newline at end of file
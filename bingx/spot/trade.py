@@ -2,11 +2,12 @@ from typing import Any
 
 from bingX._http_manager import _HTTPManager
 from bingX.spot.types import HistoryOrder, Order
+from bingX.transport import Transport
 
 
 class Trade:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.__http_manager = _HTTPManager(api_key, secret_key)
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.__http_manager = _HTTPManager(api_key, secret_key, transport, recv_window)
 
     def create_order(self, order: Order) -> dict[str, Any]:
         """
@@ -22,7 +23,7 @@ class Trade:
         payload = order.to_dict()
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def cancel_order(self, order_id: int, symbol: str, recv_window: int | None = None) -> dict[str, Any]:
         """
@@ -35,7 +36,7 @@ class Trade:
         payload = {"symbol": symbol, "orderId": order_id} if recv_window is None else {"orderId": order_id, "symbol": symbol, "recvWindow": recv_window}
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_order(self, order_id: int, symbol: str, recv_window: int | None = None) -> dict[str, Any]:
         """
@@ -48,7 +49,7 @@ class Trade:
         payload = {"symbol": symbol, "orderId": order_id} if recv_window is None else {"symbol": symbol, "orderId": order_id, "recvWindow": recv_window}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_open_orders(self, symbol: str | None = None, recv_window: int | None = None) -> dict[str, Any]:
         """
@@ -61,7 +62,7 @@ class Trade:
         payload = {"symbol": symbol} if recv_window is None else {"symbol": symbol, "recvWindow": recv_window}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_orders_history(self, history_order: HistoryOrder) -> dict[str, Any]:
         """
@@ -75,7 +76,7 @@ class Trade:
         payload = history_order.to_dict()
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_assets(self, recv_window: int | None = None) -> dict[str, Any]:
         """
@@ -88,4 +89,4 @@ class Trade:
         payload = {} if recv_window is None else {"recvWindow": recv_window}
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
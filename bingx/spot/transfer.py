@@ -7,11 +7,12 @@ from bingX.spot.types import (
     HistoryWithdraw,
     UniversalTransfer,
 )
+from bingX.transport import Transport
 
 
 class Transfer:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.__http_manager = _HTTPManager(api_key, secret_key)
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.__http_manager = _HTTPManager(api_key, secret_key, transport, recv_window)
 
     def universal_transfer(self, transfer: UniversalTransfer) -> dict[str, Any]:
         """
@@ -23,7 +24,7 @@ class Transfer:
         payload = transfer.to_dict()
 
         response = self.__http_manager.post(endpoint, payload)
-        return response.json()
+        return response
 
     def get_universal_transfer_history(self, history_transfer: HistoryTransfer) -> dict[str, Any]:
         """
@@ -35,7 +36,7 @@ class Transfer:
         payload = history_transfer.to_dict()
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()
+        return response
 
     def get_deposit_history(self, deposit_history: HistoryDeposit) -> list[dict[str, Any]]:
         """
@@ -47,7 +48,7 @@ class Transfer:
         payload = deposit_history.to_dict()
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()
+        return response
 
     def get_withdraw_history(self, withdraw_history: HistoryWithdraw) -> list[dict[str, Any]]:
         """
@@ -59,4 +60,4 @@ class Transfer:
         payload = withdraw_history.to_dict()
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()
+        return response
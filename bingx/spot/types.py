@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import Any
 
@@ -35,11 +35,12 @@ class Order(DictMixin):
     symbol: str
     side: Side
     type: OrderType
-    type_in_force: TimeInForce | None = None
+    type_in_force: TimeInForce | None = field(default=None, metadata={"name": "timeInForce"})
     quantity: float | None = None
     quote_order_qty: float | None = None
     price: float | None = None
     recvWindow: int | None = None
+    client_order_id: str | None = field(default=None, metadata={"name": "newClientOrderId"})
 
     def __post_init__(self):
         if self.type == OrderType.LIMIT:
@@ -2,11 +2,12 @@ from typing import Any
 
 from bingX._http_manager import _HTTPManager
 from bingX.perpetual.v2.types import HistoryOrder
+from bingX.transport import Transport
 
 
 class Standard:
-    def __init__(self, api_key: str, secret_key: str) -> None:
-        self.__http_manager = _HTTPManager(api_key, secret_key)
+    def __init__(self, api_key: str, secret_key: str, transport: Transport | None = None, recv_window: int | None = None) -> None:
+        self.__http_manager = _HTTPManager(api_key, secret_key, transport, recv_window)
 
     def get_all_positions(self) -> list[dict[str, Any]]:
         """
@@ -17,7 +18,7 @@ class Standard:
         endpoint =  "/openApi/contract/v1/allPosition"
 
         response = self.__http_manager.get(endpoint)
-        return response.json()["data"]
+        return response["data"]
 
     def get_orders_history(self, order: HistoryOrder) -> list[dict[str, Any]]:
         """
@@ -29,7 +30,7 @@ class Standard:
         payload = order.to_dict()
 
         response = self.__http_manager.get(endpoint, payload)
-        return response.json()["data"]
+        return response["data"]
 
     def get_account_details(self) -> list[dict[str, Any]]:
         """
@@ -40,4 +41,4 @@ class Standard:
         endpoint = "/openApi/contract/v1/balance"
 
         response = self.__http_manager.get(endpoint)
-        return response.json()["data"]
+        return response["data"]
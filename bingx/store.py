@@ -0,0 +1,223 @@
+import json
+import os
+import re
+from collections import Counter
+from typing import Any
+
+from bingX._helpers import generate_timestamp
+from bingX.history import INTERVALS, VARIABLE_INTERVALS, KlineDownloader, find_gaps
+from bingX.kline import KlineFrame, _require_numpy, np
+from bingX.spot.market import Market as SpotMarket
+
+KLINE_COLUMNS = ("open_time", "open", "high", "low", "close", "volume")
+TRADE_COLUMNS = ("time", "price", "quantity", "is_buyer_maker")
+SPOT_TRADE_COLUMNS = ("id", *TRADE_COLUMNS)
+INTEGER_COLUMNS = frozenset({"open_time", "time", "id"})
+
+
+def _covered(gaps: list[list[int]], first: int, last: int) -> bool:
+    return any(gap_first <= first and last <= gap_last for gap_first, gap_last in gaps)
+
+
+def _merge(old: dict[str, Any], new: dict[str, Any], key: str) -> dict[str, Any]:
+    """
+    It joins two sets of columns sorted by `key`, rows of `new` replace rows of `old` with the same key
+    """
+
+    merged = {name: np.concatenate([old[name], new[name]]) for name in old}
+    order = np.argsort(merged[key], kind="stable")
+    merged = {name: column[order] for name, column in merged.items()}
+    keys = merged[key]
+    keep = np.append(keys[1:] != keys[:-1], True) # the last of every run of equal keys comes from `new`
+    return {name: column[keep] for name, column in merged.items()}
+
+
+class MarketDataStore:
+    """
+    A local store of klines and trades, one directory per (market, symbol, interval) holding one .npy file per column.
+
+    Columns are memory-mapped on read, so stored history is served without parsing or copying. A kline read first fetches
+    what the store is missing: the range before the first candle, gaps, and the tail after the last complete candle.
+    Ranges the exchange has no candles for are remembered and not asked for again.
+    """
+
+    def __init__(self, root: str, market: Any, max_workers: int = 8) -> None:
+        """
+        :param root: The directory of the store
+        :param market: A bingX.perpetual.v2.market.Market or a bingX.spot.market.Market client
+        :param max_workers: The maximum number of kline pages fetched at the same time
+        """
+
+        _require_numpy()
+        self.root = root
+        self.market = market
+        self.market_name = "spot" if isinstance(market, SpotMarket) else "swap"
+        self.__downloader = KlineDownloader(market, max_workers)
+
+    def path(self, kind: str, symbol: str, interval: str | None = None) -> str:
+        """
+        It returns the directory of a series
+
+        :param kind: "klines" or "trades"
+        :param symbol: The symbol of the series
+        :param interval: The interval of the klines
+        """
+
+        parts = [self.root, self.market_name, kind, re.sub(r"[^A-Za-z0-9_.-]", "_", symbol)]
+        return os.path.join(*parts, interval) if interval is not None else os.path.join(*parts)
+
+    def klines(self, symbol: str, interval: str, start_time: int, end_time: int, refresh: bool = True) -> KlineFrame:
+        """
+        It returns the klines with an open time in [start_time, end_time), fetching only the ones that are not stored
+
+        :param symbol: The trading pair of the klines
+        :param interval: The interval of the klines, possible values: 1m, 3m, 5m, 15m, 30m, 1h, 2h, 4h, 6h, 8h, 12h, 1d, 3d, 1w, 1M
+        :param start_time: The start of the range in milliseconds
+        :param end_time: The end of the range in milliseconds, exclusive
+        :param refresh: If False, only what is stored is returned and no request is sent
+        """
+
+        path = self.path("klines", symbol, interval)
+        columns = self._read(path, KLINE_COLUMNS)
+        meta = self._read_meta(path)
+        missing = self.missing_ranges(columns["open_time"], interval, start_time, end_time, meta["gaps"], meta["updated"]) if refresh else []
+        if missing:
+            updated = generate_timestamp()
+            for range_start, range_end in missing:
+                history = self.__downloader.download(symbol, interval, range_start, range_end)
+                if history.rows:
+                    frame = history.to_frame()
+                    columns = _merge(columns, {name: getattr(frame, name) for name in KLINE_COLUMNS}, "open_time")
+                meta["gaps"].extend(list(gap) for gap in history.gaps)
+
+            first = int(columns["open_time"][0]) if len(columns["open_time"]) else min(end_time, updated)
+            if start_time < first and not _covered(meta["gaps"], start_time, first - 1): # the symbol was not listed yet
+                meta["gaps"].append([start_time, first - 1])
+            meta["updated"] = updated
+            self._write(path, columns, meta)
+            columns = self._read(path, KLINE_COLUMNS)
+
+        open_time = columns["open_time"]
+        start, end = np.searchsorted(open_time, start_time), np.searchsorted(open_time, end_time)
+        return KlineFrame(*(columns[name][start:end] for name in KLINE_COLUMNS))
+
+    @staticmethod
+    def missing_ranges(open_time: Any, interval: str, start_time: int, end_time: int, known_gaps: list[list[int]] = [], updated: int = 0) -> list[tuple[int, int]]:
+        """
+        It returns the [start, end) ranges of a request that are not stored
+
+        :param open_time: The sorted open times that are stored
+        :param interval: The interval of the klines
+        :param start_time: The start of the requested range in milliseconds
+        :param end_time: The end of the requested range in milliseconds, exclusive
+        :param known_gaps: The [first, last] open times of ranges the exchange has no klines for
+        :param updated: The time of the last fetch in milliseconds, the last candle before it may have been incomplete
+        """
+
+        if not len(open_time):
+            return [] if _covered(known_gaps, start_time, end_time - 1) else [(start_time, end_time)]
+
+        interval_ms = INTERVALS[interval]
+        first, last = int(open_time[0]), int(open_time[-1])
+        missing = []
+        if start_time < first and not _covered(known_gaps, start_time, first - 1):
+            missing.append((start_time, first))
+        if interval not in VARIABLE_INTERVALS:
+            inside = open_time[(open_time >= start_time - interval_ms) & (open_time < end_time)].tolist()
+            missing.extend((gap_first, gap_last + interval_ms) for gap_first, gap_last in find_gaps(inside, interval_ms) if not _covered(known_gaps, gap_first, gap_last))
+        if end_time > last + interval_ms or (end_time > last and last + interval_ms > updated):
+            missing.append((last, end_time))
+        return missing
+
+    def trades(self, symbol: str, refresh: bool = True) -> dict[str, Any]:
+        """
+        It returns every stored trade of the symbol as time, price, quantity and is_buyer_maker columns, and id on spot,
+        after appending the trades the exchange returned since the last call
+
+        :param symbol: The trading pair of the trades
+        :param refresh: If False, only what is stored is returned and no request is sent
+        """
+
+        path = self.path("trades", symbol)
+        names = SPOT_TRADE_COLUMNS if self.market_name == "spot" else TRADE_COLUMNS
+        columns = self._read(path, names)
+        if not refresh:
+            return columns
+
+        if self.market_name == "spot":
+            rows, maker_key = self.market.get_transaction_records(symbol, 100), "buyerMaker"
+        else:
+            rows, maker_key = self.market.get_latest_trade_of_trading_pair(symbol, 1000), "isBuyerMaker"
+        size = len(rows)
+        new = {
+            "time": np.fromiter((row["time"] for row in rows), dtype=np.int64, count=size),
+            "price": np.fromiter((float(row["price"]) for row in rows), dtype=np.float64, count=size),
+            "quantity": np.fromiter((float(row["qty"]) for row in rows), dtype=np.float64, count=size),
+            "is_buyer_maker": np.fromiter((bool(row.get(maker_key)) for row in rows), dtype=np.bool_, count=size),
+        }
+        if self.market_name == "spot":
+            new["id"] = np.fromiter((row["id"] for row in rows), dtype=np.int64, count=size)
+            order = np.lexsort((new["id"], new["time"]))
+        else:
+            order = np.argsort(new["time"], kind="stable")
+        if len(columns["time"]) and len(order):
+            order = order[self.__unseen(columns, {name: column[order] for name, column in new.items()})]
+        if not len(order):
+            return columns
+
+        self._write(path, {name: np.concatenate([columns[name], new[name][order]]) for name in names}, self._read_meta(path))
+        return self._read(path, names)
+
+    @staticmethod
+    def __unseen(columns: dict[str, Any], new: dict[str, Any]) -> Any:
+        # the mask of the new trades, sorted by time, that are not stored yet. Several trades may share the millisecond
+        # of the last stored trade, so the ones at that millisecond are compared with the stored ones
+        last = columns["time"][-1]
+        tail = int(np.searchsorted(columns["time"], last))
+        if "id" in new: # spot trades carry an id
+            return (new["time"] >= last) & ~np.isin(new["id"], columns["id"][tail:])
+
+        # swap trades have none: a trade at the last millisecond is new unless an identical one is stored,
+        # each stored trade matching a single new one
+        unseen = new["time"] > last
+        stored = Counter(zip(*(columns[name][tail:].tolist() for name in TRADE_COLUMNS)))
+        for i in np.flatnonzero(new["time"] == last):
+            trade = tuple(new[name][i].item() for name in TRADE_COLUMNS)
+            if stored[trade]:
+                stored[trade] -= 1
+            else:
+                unseen[i] = True
+        return unseen
+
+    @staticmethod
+    def _read(path: str, names: tuple[str, ...]) -> dict[str, Any]:
+        try:
+            columns = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in names}
+        except (FileNotFoundError, ValueError):
+            columns = {}
+        if len(columns) != len(names) or len({len(column) for column in columns.values()}) != 1: # missing, or interrupted while writing
+            return {name: np.empty(0, dtype=np.bool_ if name == "is_buyer_maker" else np.int64 if name in INTEGER_COLUMNS else np.float64) for name in names}
+        return columns
+
+    @staticmethod
+    def _read_meta(path: str) -> dict[str, Any]:
+        try:
+            with open(os.path.join(path, "meta.json")) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {"gaps": [], "updated": 0}
+
+    @staticmethod
+    def _write(path: str, columns: dict[str, Any], meta: dict[str, Any]) -> None:
+        # every file is replaced atomically, a crash between two files leaves columns of different lengths that _read discards
+        os.makedirs(path, exist_ok=True)
+        for name, column in columns.items():
+            target = os.path.join(path, f"{name}.npy")
+            with open(f"{target}.tmp", "wb") as f:
+                np.save(f, np.ascontiguousarray(column))
+            os.replace(f"{target}.tmp", target)
+
+        target = os.path.join(path, "meta.json")
+        with open(f"{target}.tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(f"{target}.tmp", target)
@@ -0,0 +1,9 @@
+from bingX.stream.market import MarketStream
+from bingX.stream.types import (
+    BalanceUpdate,
+    MarketType,
+    OrderUpdate,
+    PositionUpdate,
+    StreamEvent,
+)
+from bingX.stream.user import UserDataStream
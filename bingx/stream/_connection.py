@@ -0,0 +1,120 @@
+import asyncio
+import gzip
+import json
+import uuid
+import zlib
+from typing import Any, Awaitable, Callable
+
+import websockets
+
+
+class _StreamConnection:
+    """
+    A single websocket connection carrying many subscriptions.
+
+    It inflates the gzip-compressed frames, answers the server heartbeat and reconnects
+    with exponential backoff, re-subscribing to every data type it carries.
+    """
+
+    def __init__(self, url: str, on_message: Callable[[dict[str, Any]], Awaitable[None]], reconnect_delay: float = 1.0, max_reconnect_delay: float = 30.0) -> None:
+        self.url = url
+        self.data_types: set[str] = set()
+        self.__on_message = on_message
+        self.__reconnect_delay = reconnect_delay
+        self.__max_reconnect_delay = max_reconnect_delay
+        self.__websocket: Any = None
+        self.__closed = False
+
+    async def subscribe(self, data_type: str) -> None:
+        """
+        It adds the data type to this connection and subscribes to it right away if the connection is open
+
+        :param data_type: The data type to subscribe to i.e. BTC-USDT@depth20
+        """
+
+        self.data_types.add(data_type)
+        if self.__websocket is not None:
+            await self.__send_request("sub", data_type)
+
+    async def unsubscribe(self, data_type: str) -> None:
+        """
+        It removes the data type from this connection
+
+        :param data_type: The data type to unsubscribe from i.e. BTC-USDT@depth20
+        """
+
+        self.data_types.discard(data_type)
+        if self.__websocket is not None:
+            await self.__send_request("unsub", data_type)
+
+    async def run(self) -> None:
+        """
+        It keeps the connection open until close is called
+        """
+
+        delay = self.__reconnect_delay
+        while not self.__closed:
+            try:
+                async with websockets.connect(self.url, ping_interval=None, max_size=None) as websocket:
+                    self.__websocket = websocket
+                    delay = self.__reconnect_delay
+                    for data_type in list(self.data_types):
+                        await self.__send_request("sub", data_type)
+                    async for frame in websocket:
+                        await self.__handle_frame(frame)
+            except (websockets.ConnectionClosed, OSError, asyncio.TimeoutError):
+                pass
+            except (EOFError, zlib.error, ValueError): # a frame that is not gzip, UTF-8 or JSON, the connection is reset
+                pass
+            finally:
+                self.__websocket = None
+
+            if not self.__closed:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.__max_reconnect_delay)
+
+    async def close(self) -> None:
+        """
+        It closes the connection and stops reconnecting
+        """
+
+        self.__closed = True
+        if self.__websocket is not None:
+            await self.__websocket.close()
+
+    async def reconnect(self) -> None:
+        """
+        It drops the current connection, the run loop then connects again to the current url
+        """
+
+        if self.__websocket is not None:
+            await self.__websocket.close()
+
+    async def send(self, message: str) -> None:
+        """
+        It sends a raw text message over the open connection
+
+        :param message: The message to send
+        """
+
+        if self.__websocket is not None:
+            await self.__websocket.send(message)
+
+    async def __send_request(self, req_type: str, data_type: str) -> None:
+        await self.send(json.dumps({"id": str(uuid.uuid4()), "reqType": req_type, "dataType": data_type}))
+
+    async def __handle_frame(self, frame: str | bytes) -> None:
+        text = gzip.decompress(frame).decode() if isinstance(frame, bytes) else frame
+
+        if text == "Ping": # swap heartbeat
+            await self.send("Pong")
+            return
+
+        message = json.loads(text)
+        if not isinstance(message, dict):
+            return
+        if "ping" in message: # spot heartbeat
+            await self.send(json.dumps({"pong": message["ping"], "time": message.get("time")}))
+            return
+
+        await self.__on_message(message)
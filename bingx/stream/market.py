@@ -0,0 +1,193 @@
+import asyncio
+import inspect
+import logging
+from typing import Any, AsyncIterator, Callable
+
+from bingX.stream._connection import _StreamConnection
+from bingX.stream.types import MarketType, StreamEvent
+
+Callback = Callable[[StreamEvent], Any]
+
+logger = logging.getLogger(__name__)
+
+
+class MarketStream:
+    """
+    Streams trade, depth, kline and ticker data for many symbols over a few multiplexed websocket connections.
+
+    Events can be consumed with callbacks, with `async for event in stream`, or both.
+    """
+
+    URLS = {
+        MarketType.SWAP: "wss://open-api-swap.bingx.com/swap-market",
+        MarketType.SPOT: "wss://open-api-ws.bingx.com/market",
+    }
+    SPOT_KLINE_INTERVALS = {
+        "1m": "1min", "3m": "3min", "5m": "5min", "15m": "15min", "30m": "30min", "1h": "60min", "2h": "2hour", "4h": "4hour",
+        "6h": "6hour", "8h": "8hour", "12h": "12hour", "1d": "1day", "3d": "3day", "1w": "1week", "1M": "1mon",
+    }
+
+    def __init__(self, market: MarketType = MarketType.SWAP, max_subscriptions_per_connection: int = 200, queue_size: int = 10_000, url: str | None = None) -> None:
+        """
+        :param market: The market to stream, swap v2 or spot
+        :param max_subscriptions_per_connection: The number of data types carried by one websocket connection
+        :param queue_size: The number of events buffered for the async iterator, the oldest event is dropped when full
+        :param url: The websocket url, defaults to the public url of the market
+        """
+
+        self.market = market
+        self.url = url if url is not None else self.URLS[market]
+        self.__max_subscriptions_per_connection = max_subscriptions_per_connection
+        self.__queue_size = queue_size
+        self.__connections: list[_StreamConnection] = []
+        self.__callbacks: dict[str, list[Callback]] = {}
+        self.__global_callbacks: list[Callback] = []
+        self.__queue: asyncio.Queue[StreamEvent] | None = None
+        self.__tasks: list[asyncio.Task] = []
+        self.__started = False
+
+    async def subscribe(self, data_type: str, callback: Callback | None = None) -> None:
+        """
+        It subscribes to a data type, opening a new connection when the current ones are full
+
+        :param data_type: The data type to subscribe to i.e. BTC-USDT@depth20
+        :param callback: An optional function or coroutine function called with every event of this data type
+        """
+
+        if callback is not None:
+            self.__callbacks.setdefault(data_type, []).append(callback)
+
+        if any(data_type in connection.data_types for connection in self.__connections):
+            return
+
+        connection = next((c for c in self.__connections if len(c.data_types) < self.__max_subscriptions_per_connection), None)
+        if connection is None:
+            connection = _StreamConnection(self.url, self.__dispatch)
+            self.__connections.append(connection)
+            if self.__started:
+                self.__tasks.append(asyncio.create_task(connection.run()))
+        await connection.subscribe(data_type)
+
+    async def unsubscribe(self, data_type: str) -> None:
+        """
+        It unsubscribes from a data type and drops its callbacks
+
+        :param data_type: The data type to unsubscribe from i.e. BTC-USDT@depth20
+        """
+
+        self.__callbacks.pop(data_type, None)
+        for connection in self.__connections:
+            if data_type in connection.data_types:
+                await connection.unsubscribe(data_type)
+
+    async def subscribe_trade(self, symbol: str, callback: Callback | None = None) -> None:
+        """
+        :param symbol: The trading pair i.e. BTC-USDT
+        :param callback: An optional function or coroutine function called with every event
+        """
+
+        await self.subscribe(f"{symbol.upper()}@trade", callback)
+
+    async def subscribe_depth(self, symbol: str, level: int = 20, callback: Callback | None = None) -> None:
+        """
+        :param symbol: The trading pair i.e. BTC-USDT
+        :param level: The number of price levels, optional value:[5, 10, 20, 50, 100]
+        :param callback: An optional function or coroutine function called with every event
+        """
+
+        await self.subscribe(f"{symbol.upper()}@depth{level}", callback)
+
+    async def subscribe_kline(self, symbol: str, interval: str, callback: Callback | None = None) -> None:
+        """
+        :param symbol: The trading pair i.e. BTC-USDT
+        :param interval: The interval of the Kline data, possible values: 1m, 3m, 5m, 15m, 30m, 1h, 2h, 4h, 6h, 8h, 12h, 1d, 3d, 1w, 1M
+        :param callback: An optional function or coroutine function called with every event
+        """
+
+        if self.market == MarketType.SPOT:
+            interval = self.SPOT_KLINE_INTERVALS.get(interval, interval)
+        await self.subscribe(f"{symbol.upper()}@kline_{interval}", callback)
+
+    async def subscribe_ticker(self, symbol: str, callback: Callback | None = None) -> None:
+        """
+        :param symbol: The trading pair i.e. BTC-USDT
+        :param callback: An optional function or coroutine function called with every event
+        """
+
+        await self.subscribe(f"{symbol.upper()}@ticker", callback)
+
+    def on(self, callback: Callback) -> None:
+        """
+        It registers a function or coroutine function called with every event of every data type
+
+        :param callback: The function to call
+        """
+
+        self.__global_callbacks.append(callback)
+
+    def start(self) -> None:
+        """
+        It starts the connections in the background of the running event loop
+        """
+
+        if not self.__started:
+            self.__started = True
+            self.__tasks = [asyncio.create_task(connection.run()) for connection in self.__connections]
+
+    async def run(self) -> None:
+        """
+        It starts the connections and waits until the stream is closed
+        """
+
+        self.start()
+        while pending := [task for task in self.__tasks if not task.done()]:
+            await asyncio.wait(pending)
+
+    async def close(self) -> None:
+        """
+        It closes every connection of the stream
+        """
+
+        for connection in self.__connections:
+            await connection.close()
+        for task in self.__tasks:
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+        self.__tasks = []
+        self.__started = False
+
+    async def __aenter__(self) -> "MarketStream":
+        self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def __aiter__(self) -> AsyncIterator[StreamEvent]:
+        if self.__queue is None:
+            self.__queue = asyncio.Queue(self.__queue_size)
+        self.start()
+        return self.__iterate(self.__queue)
+
+    async def __iterate(self, queue: asyncio.Queue[StreamEvent]) -> AsyncIterator[StreamEvent]:
+        while True:
+            yield await queue.get()
+
+    async def __dispatch(self, message: dict[str, Any]) -> None:
+        data_type = message.get("dataType")
+        if not data_type or message.get("data") is None:
+            return # subscription acknowledgements
+
+        event = StreamEvent(data_type, message["data"])
+        for callback in (*self.__callbacks.get(data_type, ()), *self.__global_callbacks):
+            try:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception: # a failing callback must not stop the connection nor the other callbacks
+                logger.exception("callback %r failed on %s", callback, data_type)
+
+        if self.__queue is not None:
+            if self.__queue.full():
+                self.__queue.get_nowait()
+            self.__queue.put_nowait(event)
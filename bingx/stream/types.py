@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+
+class MarketType(Enum):
+    SWAP = "swap"
+    SPOT = "spot"
+
+
+@dataclass
+class StreamEvent:
+    data_type: str
+    data: Any
+
+    @property
+    def symbol(self) -> str:
+        return self.data_type.split("@", 1)[0]
+
+    @property
+    def channel(self) -> str:
+        return self.data_type.split("@", 1)[-1]
+
+
+def _float(value: Any) -> float:
+    return float(value) if value not in (None, "") else 0.0
+
+
+@dataclass
+class OrderUpdate:
+    symbol: str
+    order_id: int
+    client_order_id: str
+    side: str
+    position_side: str | None
+    order_type: str
+    execution_type: str
+    status: str
+    price: float
+    quantity: float
+    average_price: float
+    filled_quantity: float
+    fee: float
+    fee_asset: str | None
+    event_time: int
+    raw: dict[str, Any]
+
+    @classmethod
+    def from_event(cls, event: dict[str, Any]) -> "OrderUpdate":
+        order = event["o"] if isinstance(event.get("o"), dict) else event # swap nests the order under "o", spot does not
+        return cls(
+            symbol=order.get("s"),
+            order_id=order.get("i"),
+            client_order_id=order.get("c"),
+            side=order.get("S"),
+            position_side=order.get("ps"),
+            order_type=order.get("o"),
+            execution_type=order.get("x"),
+            status=order.get("X"),
+            price=_float(order.get("p")),
+            quantity=_float(order.get("q")),
+            average_price=_float(order.get("ap")),
+            filled_quantity=_float(order.get("z")),
+            fee=_float(order.get("n")),
+            fee_asset=order.get("N"),
+            event_time=event.get("E"),
+            raw=event,
+        )
+
+
+@dataclass
+class BalanceUpdate:
+    asset: str
+    wallet_balance: float
+    cross_wallet_balance: float
+    balance_change: float
+    reason: str | None
+    event_time: int
+    raw: dict[str, Any]
+
+
+@dataclass
+class PositionUpdate:
+    symbol: str
+    position_side: str
+    position_amount: float
+    entry_price: float
+    unrealized_profit: float
+    margin_type: str
+    isolated_wallet: float
+    reason: str | None
+    event_time: int
+    raw: dict[str, Any]
+
+
+def parse_account_update(event: dict[str, Any]) -> list[BalanceUpdate | PositionUpdate]:
+    """
+    It splits an ACCOUNT_UPDATE event into one update per balance and per position
+
+    :param event: The decoded ACCOUNT_UPDATE event
+    """
+
+    account = event.get("a", {})
+    reason = account.get("m")
+    event_time = event.get("E")
+    updates: list[BalanceUpdate | PositionUpdate] = [
+        BalanceUpdate(
+            asset=balance.get("a"),
+            wallet_balance=_float(balance.get("wb")),
+            cross_wallet_balance=_float(balance.get("cw")),
+            balance_change=_float(balance.get("bc")),
+            reason=reason,
+            event_time=event_time,
+            raw=balance,
+        ) for balance in account.get("B", [])
+    ]
+    updates.extend(
+        PositionUpdate(
+            symbol=position.get("s"),
+            position_side=position.get("ps"),
+            position_amount=_float(position.get("pa")),
+            entry_price=_float(position.get("ep")),
+            unrealized_profit=_float(position.get("up")),
+            margin_type=position.get("mt"),
+            isolated_wallet=_float(position.get("iw")),
+            reason=reason,
+            event_time=event_time,
+            raw=position,
+        ) for position in account.get("P", [])
+    )
+    return updates
@@ -0,0 +1,216 @@
+import asyncio
+import inspect
+import logging
+from typing import Any, AsyncIterator, Callable
+
+from bingX.exceptions import ClientError, NetworkError, ServerError
+from bingX.perpetual.v2.other import Other as SwapOther
+from bingX.spot.other import Other as SpotOther
+from bingX.stream._connection import _StreamConnection
+from bingX.stream.market import MarketStream
+from bingX.stream.types import (
+    BalanceUpdate,
+    MarketType,
+    OrderUpdate,
+    PositionUpdate,
+    parse_account_update,
+)
+from bingX.transport import Transport
+
+UserEvent = OrderUpdate | BalanceUpdate | PositionUpdate
+Callback = Callable[[UserEvent], Any]
+
+logger = logging.getLogger(__name__)
+
+
+class UserDataStream:
+    """
+    Streams order, position and balance updates of the account.
+
+    It creates the listen key, extends it before the 60 minutes expiry and switches to a new key,
+    reconnecting, whenever the current one can no longer be extended or the server reports it expired.
+    """
+
+    SPOT_DATA_TYPES = ("spot.executionReport", "ACCOUNT_UPDATE")
+    RENEW_ATTEMPTS = 3
+    RETRY_DELAY = 1.0
+    MAX_RETRY_DELAY = 60.0
+
+    def __init__(self, api_key: str, secret_key: str, market: MarketType = MarketType.SWAP, renew_interval: float = 30 * 60, queue_size: int = 10_000, transport: Transport | None = None, url: str | None = None) -> None:
+        """
+        :param api_key: The api key of the account
+        :param secret_key: The secret key of the account
+        :param market: The market to stream, swap v2 or spot
+        :param renew_interval: The number of seconds between listen key extensions, it must stay below 60 minutes
+        :param queue_size: The number of events buffered for the async iterator, the oldest event is dropped when full
+        :param transport: The transport used for the listen key requests
+        :param url: The websocket url, defaults to the public url of the market
+        """
+
+        self.market = market
+        self.url = url if url is not None else MarketStream.URLS[market]
+        self.listen_key: str | None = None
+        self.__other = SwapOther(api_key, secret_key, transport) if market == MarketType.SWAP else SpotOther(api_key, secret_key, transport)
+        self.__renew_interval = renew_interval
+        self.__queue_size = queue_size
+        self.__connection: _StreamConnection | None = None
+        self.__callbacks: list[tuple[type | None, Callback]] = []
+        self.__queue: asyncio.Queue[UserEvent] | None = None
+        self.__tasks: list[asyncio.Task] = []
+
+    def on(self, callback: Callback, event_type: type | None = None) -> None:
+        """
+        It registers a function or coroutine function called with every update, or only with updates of the given type
+
+        :param callback: The function to call
+        :param event_type: OrderUpdate, BalanceUpdate, PositionUpdate or None for every update
+        """
+
+        self.__callbacks.append((event_type, callback))
+
+    def on_order(self, callback: Callback) -> None:
+        self.on(callback, OrderUpdate)
+
+    def on_balance(self, callback: Callback) -> None:
+        self.on(callback, BalanceUpdate)
+
+    def on_position(self, callback: Callback) -> None:
+        self.on(callback, PositionUpdate)
+
+    async def start(self) -> None:
+        """
+        It creates the listen key and starts the connection and the renewal timer in the background
+        """
+
+        if self.__tasks:
+            return
+
+        self.listen_key = await self.__generate_listen_key()
+        self.__connection = _StreamConnection(self.__listen_url(), self.__dispatch)
+        if self.market == MarketType.SPOT:
+            for data_type in self.SPOT_DATA_TYPES:
+                await self.__connection.subscribe(data_type)
+
+        self.__tasks = [asyncio.create_task(self.__connection.run()), asyncio.create_task(self.__renew())]
+
+    async def run(self) -> None:
+        """
+        It starts the stream and waits until it is closed
+        """
+
+        await self.start()
+        await asyncio.wait(self.__tasks)
+
+    async def close(self) -> None:
+        """
+        It closes the connection, stops the renewal timer and deletes the listen key
+        """
+
+        if self.__connection is not None:
+            await self.__connection.close()
+        for task in self.__tasks:
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+        self.__tasks = []
+
+        if self.listen_key is not None:
+            await asyncio.to_thread(self.__other.delete_listen_key, self.listen_key)
+            self.listen_key = None
+
+    async def __aenter__(self) -> "UserDataStream":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def __aiter__(self) -> AsyncIterator[UserEvent]:
+        if self.__queue is None:
+            self.__queue = asyncio.Queue(self.__queue_size)
+        return self.__iterate(self.__queue)
+
+    async def __iterate(self, queue: asyncio.Queue[UserEvent]) -> AsyncIterator[UserEvent]:
+        await self.start()
+        while True:
+            yield await queue.get()
+
+    def __listen_url(self) -> str:
+        return f"{self.url}?listenKey={self.listen_key}"
+
+    async def __generate_listen_key(self) -> str:
+        response = await asyncio.to_thread(self.__other.generate_listen_key)
+        return response["listenKey"]
+
+    async def __rotate_listen_key(self) -> None:
+        # it retries with backoff until a new key is created, then deletes the old one
+        delay = self.RETRY_DELAY
+        while True:
+            try:
+                listen_key = await self.__generate_listen_key()
+                break
+            except (ClientError, NetworkError, ServerError):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.MAX_RETRY_DELAY)
+
+        old_listen_key, self.listen_key = self.listen_key, listen_key
+        if self.__connection is not None:
+            self.__connection.url = self.__listen_url()
+            await self.__connection.reconnect()
+        if old_listen_key is not None:
+            try:
+                await asyncio.to_thread(self.__other.delete_listen_key, old_listen_key)
+            except (ClientError, NetworkError, ServerError): # the old key expires on its own
+                pass
+
+    async def __extend_listen_key(self) -> bool:
+        # it returns False if the key could not be extended after RENEW_ATTEMPTS attempts or does not exist anymore
+        delay = self.RETRY_DELAY
+        for attempt in range(self.RENEW_ATTEMPTS):
+            try:
+                status_code = await asyncio.to_thread(self.__other.extend_listen_key_validity_period, self.listen_key)
+            except (ClientError, NetworkError, ServerError):
+                status_code = None
+            if status_code == 200:
+                return True
+            if status_code == 404 or attempt == self.RENEW_ATTEMPTS - 1:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.MAX_RETRY_DELAY)
+        return False
+
+    async def __renew(self) -> None:
+        while True:
+            await asyncio.sleep(self.__renew_interval)
+            if not await self.__extend_listen_key():
+                await self.__rotate_listen_key()
+
+    async def __dispatch(self, message: dict[str, Any]) -> None:
+        event = message.get("data") if "dataType" in message else message
+        if not isinstance(event, dict):
+            return # subscription acknowledgements
+
+        match event.get("e"):
+            case "ORDER_TRADE_UPDATE" | "executionReport":
+                updates: list[UserEvent] = [OrderUpdate.from_event(event)]
+            case "ACCOUNT_UPDATE":
+                updates = parse_account_update(event)
+            case "listenKeyExpired":
+                await self.__rotate_listen_key()
+                return
+            case _:
+                return
+
+        for update in updates:
+            for event_type, callback in self.__callbacks:
+                if event_type is None or isinstance(update, event_type):
+                    try:
+                        result = callback(update)
+                        if inspect.isawaitable(result):
+                            await result
+                    except Exception: # a failing callback must not stop the connection nor the other callbacks
+                        logger.exception("callback %r failed on %s", callback, event.get("e"))
+
+            if self.__queue is not None:
+                if self.__queue.full():
+                    self.__queue.get_nowait()
+                self.__queue.put_nowait(update)
@@ -0,0 +1 @@
+from bingX.testing.exchange import MockExchange, MockResponse
@@ -0,0 +1,571 @@
+import asyncio
+import hmac
+import itertools
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from bingX._helpers import Signer, generate_timestamp
+from bingX.history import INTERVALS
+from bingX.transport import Transport
+
+SYMBOLS = {"BTC-USDT": 64000.0, "ETH-USDT": 3200.0, "SOL-USDT": 150.0, "XRP-USDT": 0.6, "DOGE-USDT": 0.15}
+INVALID_PARAMETER_ERROR_CODE = 80014
+ORDER_NOT_FOUND_ERROR_CODE = 80016
+SIGNATURE_ERROR_CODE = 100001
+
+
+@dataclass
+class MockResponse:
+    status_code: int
+    content: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode()
+
+
+@dataclass
+class _Fault:
+    response: MockResponse
+    times: int
+    endpoint: str | None
+
+
+class _Rejection(Exception):
+    def __init__(self, error_code: int, error_message: str) -> None:
+        self.error_code = error_code
+        self.error_message = error_message
+
+
+def _envelope(data: Any, code: int = 0, msg: str = "") -> bytes:
+    return json.dumps({"code": code, "msg": msg, "data": data}, separators=(",", ":")).encode()
+
+
+def _decimals(price: float) -> int:
+    return 1 if price >= 1000 else 2 if price >= 10 else 4 if price >= 0.1 else 6
+
+
+class MockExchange:
+    """
+    An in-process stand-in for the BingX REST api. It serves the swap v2, spot and standard endpoints with payloads of
+    the exchange's shape and size, keeps the orders it was sent, and is deterministic for a given seed.
+
+    Clients reach it through a transport's send hook, without sockets, or over HTTP/1.1 on a local port with serve.
+    Every answer waits `latency` seconds (plus up to `jitter`), and errors injected with fail or reject are answered
+    to the next matching requests, so throughput, retries and rate limiting can be measured with no network.
+    """
+
+    BASE_URL = "http://mock.bingx"
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, secret_key: str | None = None, symbols: dict[str, float] | None = None, listings: int = 250, max_requests_per_second: float | None = None, seed: int = 0) -> None:
+        """
+        :param latency: The number of seconds every answer waits
+        :param jitter: The maximum number of seconds added at random to the latency
+        :param secret_key: If given, requests with a wrong signature are rejected like the exchange does
+        :param symbols: The last price of every listed symbol, a few major pairs if not given
+        :param listings: The number of listed symbols, synthetic symbols are added up to it
+        :param max_requests_per_second: If given, requests over this rate are answered with 429
+        :param seed: The seed of the generated quantities
+        """
+
+        self.latency = latency
+        self.jitter = jitter
+        self.max_requests_per_second = max_requests_per_second
+        self.calls: Counter[str] = Counter()
+        self.symbols = dict(symbols if symbols is not None else SYMBOLS)
+        for i in itertools.count():
+            if len(self.symbols) >= listings:
+                break
+            self.symbols[f"COIN{i}-USDT"] = round(1.0 + i * 0.37, 4)
+        self.__phases = {symbol: float(i) for i, symbol in enumerate(self.symbols)}
+        self.__signer = Signer(secret_key) if secret_key is not None else None
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__faults: list[_Fault] = []
+        self.__recent: deque[float] = deque()
+        self.__order_ids = itertools.count(1_700_000_000_000_000_000)
+        self.__swap_orders: dict[int, dict[str, Any]] = {}
+        self.__spot_orders: dict[int, dict[str, Any]] = {}
+        self.__server: ThreadingHTTPServer | None = None
+        self.__routes: dict[tuple[str, str], Callable[[dict[str, Any]], Any]] = {
+            ("GET", "/openApi/swap/v2/server/time"): lambda params: {"serverTime": generate_timestamp()},
+            ("GET", "/openApi/swap/v2/quote/contracts"): self.__contracts,
+            ("GET", "/openApi/swap/v2/quote/price"): self.__prices,
+            ("GET", "/openApi/swap/v2/quote/depth"): lambda params: {"T": generate_timestamp(), **self.__depth(params, 20)},
+            ("GET", "/openApi/swap/v2/quote/trades"): self.__swap_trades,
+            ("GET", "/openApi/swap/v2/quote/premiumIndex"): self.__premium_index,
+            ("GET", "/openApi/swap/v2/quote/fundingRate"): self.__funding_rates,
+            ("GET", "/openApi/swap/v2/quote/klines"): self.__swap_klines,
+            ("GET", "/openApi/swap/v2/quote/openInterest"): lambda params: {"openInterest": "1250000.5", "symbol": self.__symbol(params), "time": generate_timestamp()},
+            ("GET", "/openApi/swap/v2/quote/ticker"): self.__tickers,
+            ("POST", "/openApi/swap/v2/trade/order"): lambda params: {"order": self.__create_swap_order(params)},
+            ("GET", "/openApi/swap/v2/trade/order"): lambda params: {"order": self.__find_order(self.__swap_orders, params)},
+            ("DELETE", "/openApi/swap/v2/trade/order"): lambda params: {"order": self.__cancel_order(self.__swap_orders, params, "CANCELLED")},
+            ("POST", "/openApi/swap/v2/trade/batchOrders"): lambda params: {"orders": [self.__create_swap_order(order) for order in params.get("batchOrders", [])]},
+            ("DELETE", "/openApi/swap/v2/trade/batchOrders"): self.__cancel_swap_orders,
+            ("DELETE", "/openApi/swap/v2/trade/allOpenOrders"): self.__cancel_swap_orders,
+            ("GET", "/openApi/swap/v2/trade/openOrders"): lambda params: {"orders": self.__orders(self.__swap_orders, params, ("NEW",))},
+            ("GET", "/openApi/swap/v2/trade/allOrders"): lambda params: {"orders": self.__orders(self.__swap_orders, params)},
+            ("GET", "/openApi/swap/v2/trade/forceOrders"): lambda params: {"orders": []},
+            ("POST", "/openApi/swap/v2/trade/closeAllPositions"): lambda params: {"success": [], "failed": None},
+            ("GET", "/openApi/swap/v2/trade/marginType"): lambda params: {"marginType": "CROSSED"},
+            ("POST", "/openApi/swap/v2/trade/marginType"): lambda params: {},
+            ("GET", "/openApi/swap/v2/trade/leverage"): lambda params: {"longLeverage": 10, "shortLeverage": 10, "maxLongLeverage": 125, "maxShortLeverage": 125},
+            ("POST", "/openApi/swap/v2/trade/leverage"): lambda params: {"leverage": int(params.get("leverage", 10)), "symbol": self.__symbol(params)},
+            ("POST", "/openApi/swap/v2/trade/positionMargin"): lambda params: {"amount": params.get("amount"), "type": params.get("type")},
+            ("GET", "/openApi/swap/v2/user/balance"): lambda params: {"balance": self.__swap_balance()},
+            ("GET", "/openApi/swap/v2/user/positions"): self.__positions,
+            ("GET", "/openApi/swap/v2/user/income"): self.__income,
+            ("GET", "/openApi/spot/v1/common/symbols"): self.__spot_symbols,
+            ("GET", "/openApi/spot/v1/market/trades"): self.__spot_trades,
+            ("GET", "/openApi/spot/v1/market/depth"): lambda params: self.__depth(params, 20),
+            ("GET", "/openApi/spot/v2/market/kline"): self.__spot_klines,
+            ("POST", "/openApi/spot/v1/trade/order"): self.__create_spot_order,
+            ("POST", "/openApi/spot/v1/trade/cancel"): lambda params: self.__cancel_order(self.__spot_orders, params, "CANCELED"),
+            ("GET", "/openApi/spot/v1/trade/query"): lambda params: self.__find_order(self.__spot_orders, params),
+            ("GET", "/openApi/spot/v1/trade/openOrders"): lambda params: {"orders": self.__orders(self.__spot_orders, params, ("NEW",))},
+            ("GET", "/openApi/spot/v1/trade/historyOrders"): lambda params: {"orders": self.__orders(self.__spot_orders, params)},
+            ("GET", "/openApi/spot/v1/account/balance"): lambda params: {"balances": [{"asset": "USDT", "free": "100000", "locked": "0"}] + [{"asset": symbol.split("-")[0], "free": "10", "locked": "0"} for symbol in list(self.symbols)[:20]]},
+            ("GET", "/openApi/contract/v1/allPosition"): self.__standard_positions,
+            ("GET", "/openApi/contract/v1/allOrders"): self.__standard_orders,
+            ("GET", "/openApi/contract/v1/balance"): lambda params: [{"asset": "USDT", "balance": "10000", "crossWalletBalance": "10000", "crossUnPnl": "0", "availableBalance": "10000", "maxWithdrawAmount": "10000"}],
+            ("POST", "/openApi/user/auth/userDataStream"): lambda params: MockResponse(200, json.dumps({"listenKey": f"{self.__random.getrandbits(256):064x}"}).encode()),
+            ("PUT", "/openApi/user/auth/userDataStream"): lambda params: MockResponse(200, b""),
+            ("DELETE", "/openApi/user/auth/userDataStream"): lambda params: MockResponse(200, b""),
+        }
+
+    def transport(self, **kwargs: Any) -> Transport:
+        """
+        It returns a transport sending every request to this exchange through its send hook
+
+        :param kwargs: The other arguments of the transport, i.e. rate_limiter or retry_policy
+        """
+
+        return Transport(base_url=self.BASE_URL, send_hook=self.send, **kwargs)
+
+    def async_transport(self, **kwargs: Any) -> Any:
+        """
+        It returns an AsyncTransport sending every request to this exchange through its send hook, requires httpx
+
+        :param kwargs: The other arguments of the transport, i.e. rate_limiter or retry_policy
+        """
+
+        from bingX.aio.transport import AsyncTransport
+
+        return AsyncTransport(base_url=self.BASE_URL, send_hook=self.async_send, **kwargs)
+
+    def fail(self, status_code: int, times: int = 1, endpoint: str | None = None, retry_after: float | None = None) -> None:
+        """
+        It answers the next requests with an HTTP error, i.e. 429 or 503
+
+        :param status_code: The status code of the answer
+        :param times: The number of requests answered with the error
+        :param endpoint: The endpoint of the requests, every endpoint if not given
+        :param retry_after: The Retry-After header of the answer
+        """
+
+        headers = {"Retry-After": str(retry_after)} if retry_after is not None else {}
+        with self.__lock:
+            self.__faults.append(_Fault(MockResponse(status_code, f"mock error {status_code}".encode(), headers), times, endpoint))
+
+    def reject(self, error_code: int, message: str = "", times: int = 1, endpoint: str | None = None) -> None:
+        """
+        It answers the next requests with an exchange error code in a 200 response, i.e. 100500
+
+        :param error_code: The code of the exchange error
+        :param message: The message of the exchange error
+        :param times: The number of requests answered with the error
+        :param endpoint: The endpoint of the requests, every endpoint if not given
+        """
+
+        with self.__lock:
+            self.__faults.append(_Fault(MockResponse(200, _envelope({}, error_code, message)), times, endpoint))
+
+    def handle(self, method: str, url: str, headers: dict[str, Any] = {}) -> MockResponse:
+        """
+        It answers a request immediately, without the latency
+
+        :param method: The HTTP method of the request
+        :param url: The url of the request, the path and the query string are used
+        :param headers: The headers of the request
+        """
+
+        parts = urlsplit(url)
+        endpoint, query_string = parts.path, parts.query
+        fault = self.__take_fault(endpoint)
+        if fault is not None:
+            return fault
+
+        route = self.__routes.get((method, endpoint))
+        if route is None:
+            return MockResponse(404, f"no route for {method} {endpoint}".encode())
+
+        try:
+            params = self.__verify(query_string)
+            data = route(params)
+        except _Rejection as e:
+            return MockResponse(200, _envelope({}, e.error_code, e.error_message))
+        if isinstance(data, MockResponse):
+            return data
+        return MockResponse(200, _envelope(data), {"Content-Type": "application/json"})
+
+    def send(self, method: str, url: str, headers: dict[str, Any]) -> MockResponse:
+        """
+        It answers a request after the latency, it is the send hook of Transport
+
+        :param method: The HTTP method of the request
+        :param url: The url of the request
+        :param headers: The headers of the request
+        """
+
+        delay = self.__delay()
+        if delay > 0:
+            time.sleep(delay)
+        return self.handle(method, url, headers)
+
+    async def async_send(self, method: str, url: str, headers: dict[str, Any]) -> MockResponse:
+        """
+        It answers a request after the latency without blocking the event loop, it is the send hook of AsyncTransport
+
+        :param method: The HTTP method of the request
+        :param url: The url of the request
+        :param headers: The headers of the request
+        """
+
+        delay = self.__delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self.handle(method, url, headers)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        It serves the exchange over HTTP/1.1 in a background thread and returns its base url
+
+        :param host: The address to listen on
+        :param port: The port to listen on, any free port if 0
+        """
+
+        exchange = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def answer(self) -> None:
+                response = exchange.send(self.command, self.path, dict(self.headers))
+                self.send_response(response.status_code)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(response.content)))
+                self.end_headers()
+                self.wfile.write(response.content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = answer
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 1024 # a burst of new connections overflows the default backlog of 5
+
+        self.__server = Server((host, port), Handler)
+        threading.Thread(target=self.__server.serve_forever, name="bingx-mock-exchange", daemon=True).start()
+        return f"http://{host}:{self.__server.server_address[1]}"
+
+    def close(self) -> None:
+        """
+        It stops serving over HTTP
+        """
+
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+
+    def __enter__(self) -> "MockExchange":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __delay(self) -> float:
+        return self.latency + (self.__random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def __take_fault(self, endpoint: str) -> MockResponse | None:
+        with self.__lock:
+            self.calls[endpoint] += 1
+            if self.max_requests_per_second is not None:
+                now = time.monotonic()
+                while self.__recent and self.__recent[0] <= now - 1.0:
+                    self.__recent.popleft()
+                if len(self.__recent) >= self.max_requests_per_second:
+                    return MockResponse(429, b"too many requests", {"Retry-After": "1"})
+                self.__recent.append(now)
+
+            for fault in self.__faults:
+                if fault.endpoint is None or fault.endpoint == endpoint:
+                    fault.times -= 1
+                    if fault.times <= 0:
+                        self.__faults.remove(fault)
+                    return fault.response
+        return None
+
+    def __verify(self, query_string: str) -> dict[str, Any]:
+        signed, _, signature = query_string.partition("&signature=")
+        if self.__signer is not None and signature and not hmac.compare_digest(self.__signer.sign(unquote(signed)), signature):
+            raise _Rejection(SIGNATURE_ERROR_CODE, "Signature verification failed")
+
+        params: dict[str, Any] = {}
+        for key, value in parse_qsl(signed, keep_blank_values=True):
+            params[key] = json.loads(value) if value[:1] in ("[", "{") else value
+        return params
+
+    def __symbol(self, params: dict[str, Any]) -> str:
+        symbol = params.get("symbol", "")
+        if symbol not in self.symbols:
+            raise _Rejection(INVALID_PARAMETER_ERROR_CODE, f"symbol {symbol} does not exist")
+        return symbol
+
+    def __price(self, symbol: str, timestamp: int | None = None) -> float:
+        # a slow wave per symbol, so klines of overlapping requests agree
+        timestamp = timestamp if timestamp is not None else generate_timestamp()
+        return round(self.symbols[symbol] * (1 + 0.02 * math.sin(timestamp / 3_600_000 + self.__phases[symbol])), _decimals(self.symbols[symbol]))
+
+    def __contracts(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        return [
+            {
+                "contractId": str(100 + i), "symbol": symbol, "size": "0.0001", "quantityPrecision": 4 if price >= 1000 else 2 if price >= 1 else 0,
+                "pricePrecision": _decimals(price), "feeRate": 0.0005, "tradeMinLimit": 1, "tradeMinQuantity": 0.0001 if price >= 1000 else 0.01 if price >= 1 else 1,
+                "tradeMinUSDT": 2, "currency": "USDT", "asset": symbol.split("-")[0], "status": 1, "apiStateOpen": "true", "apiStateClose": "true",
+            }
+            for i, (symbol, price) in enumerate(self.symbols.items())
+        ]
+
+    def __spot_symbols(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {"symbols": [
+            {
+                "symbol": symbol, "tickSize": 10.0 ** -_decimals(price), "stepSize": 0.0001 if price >= 1000 else 0.01 if price >= 1 else 1,
+                "minQty": 0.0001 if price >= 1000 else 0.01 if price >= 1 else 1, "maxQty": 100000, "minNotional": 5, "maxNotional": 1000000, "status": 1,
+            }
+            for symbol, price in self.symbols.items()
+        ]}
+
+    def __prices(self, params: dict[str, Any]) -> Any:
+        now = generate_timestamp()
+        if params.get("symbol"):
+            symbol = self.__symbol(params)
+            return {"symbol": symbol, "price": str(self.__price(symbol, now)), "time": now}
+        return [{"symbol": symbol, "price": str(self.__price(symbol, now)), "time": now} for symbol in self.symbols]
+
+    def __tickers(self, params: dict[str, Any]) -> Any:
+        now = generate_timestamp()
+
+        def ticker(symbol: str) -> dict[str, Any]:
+            last, open_price = self.__price(symbol, now), self.__price(symbol, now - 86_400_000)
+            return {
+                "symbol": symbol, "priceChange": str(round(last - open_price, 8)), "priceChangePercent": str(round((last / open_price - 1) * 100, 3)),
+                "lastPrice": str(last), "lastQty": "0.5", "highPrice": str(max(last, open_price) * 1.01), "lowPrice": str(min(last, open_price) * 0.99),
+                "volume": "152340.2", "quoteVolume": str(round(152340.2 * last, 2)), "openPrice": str(open_price), "openTime": now - 86_400_000, "closeTime": now,
+            }
+
+        if params.get("symbol"):
+            return ticker(self.__symbol(params))
+        return [ticker(symbol) for symbol in self.symbols]
+
+    def __depth(self, params: dict[str, Any], default_limit: int) -> dict[str, Any]:
+        symbol = self.__symbol(params)
+        limit = int(params.get("limit", default_limit))
+        decimals = _decimals(self.symbols[symbol])
+        tick = 10.0 ** -decimals
+        mid = self.__price(symbol)
+        bids = [[f"{mid - (i + 1) * tick:.{decimals}f}", f"{self.__random.uniform(0.01, 25):.4f}"] for i in range(limit)]
+        asks = [[f"{mid + (i + 1) * tick:.{decimals}f}", f"{self.__random.uniform(0.01, 25):.4f}"] for i in range(limit)]
+        return {"bids": bids, "asks": asks}
+
+    def __trades(self, params: dict[str, Any], default_limit: int) -> list[tuple[int, float, float, bool]]:
+        symbol = self.__symbol(params)
+        now = generate_timestamp()
+        limit = int(params.get("limit", default_limit))
+        return [(now - i * 37, self.__price(symbol, now - i * 37), round(self.__random.uniform(0.001, 3), 4), self.__random.random() < 0.5) for i in range(limit)]
+
+    def __swap_trades(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        return [{"time": t, "isBuyerMaker": maker, "price": str(price), "qty": str(qty), "quoteQty": str(round(price * qty, 4))} for t, price, qty, maker in self.__trades(params, 500)]
+
+    def __spot_trades(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        return [{"id": 90_000_000 + t % 10_000_000, "price": price, "qty": qty, "time": t, "buyerMaker": maker} for t, price, qty, maker in self.__trades(params, 100)]
+
+    def __premium_index(self, params: dict[str, Any]) -> Any:
+        now = generate_timestamp()
+
+        def index(symbol: str) -> dict[str, Any]:
+            price = self.__price(symbol, now)
+            return {"symbol": symbol, "markPrice": str(price), "indexPrice": str(price), "lastFundingRate": "0.0001", "nextFundingTime": now - now % 28_800_000 + 28_800_000}
+
+        if params.get("symbol"):
+            return index(self.__symbol(params))
+        return [index(symbol) for symbol in self.symbols]
+
+    def __funding_rates(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        symbol = self.__symbol(params)
+        now = generate_timestamp()
+        last = now - now % 28_800_000
+        return [{"symbol": symbol, "fundingRate": f"{0.0001 * math.cos(i):.6f}", "fundingTime": last - i * 28_800_000} for i in range(int(params.get("limit", 100)))]
+
+    def __candles(self, params: dict[str, Any]) -> list[tuple[int, float, float, float, float, float]]:
+        symbol = self.__symbol(params)
+        interval = params.get("interval")
+        if interval not in INTERVALS:
+            raise _Rejection(INVALID_PARAMETER_ERROR_CODE, f"interval {interval} is not supported")
+        interval_ms = INTERVALS[interval]
+        limit = min(int(params.get("limit", 500)), 1440)
+        now = generate_timestamp()
+        end = min(int(params.get("endTime", now)), now)
+        if params.get("startTime"):
+            first = -(-int(params["startTime"]) // interval_ms) * interval_ms
+        else:
+            first = (end // interval_ms - limit + 1) * interval_ms
+        open_times = range(first, min(end, first + limit * interval_ms - 1) + 1, interval_ms)
+
+        decimals = _decimals(self.symbols[symbol])
+        candles = []
+        for open_time in open_times:
+            open_price, close = self.__price(symbol, open_time), self.__price(symbol, open_time + interval_ms)
+            spread = abs(close - open_price) * 0.5 + self.symbols[symbol] * 0.0005
+            high, low = round(max(open_price, close) + spread, decimals), round(min(open_price, close) - spread, decimals)
+            candles.append((open_time, open_price, high, low, close, 100.0 + open_time // interval_ms % 97))
+        return candles
+
+    def __swap_klines(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        return [{"open": str(o), "close": str(c), "high": str(h), "low": str(l), "volume": str(v), "time": t} for t, o, h, l, c, v in self.__candles(params)]
+
+    def __spot_klines(self, params: dict[str, Any]) -> list[list[Any]]:
+        interval_ms = INTERVALS.get(params.get("interval"), 0)
+        return [[t, o, h, l, c, v, t + interval_ms - 1, round(v * c, 4)] for t, o, h, l, c, v in self.__candles(params)]
+
+    def __create_swap_order(self, params: dict[str, Any]) -> dict[str, Any]:
+        symbol = self.__symbol(params)
+        filled = params.get("type", "MARKET") == "MARKET"
+        price = float(params.get("price") or self.__price(symbol))
+        quantity = float(params.get("quantity") or 0)
+        if quantity <= 0:
+            raise _Rejection(INVALID_PARAMETER_ERROR_CODE, "quantity must be positive")
+        now = generate_timestamp()
+        order = {
+            "symbol": symbol, "orderId": next(self.__order_ids), "clientOrderId": params.get("clientOrderID", ""), "side": params.get("side", "BUY"),
+            "positionSide": params.get("positionSide", "BOTH"), "type": params.get("type", "MARKET"), "status": "FILLED" if filled else "NEW",
+            "time": now, "updateTime": now, "price": str(price), "stopPrice": str(params.get("stopPrice", "")), "origQty": str(quantity),
+            "executedQty": str(quantity if filled else 0), "avgPrice": str(price if filled else 0), "cumQuote": str(round(price * quantity, 8) if filled else 0),
+            "profit": "0", "commission": str(round(-0.0005 * price * quantity, 8) if filled else 0),
+        }
+        with self.__lock:
+            self.__swap_orders[order["orderId"]] = order
+        return order
+
+    def __create_spot_order(self, params: dict[str, Any]) -> dict[str, Any]:
+        symbol = self.__symbol(params)
+        filled = params.get("type", "MARKET") == "MARKET"
+        price = float(params.get("price") or self.__price(symbol))
+        quantity = float(params.get("quantity") or 0) or float(params.get("quoteOrderQty") or 0) / price
+        if quantity <= 0:
+            raise _Rejection(INVALID_PARAMETER_ERROR_CODE, "quantity must be positive")
+        now = generate_timestamp()
+        order = {
+            "symbol": symbol, "orderId": next(self.__order_ids), "clientOrderID": params.get("newClientOrderId", ""), "transactTime": now,
+            "time": now, "updateTime": now, "price": str(price), "origQty": str(quantity), "executedQty": str(quantity if filled else 0),
+            "cummulativeQuoteQty": str(round(price * quantity, 8) if filled else 0), "status": "FILLED" if filled else "NEW",
+            "type": params.get("type", "MARKET"), "side": params.get("side", "BUY"),
+        }
+        with self.__lock:
+            self.__spot_orders[order["orderId"]] = order
+        return order
+
+    def __find_order(self, orders: dict[int, dict[str, Any]], params: dict[str, Any]) -> dict[str, Any]:
+        client_order_id = params.get("clientOrderId") or params.get("clientOrderID")
+        with self.__lock:
+            if params.get("orderId"):
+                order = orders.get(int(params["orderId"]))
+            else:
+                order = next((order for order in orders.values() if client_order_id and client_order_id in (order.get("clientOrderId"), order.get("clientOrderID"))), None)
+        if order is None:
+            raise _Rejection(ORDER_NOT_FOUND_ERROR_CODE, "order not exist")
+        return order
+
+    def __cancel_order(self, orders: dict[int, dict[str, Any]], params: dict[str, Any], status: str) -> dict[str, Any]:
+        order = self.__find_order(orders, params)
+        with self.__lock:
+            if order["status"] != "NEW":
+                raise _Rejection(ORDER_NOT_FOUND_ERROR_CODE, f"order {order['orderId']} is {order['status']}")
+            order["status"], order["updateTime"] = status, generate_timestamp()
+        return order
+
+    def __cancel_swap_orders(self, params: dict[str, Any]) -> dict[str, Any]:
+        symbol = self.__symbol(params)
+        if "orderIdList" in params:
+            order_ids = [int(order_id) for order_id in params["orderIdList"]]
+        else:
+            order_ids = [order["orderId"] for order in self.__orders(self.__swap_orders, params, ("NEW",))]
+
+        success, failed = [], []
+        for order_id in order_ids:
+            try:
+                success.append(self.__cancel_order(self.__swap_orders, {"orderId": order_id, "symbol": symbol}, "CANCELLED"))
+            except _Rejection as e:
+                failed.append({"orderId": order_id, "errorCode": e.error_code, "errorMessage": e.error_message})
+        return {"success": success, "failed": failed or None}
+
+    def __orders(self, orders: dict[int, dict[str, Any]], params: dict[str, Any], statuses: tuple[str, ...] | None = None) -> list[dict[str, Any]]:
+        symbol = params.get("symbol")
+        with self.__lock:
+            return [order for order in orders.values() if (not symbol or order["symbol"] == symbol) and (statuses is None or order["status"] in statuses)]
+
+    def __swap_balance(self) -> dict[str, Any]:
+        return {
+            "asset": "USDT", "balance": "10000.0000", "equity": "10012.3400", "unrealizedProfit": "12.3400", "realisedProfit": "-3.2100",
+            "availableMargin": "9500.0000", "usedMargin": "500.0000", "freezedMargin": "0.0000",
+        }
+
+    def __positions(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        symbols = [self.__symbol(params)] if params.get("symbol") else list(self.symbols)[:3]
+        return [
+            {
+                "symbol": symbol, "positionId": str(1_600_000_000 + i), "positionSide": "LONG", "isolated": False, "leverage": 10,
+                "positionAmt": "1.0", "availableAmt": "1.0", "avgPrice": str(self.symbols[symbol]), "initialMargin": str(self.symbols[symbol] / 10),
+                "unrealizedProfit": str(round(self.__price(symbol) - self.symbols[symbol], 4)), "realisedProfit": "0",
+            }
+            for i, symbol in enumerate(symbols)
+        ]
+
+    def __income(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        now = generate_timestamp()
+        symbols = list(self.symbols)
+        return [
+            {"symbol": symbols[i % 3], "incomeType": "FUNDING_FEE", "income": f"{-0.01 * (i % 7):.4f}", "asset": "USDT", "info": "", "time": now - i * 28_800_000, "tranId": str(i), "tradeId": ""}
+            for i in range(int(params.get("limit", 100)))
+        ]
+
+    def __standard_positions(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        now = generate_timestamp()
+        return [
+            {"currentPrice": self.__price(symbol), "symbol": symbol, "initialMargin": 100, "unrealizedProfit": 0.5, "leverage": 10, "isolated": True,
+             "entryPrice": self.symbols[symbol], "positionSide": "LONG", "positionAmt": 0.1, "updateTime": now}
+            for symbol in list(self.symbols)[:3]
+        ]
+
+    def __standard_orders(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        now = generate_timestamp()
+        symbols = list(self.symbols)
+        return [
+            {"orderId": 1_000 + i, "symbol": symbols[i % 3], "side": "BUY" if i % 2 else "SELL", "type": "MARKET", "price": self.symbols[symbols[i % 3]],
+             "quantity": 0.1, "status": "FILLED", "time": now - i * 60_000, "updateTime": now - i * 60_000}
+            for i in range(int(params.get("limit", 100)))
+        ]
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+
+import requests
+
+
+class TimeSync:
+    """
+    It keeps the offset between the local clock and the exchange server time.
+
+    Every sync takes several samples of the server time and keeps the one with the lowest round trip time,
+    assuming the server read its clock halfway through that round trip. A daemon thread repeats the sync
+    every `refresh_interval` seconds.
+    """
+
+    BASE_URL = "https://open-api.bingx.com"
+    ENDPOINT = "/openApi/swap/v2/server/time"
+
+    def __init__(self, base_url: str = BASE_URL, samples: int = 5, refresh_interval: float = 60.0, timeout: float = 5.0) -> None:
+        """
+        :param base_url: The url of the exchange api
+        :param samples: The number of server time requests per sync
+        :param refresh_interval: The number of seconds between syncs, 0 to sync only when sync is called
+        :param timeout: The timeout of each server time request
+        """
+
+        self.base_url = base_url
+        self.offset = 0.0
+        self.round_trip_time: float | None = None
+        self.last_sync: float | None = None
+        self.__samples = samples
+        self.__refresh_interval = refresh_interval
+        self.__timeout = timeout
+        self.__session = requests.Session()
+        self.__stop = threading.Event()
+        self.__thread: threading.Thread | None = None
+
+    def now(self) -> int:
+        """
+        It returns the exchange server time in milliseconds
+        """
+
+        return int(time.time() * 10 ** 3 + self.offset)
+
+    def sync(self) -> float:
+        """
+        It measures the offset to the server time and returns it in milliseconds
+        """
+
+        best: tuple[float, float] | None = None
+        for _ in range(self.__samples):
+            try:
+                sent = time.time() * 10 ** 3
+                response = self.__session.get(f"{self.base_url}{self.ENDPOINT}", timeout=self.__timeout)
+                received = time.time() * 10 ** 3
+                server_time = response.json()["data"]["serverTime"]
+            except (requests.RequestException, ValueError, KeyError, TypeError):
+                continue
+
+            round_trip_time = received - sent
+            if best is None or round_trip_time < best[0]:
+                best = (round_trip_time, server_time - (sent + received) / 2)
+
+        if best is not None:
+            self.round_trip_time, self.offset = best
+            self.last_sync = time.monotonic()
+        return self.offset
+
+    def start(self) -> None:
+        """
+        It syncs once and starts refreshing the offset in the background
+        """
+
+        self.sync()
+        self.__start_refresh()
+
+    async def start_async(self) -> None:
+        """
+        It syncs once, without blocking the event loop, and starts refreshing the offset in the background
+        """
+
+        await asyncio.to_thread(self.sync)
+        self.__start_refresh()
+
+    def __start_refresh(self) -> None:
+        if self.__refresh_interval > 0 and self.__thread is None:
+            self.__stop.clear()
+            self.__thread = threading.Thread(target=self.__refresh, name="bingx-time-sync", daemon=True)
+            self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        It stops the background refresh
+        """
+
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __refresh(self) -> None:
+        while not self.__stop.wait(self.__refresh_interval):
+            self.sync()
@@ -0,0 +1,202 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+from bingX._helpers import JSONDecoder, generate_timestamp, get_json_decoder
+from bingX.exceptions import NetworkError
+from bingX.instrumentation import HTTPXTrace, Instrument, RequestRecord
+from bingX.keep_warm import KeepWarm
+from bingX.rate_limiter import RateLimiter
+from bingX.retry import RetryPolicy
+from bingX.time_sync import TimeSync
+
+RATE_LIMITED_STATUS_CODES = (429, 418)
+# (method, url, headers) -> a response with status_code, content, text and headers
+SendHook = Callable[[str, str, dict[str, Any]], Any]
+
+
+def retry_after(headers: Any, status_code: int) -> float:
+    """
+    It returns the number of seconds to hold requests after a 429 or a 418 response
+
+    :param headers: The headers of the response
+    :param status_code: The status code of the response
+    """
+
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return 1.0 if status_code == 429 else 60.0
+
+
+class Transport:
+    """
+    A pooled HTTP transport shared by every sub-client of a BingX instance.
+
+    All sub-clients borrow the same requests.Session, so a process holding many clients
+    keeps a single, bounded connection pool to the exchange instead of one per sub-client.
+    With http2=True an httpx.Client is used instead, and concurrent requests from every thread are
+    multiplexed over one HTTP/2 connection per host.
+    """
+
+    BASE_URL = "https://open-api.bingx.com"
+    PREWARM_ENDPOINT = "/openApi/swap/v2/server/time"
+
+    _default: "Transport | None" = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 10, pool_block: bool = True, prewarm: int = 0, base_url: str = BASE_URL, rate_limiter: RateLimiter | None = None, retry_policy: RetryPolicy | None = None, time_sync: TimeSync | None = None, json_decoder: JSONDecoder | None = None, http2: bool = False, session_factory: Callable[[], Any] | None = None, send_hook: SendHook | None = None, instruments: list[Instrument] | None = None, keep_warm: KeepWarm | None = None) -> None:
+        """
+        :param pool_connections: The number of per-host connection pools to cache
+        :param pool_maxsize: The maximum number of keep-alive connections per host
+        :param pool_block: If True, never open more than pool_maxsize sockets per host and wait for a free one instead
+        :param prewarm: The number of connections to open on construction, 0 to connect lazily
+        :param base_url: The url of the exchange api
+        :param rate_limiter: The rate limiter of every request sent through this transport, one with the default budgets if not given
+        :param retry_policy: The timeouts and retries of every request sent through this transport, the default policy if not given
+        :param time_sync: If given, requests are stamped with the exchange server time instead of the local time
+        :param json_decoder: The function decoding response bodies, the fastest installed JSON library if not given
+        :param http2: If True, send requests over HTTP/2 with httpx, requires pip install python-bingx[http2]
+        :param session_factory: A function returning the session requests are sent through (an httpx.Client with http2=True), the pooled session if not given
+        :param send_hook: A function sending every request instead of the session, i.e. bingX.testing.MockExchange.send
+        :param instruments: The hooks called before and after every request, requests are not timed if not given
+        :param keep_warm: If given, it opens its number of connections on construction and keeps them alive with periodic pings
+        """
+
+        self.base_url = base_url
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.time_sync = time_sync
+        self.json_decoder = json_decoder if json_decoder is not None else get_json_decoder()
+        if time_sync is not None:
+            time_sync.start()
+        self.pool_maxsize = pool_maxsize
+        self.http2 = http2
+        self.send_hook = send_hook
+        self.instruments = list(instruments) if instruments else []
+        if session_factory is not None:
+            self.session = session_factory()
+        elif http2:
+            import httpx
+
+            timeout = httpx.Timeout(self.retry_policy.read_timeout, connect=self.retry_policy.connect_timeout, pool=None)
+            # plain http has no protocol negotiation, HTTP/2 is then spoken with prior knowledge
+            self.session = httpx.Client(http1=not base_url.startswith("http://"), http2=True, limits=httpx.Limits(max_connections=pool_maxsize), timeout=timeout)
+        else:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+        if prewarm > 0:
+            self.prewarm(prewarm)
+        self.keep_warm = keep_warm
+        if keep_warm is not None:
+            keep_warm.start(self)
+
+    @classmethod
+    def default(cls) -> "Transport":
+        """
+        It returns the process-wide transport used by clients that were not given one
+        """
+
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    def prewarm(self, connections: int) -> None:
+        """
+        It opens the given number of connections concurrently, so the first real requests skip DNS, TCP and TLS setup
+
+        :param connections: The number of connections to open, capped at pool_maxsize
+        """
+
+        connections = min(connections, self.pool_maxsize)
+        url = f"{self.base_url}{self.PREWARM_ENDPOINT}"
+
+        def warm(_: int) -> None:
+            try:
+                self.__send("GET", url, {})
+            except NetworkError: # pre-warming is best effort
+                pass
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(executor.map(warm, range(connections)))
+
+    def timestamp(self) -> int:
+        """
+        It returns the timestamp of a new request in milliseconds, corrected by the time sync if there is one
+        """
+
+        return self.time_sync.now() if self.time_sync is not None else generate_timestamp()
+
+    def request(self, method: str, endpoint: str, query_string: str, headers: dict[str, Any] = {}, record: RequestRecord | None = None) -> Any:
+        """
+        It waits for the rate limiter and sends a request through the shared session, it returns a requests or an httpx response
+
+        :param method: The HTTP method to use (GET, POST, PUT, DELETE)
+        :param endpoint: The endpoint you want to hit i.e. /openApi/swap/v2/trade/order
+        :param query_string: The signed query string of the request
+        :param headers: The headers of this request only, they are not stored on the shared session
+        """
+
+        waited = self.rate_limiter.acquire(method, endpoint)
+        if record is None:
+            response = self.__send(method, f"{self.base_url}{endpoint}?{query_string}", headers)
+        else:
+            record.add("rate_limit", waited)
+            started = time.perf_counter()
+            response = self.__send(method, f"{self.base_url}{endpoint}?{query_string}", headers, record)
+            record.add("send", time.perf_counter() - started)
+            record.status_code = response.status_code
+            record.response_bytes += len(response.content)
+        if response.status_code in RATE_LIMITED_STATUS_CODES:
+            self.rate_limiter.penalize(retry_after(response.headers, response.status_code))
+        return response
+
+    def __send(self, method: str, url: str, headers: dict[str, Any], record: RequestRecord | None = None) -> Any:
+        if self.send_hook is not None:
+            return self.send_hook(method, url, headers)
+        if self.http2:
+            import httpx
+
+            try:
+                if record is not None:
+                    return self.session.request(method, url, headers=headers, extensions={"trace": HTTPXTrace(record)})
+                return self.session.request(method, url, headers=headers)
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                raise NetworkError(str(e), request_sent=False) from e
+            except httpx.TransportError as e:
+                raise NetworkError(str(e), request_sent=True) from e
+
+        timeout = (self.retry_policy.connect_timeout, self.retry_policy.read_timeout)
+        try:
+            response = self.session.request(method, url, headers=headers, timeout=timeout)
+        except requests.ConnectTimeout as e:
+            raise NetworkError(str(e), request_sent=False) from e
+        except requests.ConnectionError as e:
+            reason = getattr(e.args[0], "reason", None) if e.args else None
+            raise NetworkError(str(e), request_sent=not isinstance(reason, NewConnectionError)) from e
+        except requests.Timeout as e:
+            raise NetworkError(str(e), request_sent=True) from e
+        if record is not None: # requests measures from sending, including the connection, until the response headers
+            record.add("ttfb", response.elapsed.total_seconds())
+        return response
+
+    def close(self) -> None:
+        """
+        It stops the keep-warm pings and the time sync refresh and closes every pooled connection
+        """
+
+        if self.keep_warm is not None:
+            self.keep_warm.stop()
+        if self.time_sync is not None:
+            self.time_sync.stop()
+        self.session.close()
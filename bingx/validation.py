@@ -0,0 +1,260 @@
+import math
+from dataclasses import dataclass, replace
+from typing import Any
+
+from bingX.exceptions import OrderValidationError
+from bingX.reference import ReferenceDataCache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _decimals(size: float) -> int:
+    """
+    It returns the number of decimals of a tick or step size, i.e. 2 for 0.01 and 1 for 0.5
+    """
+
+    digits = f"{size:.12f}".rstrip("0").split(".")[1]
+    return len(digits)
+
+
+def _precision_size(precision: Any) -> float | None:
+    return 10.0 ** -int(precision) if precision is not None else None
+
+
+@dataclass(frozen=True)
+class SymbolFilters:
+    symbol: str
+    tick_size: float | None = None
+    step_size: float | None = None
+    min_quantity: float = 0.0
+    max_quantity: float = math.inf
+    min_notional: float = 0.0
+    max_notional: float = math.inf
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> "SymbolFilters":
+        """
+        It reads the filters of a spot symbol or of a perpetual v1 or v2 contract
+
+        :param record: One record of get_symbols or get_contract_info
+        """
+
+        def number(*keys: str, default: float) -> float:
+            for key in keys:
+                if record.get(key) not in (None, ""):
+                    return float(record[key])
+            return default
+
+        tick_size = number("tickSize", default=0.0) or _precision_size(record.get("pricePrecision"))
+        step_size = number("stepSize", default=0.0) or _precision_size(record.get("quantityPrecision", record.get("volumePrecision")))
+        return cls(
+            symbol=record["symbol"],
+            tick_size=tick_size,
+            step_size=step_size,
+            min_quantity=number("minQty", "tradeMinQuantity", "tradeMinLimit", default=0.0),
+            max_quantity=number("maxQty", default=math.inf),
+            min_notional=number("minNotional", "tradeMinUSDT", default=0.0),
+            max_notional=number("maxNotional", default=math.inf),
+        )
+
+    def snap_price(self, price: float) -> float:
+        """
+        It returns the price rounded to the nearest tick
+
+        :param price: The price to round
+        """
+
+        if self.tick_size is None:
+            return price
+        return round(round(price / self.tick_size) * self.tick_size, _decimals(self.tick_size))
+
+    def snap_quantity(self, quantity: float) -> float:
+        """
+        It returns the quantity rounded down to the step size, so an order never grows
+
+        :param quantity: The quantity to round
+        """
+
+        if self.step_size is None:
+            return quantity
+        return round(math.floor(quantity / self.step_size + 1e-9) * self.step_size, _decimals(self.step_size))
+
+    def check(self, quantity: float | None, price: float | None, quote_quantity: float | None = None) -> str | None:
+        """
+        It returns the reason the snapped values break the filters, None if they do not
+
+        :param quantity: The snapped quantity
+        :param price: The snapped price, None for market orders
+        :param quote_quantity: The quote quantity of spot market buys
+        """
+
+        if quantity is not None:
+            if quantity <= 0 or quantity < self.min_quantity:
+                return f"quantity {quantity} is below the minimum {self.min_quantity} of {self.symbol}"
+            if quantity > self.max_quantity:
+                return f"quantity {quantity} is above the maximum {self.max_quantity} of {self.symbol}"
+        if price is not None and price <= 0:
+            return f"price {price} of {self.symbol} must be positive"
+        notional = quote_quantity if quote_quantity is not None else quantity * price if quantity is not None and price is not None else None
+        if notional is not None:
+            if notional < self.min_notional:
+                return f"notional {notional} is below the minimum {self.min_notional} of {self.symbol}"
+            if notional > self.max_notional:
+                return f"notional {notional} is above the maximum {self.max_notional} of {self.symbol}"
+        return None
+
+
+class OrderValidator:
+    """
+    It snaps the price and the quantity of orders to the tick and step size of their symbol and rejects orders
+    that the exchange would reject (unknown symbol, quantity or notional out of bounds), without sending them.
+
+    Filters come from a ReferenceDataCache, so validating does not send requests on the hot path. Batches are
+    validated one symbol at a time with NumPy when it is installed.
+    """
+
+    PRICE_FIELDS = ("price", "stop_price")
+
+    def __init__(self, reference: ReferenceDataCache) -> None:
+        """
+        :param reference: The cache of the contracts or symbols of the market the orders are sent to
+        """
+
+        self.reference = reference
+        self.__filters: dict[str, tuple[dict[str, Any], SymbolFilters]] = {}
+
+    @classmethod
+    def from_perpetual_v2(cls, market: Any, ttl: float = 300.0) -> "OrderValidator":
+        """
+        It creates a validator of perpetual v2 orders
+
+        :param market: A perpetual v2 Market client
+        :param ttl: The number of seconds after which the contracts are refreshed in the background
+        """
+
+        return cls(ReferenceDataCache.from_perpetual_v2(market, ttl))
+
+    @classmethod
+    def from_spot(cls, market: Any, ttl: float = 300.0) -> "OrderValidator":
+        """
+        It creates a validator of spot orders
+
+        :param market: A spot Market client
+        :param ttl: The number of seconds after which the symbols are refreshed in the background
+        """
+
+        return cls(ReferenceDataCache.from_spot(market, ttl))
+
+    def filters(self, symbol: str) -> SymbolFilters:
+        """
+        It returns the filters of a symbol
+
+        :param symbol: The symbol of the order i.e. BTC-USDT
+        """
+
+        record = self.reference.get(symbol)
+        if record is None:
+            raise OrderValidationError(f"{symbol} is not listed")
+        cached = self.__filters.get(symbol)
+        if cached is None or cached[0] is not record: # the reference data was refreshed
+            cached = self.__filters[symbol] = (record, SymbolFilters.from_record(record))
+        return cached[1]
+
+    def validate(self, order: Any) -> Any:
+        """
+        It returns a copy of a perpetual v2 or spot order with its price and quantity snapped to the filters of its symbol
+
+        :param order: The order to validate
+        :raises OrderValidationError: If the order breaks the filters of its symbol
+        """
+
+        filters = self.filters(order.symbol)
+        changes = {name: filters.snap_price(getattr(order, name)) for name in self.PRICE_FIELDS if getattr(order, name, None) is not None}
+        if order.quantity is not None:
+            changes["quantity"] = filters.snap_quantity(order.quantity)
+
+        reason = filters.check(changes.get("quantity"), changes.get("price"), getattr(order, "quote_order_qty", None))
+        if reason is not None:
+            raise OrderValidationError(reason)
+        return replace(order, **changes)
+
+    def validate_batch(self, orders: list[Any]) -> list[Any]:
+        """
+        It validates a batch of orders, rounding every order of a symbol at once with NumPy when it is installed
+
+        :param orders: The orders to validate
+        :raises OrderValidationError: If any order breaks the filters of its symbol, with the reason of every invalid order in errors
+        """
+
+        if np is None:
+            return self.__validate_each(orders)
+
+        by_symbol: dict[str, list[int]] = {}
+        for index, order in enumerate(orders):
+            by_symbol.setdefault(order.symbol, []).append(index)
+
+        errors: dict[int, str] = {}
+        validated: list[Any] = list(orders)
+        for symbol, indexes in by_symbol.items():
+            try:
+                filters = self.filters(symbol)
+            except OrderValidationError as e:
+                errors.update((index, e.error_message) for index in indexes)
+                continue
+
+            group = [orders[index] for index in indexes]
+            columns = {name: self.__snap(np.array([_or_nan(getattr(order, name, None)) for order in group]), filters.tick_size, np.rint) for name in self.PRICE_FIELDS}
+            quantity = self.__snap(np.array([_or_nan(order.quantity) for order in group]), filters.step_size, _floor)
+            quote_quantity = np.array([_or_nan(getattr(order, "quote_order_qty", None)) for order in group])
+            price = columns["price"]
+            notional = np.where(np.isnan(quote_quantity), quantity * price, quote_quantity)
+            invalid = (
+                (quantity <= 0) | (quantity < filters.min_quantity) | (quantity > filters.max_quantity) | (price <= 0)
+                | (notional < filters.min_notional) | (notional > filters.max_notional)
+            ) # comparisons with NaN are False, so missing values pass
+
+            for position, index in enumerate(indexes):
+                if invalid[position]:
+                    errors[index] = filters.check(_or_none(quantity[position]), _or_none(price[position]), _or_none(quote_quantity[position])) or "invalid order"
+                    continue
+                changes = {name: float(column[position]) for name, column in columns.items() if not np.isnan(column[position])}
+                if not np.isnan(quantity[position]):
+                    changes["quantity"] = float(quantity[position])
+                validated[index] = replace(group[position], **changes)
+
+        if errors:
+            raise OrderValidationError(f"{len(errors)} of {len(orders)} orders are invalid", errors)
+        return validated
+
+    def __validate_each(self, orders: list[Any]) -> list[Any]:
+        errors: dict[int, str] = {}
+        validated: list[Any] = []
+        for index, order in enumerate(orders):
+            try:
+                validated.append(self.validate(order))
+            except OrderValidationError as e:
+                errors[index] = e.error_message
+        if errors:
+            raise OrderValidationError(f"{len(errors)} of {len(orders)} orders are invalid", errors)
+        return validated
+
+    @staticmethod
+    def __snap(values: Any, size: float | None, rounding: Any) -> Any:
+        if size is None:
+            return values
+        return np.round(rounding(values / size) * size, _decimals(size))
+
+
+def _floor(values: Any) -> Any:
+    return np.floor(values + 1e-9)
+
+
+def _or_nan(value: float | None) -> float:
+    return float(value) if value is not None else math.nan
+
+
+def _or_none(value: float) -> float | None:
+    return None if math.isnan(value) else float(value)
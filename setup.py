@@ -23,6 +23,14 @@ setup(
     install_requires=[
         'requests', 'websockets'
     ],
+    extras_require={
+        'async': ['httpx'],
+        'fast': ['orjson'],
+        'numpy': ['numpy'],
+        'http2': ['httpx[http2]'],
+        'prometheus': ['prometheus_client'],
+        'opentelemetry': ['opentelemetry-api'],
+    },
     keywords='bingx exchange rest api bitcoin ethereum btc eth',
     classifiers=[
         'Intended Audience :: Developers',
@@ -0,0 +1,21 @@
+import inspect
+
+import pytest
+
+from bingX.aio import AsyncBingX, AsyncTransport
+
+
+class TestAsyncBingX:
+    @pytest.fixture
+    def client(self) -> AsyncBingX:
+        return AsyncBingX("api_key", "secret_key", AsyncTransport())
+
+    def test_sub_clients_share_transport(self, client: AsyncBingX):
+        http_manager = client.perpetual_v2.market._Market__http_manager
+        assert http_manager._AsyncHTTPManager__transport is client.transport
+        assert client.spot.transfer._Transfer__http_manager._AsyncHTTPManager__transport is client.transport
+
+    def test_methods_are_coroutines(self, client: AsyncBingX):
+        assert inspect.iscoroutinefunction(client.perpetual_v2.market.get_market_depth)
+        assert inspect.iscoroutinefunction(client.spot.trade.create_order)
+        assert inspect.iscoroutinefunction(client.standard.get_all_positions)
@@ -0,0 +1,116 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+import pytest_asyncio
+import websockets
+
+from bingX.stream import MarketStream, MarketType, StreamEvent
+
+
+class TestMarketStream:
+    def test_stream_event(self):
+        event = StreamEvent("BTC-USDT@depth20", {})
+        assert event.symbol == "BTC-USDT"
+        assert event.channel == "depth20"
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_are_multiplexed(self):
+        stream = MarketStream(MarketType.SWAP, max_subscriptions_per_connection=2)
+        await stream.subscribe_trade("btc-usdt")
+        await stream.subscribe_depth("BTC-USDT", 5)
+        await stream.subscribe_ticker("ETH-USDT")
+        await stream.subscribe_trade("BTC-USDT")
+        connections = stream._MarketStream__connections
+        assert len(connections) == 2
+        assert connections[0].data_types == {"BTC-USDT@trade", "BTC-USDT@depth5"}
+
+    @pytest.mark.asyncio
+    async def test_spot_kline_interval(self):
+        stream = MarketStream(MarketType.SPOT)
+        await stream.subscribe_kline("BTC-USDT", "1h")
+        assert stream._MarketStream__connections[0].data_types == {"BTC-USDT@kline_60min"}
+
+
+class Exchange:
+    """
+    A local websocket server answering every subscription with one gzip data frame
+    """
+
+    def __init__(self) -> None:
+        self.received: list[str] = []
+        self.connections = 0
+        self.before_data: list[str | bytes] = [] # frames sent on the first connection before the data
+
+    async def handler(self, websocket) -> None:
+        self.connections += 1
+        first = self.connections == 1
+        async for message in websocket:
+            self.received.append(message)
+            request = json.loads(message) if message.startswith("{") else None # "Pong" is plain text
+            if not isinstance(request, dict) or request.get("reqType") != "sub":
+                continue
+            if first:
+                for frame in self.before_data:
+                    await websocket.send(frame)
+            data_type = request["dataType"]
+            await websocket.send(gzip.compress(json.dumps({"dataType": data_type, "data": {"p": "1.5"}}).encode()))
+
+
+@pytest_asyncio.fixture
+async def exchange():
+    exchange = Exchange()
+    async with websockets.serve(exchange.handler, "127.0.0.1", 0) as server:
+        exchange.url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        yield exchange
+
+
+@pytest.mark.asyncio
+async def test_subscribe_after_start(exchange: Exchange):
+    events = asyncio.Queue()
+    async with MarketStream(url=exchange.url) as stream:
+        await stream.subscribe_trade("BTC-USDT", events.put)
+        event = await asyncio.wait_for(events.get(), 5)
+    assert (event.data_type, event.data) == ("BTC-USDT@trade", {"p": "1.5"})
+
+
+@pytest.mark.asyncio
+async def test_heartbeats(exchange: Exchange):
+    exchange.before_data = [gzip.compress(b"Ping"), gzip.compress(json.dumps({"ping": "abc", "time": "t"}).encode())]
+    async with MarketStream(url=exchange.url) as stream:
+        await stream.subscribe_ticker("BTC-USDT")
+        async for event in stream:
+            break
+    assert event.data_type == "BTC-USDT@ticker"
+    assert "Pong" in exchange.received
+    assert {"pong": "abc", "time": "t"} in [json.loads(m) for m in exchange.received if m.startswith("{")]
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_does_not_stop_the_stream(exchange: Exchange):
+    events = asyncio.Queue()
+
+    def fail(event: StreamEvent) -> None:
+        raise RuntimeError("boom")
+
+    async with MarketStream(url=exchange.url) as stream:
+        stream.on(fail)
+        await stream.subscribe_trade("BTC-USDT", events.put)
+        await asyncio.wait_for(events.get(), 5)
+        await stream.subscribe_depth("BTC-USDT", 5, events.put)
+        assert (await asyncio.wait_for(events.get(), 5)).data_type == "BTC-USDT@depth5"
+
+
+@pytest.mark.asyncio
+async def test_reconnect_and_resubscribe(exchange: Exchange):
+    exchange.before_data = [b"not gzip"]
+    events = asyncio.Queue()
+    stream = MarketStream(url=exchange.url)
+    await stream.subscribe_trade("BTC-USDT", events.put)
+    stream.start()
+    event = await asyncio.wait_for(events.get(), 5) # sent over the second connection
+    await stream.close()
+    assert event.data_type == "BTC-USDT@trade"
+    assert exchange.connections == 2
+    assert [json.loads(m)["dataType"] for m in exchange.received] == ["BTC-USDT@trade", "BTC-USDT@trade"]
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Any
+
+from bingX.exceptions import NetworkError
+from bingX.retry import RetryPolicy
+from bingX.stream import UserDataStream
+from bingX.testing import MockExchange
+from bingX.transport import Transport
+from bingX.stream.types import (
+    BalanceUpdate,
+    OrderUpdate,
+    PositionUpdate,
+    parse_account_update,
+)
+
+
+def test_order_update_from_swap_event():
+    event = {"e": "ORDER_TRADE_UPDATE", "E": 1, "o": {"s": "BTC-USDT", "i": 5, "c": "id", "S": "BUY", "ps": "LONG", "o": "LIMIT", "x": "TRADE", "X": "FILLED", "p": "100.5", "q": "2", "ap": "100.4", "z": "2", "n": "-0.01", "N": "USDT"}}
+    update = OrderUpdate.from_event(event)
+    assert update.symbol == "BTC-USDT"
+    assert update.status == "FILLED"
+    assert update.price == 100.5
+    assert update.filled_quantity == 2.0
+
+
+def test_order_update_from_spot_event():
+    event = {"e": "executionReport", "E": 1, "s": "BTC-USDT", "i": 5, "S": "SELL", "o": "MARKET", "x": "NEW", "X": "NEW", "p": "0", "q": "1"}
+    update = OrderUpdate.from_event(event)
+    assert update.side == "SELL"
+    assert update.position_side is None
+    assert update.average_price == 0.0
+
+
+def test_parse_account_update():
+    event = {"e": "ACCOUNT_UPDATE", "E": 2, "a": {"m": "ORDER", "B": [{"a": "USDT", "wb": "10", "cw": "9", "bc": "1"}], "P": [{"s": "BTC-USDT", "pa": "1", "ep": "100", "up": "0.5", "mt": "isolated", "iw": "5", "ps": "LONG"}]}}
+    balance, position = parse_account_update(event)
+    assert isinstance(balance, BalanceUpdate) and balance.wallet_balance == 10.0
+    assert isinstance(position, PositionUpdate) and position.entry_price == 100.0
+
+
+def test_listen_key_is_rotated_when_it_cannot_be_extended(monkeypatch):
+    monkeypatch.setattr(UserDataStream, "RETRY_DELAY", 0.01)
+    exchange = MockExchange()
+    methods = []
+
+    def send(method: str, url: str, headers: dict) -> Any:
+        methods.append(method)
+        if method == "PUT":
+            raise NetworkError("connection reset", request_sent=True)
+        return exchange.send(method, url, headers)
+
+    async def main() -> tuple[str, str]:
+        transport = Transport(base_url=MockExchange.BASE_URL, send_hook=send, retry_policy=RetryPolicy(max_retries=0))
+        stream = UserDataStream("api_key", "secret_key", renew_interval=0.01, transport=transport, url="ws://127.0.0.1:1")
+        await stream.start()
+        first = stream.listen_key
+        while "DELETE" not in methods:
+            await asyncio.sleep(0.01)
+        second = stream.listen_key
+        await stream.close()
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first != second
+    assert methods[:6] == ["POST", "PUT", "PUT", "PUT", "POST", "DELETE"]
@@ -0,0 +1,109 @@
+import threading
+
+from bingX.bulk import BulkOrderEngine, MassCanceller
+from bingX.exceptions import ClientError, OrderValidationError
+from bingX.perpetual.v1.trade import Trade as PerpetualV1Trade
+from bingX.perpetual.v2.types import Order, OrderType, PositionSide, Side
+from bingX.reference import ReferenceDataCache
+from bingX.validation import OrderValidator
+
+
+class FakeTrade:
+    def __init__(self, failing_symbol: str | None = None) -> None:
+        self.batches: list[list[Order]] = []
+        self.failing_symbol = failing_symbol
+        self.lock = threading.Lock()
+
+    def bulk_create_order(self, orders: list[Order], recvWindow: int | None = None):
+        with self.lock:
+            self.batches.append(orders)
+        if any(order.symbol == self.failing_symbol for order in orders):
+            raise ClientError(80001, "failed")
+        return {"orders": [{"symbol": order.symbol, "price": order.price} for order in orders]}
+
+
+def order(symbol: str, price: float, quantity: float = 1.0) -> Order:
+    return Order(symbol=symbol, side=Side.BUY, positionSide=PositionSide.LONG, type=OrderType.LIMIT, quantity=quantity, price=price)
+
+
+def test_orders_are_chunked():
+    trade = FakeTrade()
+    orders = [order("BTC-USDT", 60000.0 + i) for i in range(12)]
+    result = BulkOrderEngine(trade).place(orders)
+    assert sorted(len(batch) for batch in trade.batches) == [2, 5, 5]
+    assert result.ok
+    assert [placed["price"] for placed in result.orders] == [o.price for o in orders]
+
+
+def test_partial_failure():
+    trade = FakeTrade(failing_symbol="ETH-USDT")
+    orders = [order("BTC-USDT", 1.0)] * 5 + [order("ETH-USDT", 1.0)] + [order("BTC-USDT", 1.0)] * 4
+    result = BulkOrderEngine(trade).place(orders)
+    assert sorted(result.errors) == [5, 6, 7, 8, 9]
+    assert isinstance(result.errors[5], ClientError)
+    assert len(result.placed) == 5
+
+
+def test_invalid_orders_are_not_sent():
+    validator = OrderValidator(ReferenceDataCache(lambda: [{"symbol": "BTC-USDT", "pricePrecision": 1, "quantityPrecision": 3, "tradeMinQuantity": 0.001}]))
+    trade = FakeTrade()
+    result = BulkOrderEngine(trade, validator=validator).place([order("BTC-USDT", 60000.04), order("BTC-USDT", 60000.0, 0.0001)])
+    assert [o.price for batch in trade.batches for o in batch] == [60000.0]
+    assert isinstance(result.errors[1], OrderValidationError)
+    assert result.orders[0] is not None
+
+
+class FakeCancelTrade:
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+        self.lock = threading.Lock()
+
+    def cancel_batch_orders(self, order_ids: list[int], symbol: str):
+        with self.lock:
+            self.calls.append(("batch", symbol, tuple(order_ids)))
+        if symbol == "ETH-USDT":
+            raise ClientError(80001, "failed")
+        return {"success": order_ids}
+
+    def cancel_all_orders(self, symbol: str):
+        with self.lock:
+            self.calls.append(("all", symbol))
+        return {"success": []}
+
+
+def test_mass_cancel():
+    trade = FakeCancelTrade()
+    result = MassCanceller(trade, batch_size=10).cancel({"BTC-USDT": list(range(25)), "ETH-USDT": [1], "DOGE-USDT": "all"})
+    assert sorted(len(call[2]) for call in trade.calls if call[0] == "batch" and call[1] == "BTC-USDT") == [5, 10, 10]
+    assert ("all", "DOGE-USDT") in trade.calls
+    assert len(result.results["BTC-USDT"]) == 3
+    assert isinstance(result.errors["ETH-USDT"], ClientError)
+    assert set(result.latency) == {"BTC-USDT", "ETH-USDT", "DOGE-USDT"}
+    assert not result.ok
+
+
+class FakeV1Trade(PerpetualV1Trade):
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+        self.lock = threading.Lock()
+        self.pending = {"BTC-USDT": [str(i) for i in range(12)], "ETH-USDT": ["100"]}
+
+    def get_unfilled_order_acquisition(self, symbol: str):
+        return {"orders": [{"orderId": order_id, "symbol": symbol} for order_id in self.pending.get(symbol, [])]}
+
+    def cancel_batch_orders(self, order_ids: list, symbol: str):
+        with self.lock:
+            self.calls.append(("batch", symbol, tuple(order_ids)))
+        return {"success": order_ids}
+
+    def cancel_all_orders(self):
+        raise AssertionError("the orders of every symbol would be cancelled")
+
+
+def test_mass_cancel_all_v1_only_cancels_the_given_symbols():
+    trade = FakeV1Trade()
+    result = MassCanceller(trade, batch_size=10).cancel({"BTC-USDT": "all", "DOGE-USDT": "all"})
+    assert result.ok
+    assert sorted(len(call[2]) for call in trade.calls) == [2, 10]
+    assert {call[1] for call in trade.calls} == {"BTC-USDT"}
+    assert len(result.results["BTC-USDT"]) == 2 and result.results["DOGE-USDT"] == []
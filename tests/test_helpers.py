@@ -5,7 +5,21 @@ import os
 import pytest
 from dotenv import load_dotenv
 
-from bingX._helpers import generate_hash, generate_timestamp
+from bingX._helpers import (
+    Signer,
+    camel_case,
+    encode_query_string,
+    generate_hash,
+    generate_query_string,
+    generate_query_strings,
+    generate_timestamp,
+    get_json_decoder,
+)
+from bingX.perpetual.v2.types import Order, OrderType, PositionSide, Side
+from bingX.spot.types import Order as SpotOrder
+from bingX.spot.types import OrderType as SpotOrderType
+from bingX.spot.types import Side as SpotSide
+from bingX.spot.types import TimeInForce
 
 load_dotenv()
 
@@ -28,4 +42,77 @@ def test_generate_hash(secret_key: str):
 
     assert isinstance(result_hash, hmac.HMAC)
     assert result_hash.digest() == expected_hash.digest()
-    assert result_hash.hexdigest() == expected_hash.hexdigest()
\ No newline at end of file
+    assert result_hash.hexdigest() == expected_hash.hexdigest()
+
+
+def test_signer():
+    query_string = "symbol=BTC-USDT&timestamp=1700000000000"
+    signer = Signer("secret")
+    assert signer.sign(query_string) == generate_hash("secret", query_string).hexdigest()
+    assert signer.sign(query_string) == signer.sign(query_string)
+
+
+@pytest.mark.parametrize("key", ["", "secret", "k" * 64, "k" * 100])
+def test_signer_keys(key: str):
+    query_string = "symbol=BTC-USDT&timestamp=1700000000000"
+    assert Signer(key).sign(query_string) == generate_hash(key, query_string).hexdigest()
+    assert Signer(key).extended("symbol=BTC-USDT").sign("&timestamp=1700000000000") == generate_hash(key, query_string).hexdigest()
+
+
+def test_generate_query_strings():
+    assert generate_query_strings({"symbol": "BTC-USDT", "price": 64000.5}) == ("symbol=BTC-USDT&price=64000.5", "symbol=BTC-USDT&price=64000.5")
+    assert generate_query_strings({"symbol": "BTC-USDT", "clientOrderID": "a&b=c"}) == ("symbol=BTC-USDT&clientOrderID=a&b=c", "symbol=BTC-USDT&clientOrderID=a%26b%3Dc")
+    assert generate_query_strings({"clientOrderID": "a="}) == ("clientOrderID=a=", "clientOrderID=a%3D")
+    assert generate_query_strings({}) == ("", "")
+
+
+def test_generate_query_string():
+    assert generate_query_string({"symbol": "BTC-USDT", "price": 64000.5, "stopPrice": None, "quantity": 0}) == "symbol=BTC-USDT&price=64000.5"
+
+
+def test_encode_query_string():
+    payload = {"symbol": "BTC-USDT", "clientOrderID": "a b&c"}
+    query_string = generate_query_string(payload)
+    assert encode_query_string({"symbol": "BTC-USDT"}, "symbol=BTC-USDT") == "symbol=BTC-USDT"
+    assert encode_query_string(payload, query_string) == "symbol=BTC-USDT&clientOrderID=a%20b%26c"
+
+
+def test_encode_query_string_separators_in_values():
+    payload = {"symbol": "BTC-USDT", "clientOrderID": "a&b=c"}
+    assert encode_query_string(payload, generate_query_string(payload)) == "symbol=BTC-USDT&clientOrderID=a%26b%3Dc"
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_get_json_decoder(name: str):
+    pytest.importorskip(name)
+    decoder = get_json_decoder(name)
+    assert decoder(b'{"code": 0, "data": [1.5, "a"]}') == {"code": 0, "data": [1.5, "a"]}
+    with pytest.raises(ValueError):
+        decoder(b"not json")
+
+
+def test_get_json_decoder_not_installed():
+    with pytest.raises(ValueError):
+        get_json_decoder("simdjson")
+
+
+def test_generate_query_string_sends_lists_as_json():
+    payload = {"symbol": "BTC-USDT", "orderIdList": [1, 2]}
+    assert generate_query_string(payload) == "symbol=BTC-USDT&orderIdList=[1,2]"
+    assert encode_query_string(payload, generate_query_string(payload)) == "symbol=BTC-USDT&orderIdList=%5B1%2C2%5D"
+
+
+def test_camel_case():
+    assert camel_case("stop_price") == "stopPrice"
+    assert camel_case("recvWindow") == "recvWindow"
+    assert camel_case("symbol") == "symbol"
+
+
+def test_to_dict():
+    order = Order("BTC-USDT", Side.BUY, PositionSide.LONG, 0.01, OrderType.TRIGGER_LIMIT, 60000.0, stop_price=59000.0, recv_window=5000, client_order_id="abc")
+    assert order.to_dict() == {
+        "symbol": "BTC-USDT", "side": "BUY", "positionSide": "LONG", "quantity": 0.01, "type": "TRIGGER_LIMIT",
+        "price": 60000.0, "stopPrice": 59000.0, "recvWindow": 5000, "clientOrderID": "abc",
+    }
+    spot_order = SpotOrder("BTC-USDT", SpotSide.SELL, SpotOrderType.LIMIT, TimeInForce.IOC, quantity=0.01, price=60000.0)
+    assert spot_order.to_dict() == {"symbol": "BTC-USDT", "side": "SELL", "type": "LIMIT", "timeInForce": "IOC", "quantity": 0.01, "price": 60000.0}
@@ -0,0 +1,66 @@
+import threading
+
+import pytest
+
+from bingX.history import KlineDownloader, find_gaps
+
+MINUTE = 60 * 1000
+START = 1700000000000
+
+
+class FakeMarket:
+    def __init__(self, missing: set[int] = set(), fail_after: int | None = None) -> None:
+        self.calls: list[tuple[int, int]] = []
+        self.missing = missing
+        self.fail_after = fail_after
+        self.lock = threading.Lock()
+
+    def get_k_line_data(self, symbol: str, interval: str, start_time: int, end_time: int, limit: int):
+        with self.lock:
+            if self.fail_after is not None and len(self.calls) >= self.fail_after:
+                raise ConnectionError("down")
+            self.calls.append((start_time, end_time))
+        # one candle past the end to mimic an inclusive boundary
+        return [{"time": t, "open": "1", "high": "1", "low": "1", "close": "1", "volume": "1"} for t in range(start_time, end_time + MINUTE + 1, MINUTE) if t not in self.missing]
+
+
+def test_pages():
+    pages = KlineDownloader(FakeMarket(), page_size=10).pages("1m", START, START + 25 * MINUTE)
+    assert pages == [(START, START + 10 * MINUTE - 1), (START + 10 * MINUTE, START + 20 * MINUTE - 1), (START + 20 * MINUTE, START + 25 * MINUTE - 1)]
+    with pytest.raises(ValueError):
+        KlineDownloader(FakeMarket()).pages("7m", START, START + MINUTE)
+
+
+def test_download_is_contiguous_and_deduplicated():
+    market = FakeMarket()
+    history = KlineDownloader(market, page_size=10).download("BTC-USDT", "1m", START, START + 25 * MINUTE)
+    assert len(market.calls) == 3
+    assert [row["time"] for row in history.rows] == list(range(START, START + 25 * MINUTE, MINUTE))
+    assert history.is_contiguous
+
+
+def test_download_reports_gaps():
+    history = KlineDownloader(FakeMarket(missing={START + 3 * MINUTE, START + 4 * MINUTE}), page_size=10).download("BTC-USDT", "1m", START, START + 10 * MINUTE)
+    assert history.gaps == [(START + 3 * MINUTE, START + 4 * MINUTE)]
+    assert find_gaps([0, 1, 2], 1) == []
+
+
+def test_download_reports_missing_head_and_tail():
+    missing = {START, START + MINUTE} | {START + i * MINUTE for i in range(20, 26)}
+    history = KlineDownloader(FakeMarket(missing=missing), page_size=10).download("BTC-USDT", "1m", START, START + 25 * MINUTE)
+    assert history.gaps == [(START, START + MINUTE), (START + 20 * MINUTE, START + 24 * MINUTE)]
+    assert not history.is_contiguous
+    assert find_gaps([], MINUTE, START, START + 3 * MINUTE) == [(START, START + 2 * MINUTE)]
+    assert find_gaps([START + 5, START + 5 + MINUTE], MINUTE, START, START + 2 * MINUTE + 5) == []
+
+
+def test_download_resumes_from_checkpoint(tmp_path):
+    checkpoint = str(tmp_path / "BTC-USDT-1m.jsonl")
+    downloader = KlineDownloader(FakeMarket(fail_after=2), max_workers=1, page_size=10)
+    with pytest.raises(ConnectionError):
+        downloader.download("BTC-USDT", "1m", START, START + 40 * MINUTE, checkpoint)
+
+    market = FakeMarket()
+    history = KlineDownloader(market, page_size=10).download("BTC-USDT", "1m", START, START + 40 * MINUTE, checkpoint)
+    assert len(market.calls) == 2
+    assert len(history.rows) == 40 and history.is_contiguous
@@ -1,4 +1,6 @@
+import json
 import os
+from types import SimpleNamespace
 
 import pytest
 from dotenv import load_dotenv
@@ -17,7 +19,7 @@ class TestHTTPManager:
 
     def test_request_get_valid(self, http_manager: _HTTPManager):
         response = http_manager._request("GET", "/openApi/swap/v2/quote/contracts")
-        assert isinstance(response.json(), dict)
+        assert isinstance(response, dict)
 
     def test_request_get_invalid(self, http_manager: _HTTPManager):
         with pytest.raises(ClientError):
@@ -38,6 +40,12 @@ class TestHTTPManager:
         expected_query_string = f"foo=bar&baz=qux&timestamp={generated_query_string_timestamp}&signature={signature}"
         assert generated_query_string == expected_query_string
 
+    def test_payload_is_not_modified(self):
+        payload = {"foo": "bar"}
+        _HTTPManager("api_key", "secret_key", recv_window=5000)._generate_query_string(payload)
+        assert payload == {"foo": "bar"}
+        assert _HTTPManager.post.__defaults__[0] is None
+
     def test_invalid_method(self, http_manager: _HTTPManager):
         with pytest.raises(InvalidMethodException):
             http_manager._request("INVALID", "/openApi/swap/v2/trade/order")
@@ -46,6 +54,21 @@ class TestHTTPManager:
         with pytest.raises(ServerError):
             http_manager._request("PUT", "/openApi/swap/v2/trade/order", payload={"test": "test"})
 
+    def test_handle_response(self, http_manager: _HTTPManager):
+        calls = []
+
+        def decoder(content: bytes):
+            calls.append(content)
+            return json.loads(content)
+
+        response = SimpleNamespace(status_code=200, content=b'{"code": 0, "data": {"a": 1}}', text="")
+        assert http_manager._handle_response(response, decoder) == {"code": 0, "data": {"a": 1}}
+        assert len(calls) == 1
+
+        with pytest.raises(ClientError):
+            http_manager._handle_response(SimpleNamespace(status_code=200, content=b'{"code": 80014, "msg": "invalid"}', text=""), decoder)
+        assert http_manager._handle_response(SimpleNamespace(status_code=200, content=b"", text=""), decoder) is None
+
     def test_client_error(self, http_manager: _HTTPManager):
         with pytest.raises(ClientError):
             http_manager._request("GET", "/openApi/swap/v2/trade", payload={"test": "test"})
\ No newline at end of file
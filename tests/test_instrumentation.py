@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from bingX.aio import AsyncBingX
+from bingX.exceptions import ClientError
+from bingX.instrumentation import Histogram, HTTPXTrace, Instrument, MetricsRecorder, RequestRecord
+from bingX.main import BingX
+from bingX.retry import RetryPolicy
+from bingX.testing import MockExchange
+
+TICKER = "GET /openApi/swap/v2/quote/ticker"
+
+
+class Hooks(Instrument):
+    def __init__(self) -> None:
+        self.before: list[RequestRecord] = []
+        self.after: list[RequestRecord] = []
+
+    def before_request(self, record: RequestRecord) -> None:
+        self.before.append(record)
+
+    def after_request(self, record: RequestRecord) -> None:
+        self.after.append(record)
+
+
+@pytest.fixture
+def exchange() -> MockExchange:
+    return MockExchange(listings=10)
+
+
+def test_histogram():
+    histogram = Histogram((1.0, 2.0, 4.0))
+    for value in (0.5, 1.5, 1.5, 3.0, 8.0):
+        histogram.observe(value)
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.quantile(0.5) == pytest.approx(1.75)
+    assert histogram.quantile(1.0) == 8.0
+    assert histogram.summary()["mean"] == pytest.approx(2.9)
+
+
+def test_hooks(exchange: MockExchange):
+    hooks = Hooks()
+    client = BingX("api_key", "secret_key", exchange.transport(instruments=[hooks], retry_policy=RetryPolicy(backoff_base=0.0)))
+    exchange.fail(503)
+    client.perpetual_v2.market.get_ticker("BTC-USDT")
+
+    assert hooks.before == hooks.after
+    record = hooks.after[0]
+    assert (record.method, record.endpoint, record.status_code) == ("GET", "/openApi/swap/v2/quote/ticker", 200)
+    assert record.retries == 1 and record.error_codes == ["503"]
+    assert record.request_bytes > 0 and record.response_bytes > 0
+    assert {"sign", "rate_limit", "send", "decode"} <= set(record.phases)
+    assert record.duration >= record.phases["send"]
+
+
+def test_metrics_recorder(exchange: MockExchange):
+    recorder = MetricsRecorder()
+    client = BingX("api_key", "secret_key", exchange.transport(instruments=[recorder], retry_policy=RetryPolicy(max_retries=0)))
+    for _ in range(3):
+        client.perpetual_v2.market.get_ticker("BTC-USDT")
+    exchange.reject(80014, "Invalid parameter")
+    with pytest.raises(ClientError):
+        client.perpetual_v2.market.get_ticker("BTC-USDT")
+
+    snapshot = recorder.snapshot()[TICKER]
+    assert snapshot["latency"]["count"] == 4
+    assert snapshot["errors"] == {"80014": 1}
+    assert recorder.slowest(1)[0][0] == TICKER
+
+
+def test_async_hooks(exchange: MockExchange):
+    hooks = Hooks()
+
+    async def main() -> None:
+        client = AsyncBingX("api_key", "secret_key", exchange.async_transport(instruments=[hooks]))
+        await client.perpetual_v2.market.get_ticker("BTC-USDT")
+
+    asyncio.run(main())
+    assert hooks.after[0].status_code == 200
+    assert "decode" in hooks.after[0].phases
+
+
+def test_httpx_trace():
+    record = RequestRecord("GET", "/openApi/swap/v2/quote/ticker")
+    trace = HTTPXTrace(record)
+    for event in ("connection.connect_tcp.started", "connection.connect_tcp.complete", "http11.send_request_headers.started", "http11.receive_response_headers.complete"):
+        trace(event, {})
+    assert set(record.phases) == {"connect", "ttfb"}
+
+
+def test_exporters_are_optional():
+    from bingX import instrumentation
+
+    if instrumentation.prometheus_client is None:
+        with pytest.raises(ImportError):
+            instrumentation.PrometheusExporter()
+    if instrumentation.otel_metrics is None:
+        with pytest.raises(ImportError):
+            instrumentation.OpenTelemetryExporter()
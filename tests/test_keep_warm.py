@@ -0,0 +1,62 @@
+import socket
+
+import pytest
+
+from bingX.keep_warm import KeepWarm
+from bingX.main import BingX
+from bingX.testing import MockExchange
+from bingX.transport import Transport
+
+
+@pytest.fixture
+def exchange():
+    with MockExchange(listings=5) as exchange:
+        yield exchange
+
+
+def idle_connections(transport: Transport) -> list:
+    pool = transport.session.get_adapter(transport.base_url).poolmanager.pools
+    return [conn for key in pool.keys() for conn in pool[key].pool.queue if conn is not None]
+
+
+def test_connections_are_opened_on_start(exchange: MockExchange):
+    keep_warm = KeepWarm(connections=3, interval=0)
+    transport = Transport(base_url=exchange.serve(), keep_warm=keep_warm)
+
+    health = keep_warm.health()
+    assert len(health) == 3 and all(h.healthy and h.pings == 1 and h.round_trip_time is not None for h in health)
+    assert len({h.address for h in health}) == 3
+    assert all(conn.sock is not None for conn in idle_connections(transport))
+    transport.close()
+
+
+def test_dead_connections_are_replaced(exchange: MockExchange):
+    keep_warm = KeepWarm(connections=2, interval=0)
+    transport = Transport(base_url=exchange.serve(), keep_warm=keep_warm)
+    for conn in idle_connections(transport):
+        conn.sock.shutdown(socket.SHUT_RDWR)
+
+    health = keep_warm.sweep()
+    assert keep_warm.replaced == 2
+    assert all(h.healthy and h.replaced == 1 and h.pings == 2 for h in health)
+    client = BingX("api_key", "secret_key", transport)
+    assert client.perpetual_v2.market.get_latest_price_of_trading_pair("BTC-USDT")["symbol"] == "BTC-USDT"
+    assert len(keep_warm.health()) == 2 # the request went through a warm connection
+    transport.close()
+
+
+def test_unreachable_exchange():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    keep_warm = KeepWarm(connections=2, interval=0, timeout=0.5)
+    Transport(base_url=f"http://127.0.0.1:{port}", keep_warm=keep_warm)
+    assert [(h.healthy, h.failures) for h in keep_warm.health()] == [(False, 1), (False, 1)]
+
+
+def test_send_hook_falls_back_to_prewarm():
+    exchange = MockExchange(listings=5)
+    keep_warm = KeepWarm(connections=2, interval=0)
+    exchange.transport(keep_warm=keep_warm)
+    assert keep_warm.health() == []
+    assert exchange.calls[Transport.PREWARM_ENDPOINT] == 2
@@ -0,0 +1,39 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bingX.kline import KlineFrame
+
+PERPETUAL_V2_ROWS = [
+    {"open": "64000.5", "close": "64010.1", "high": "64020", "low": "63990", "volume": "12.5", "time": 1700000060000},
+    {"open": "63990", "close": "64000.5", "high": "64001", "low": "63980", "volume": "3", "time": 1700000000000},
+]
+SPOT_ROWS = [
+    [1700000000000, "1.0", "2.0", "0.5", "1.5", "100", 1700000059999, "150"],
+    [1700000060000, "1.5", "1.75", "1.25", "1.25", "50", 1700000119999, "70"],
+]
+
+
+def test_from_perpetual_v2_sorts_by_open_time():
+    frame = KlineFrame.from_perpetual_v2(PERPETUAL_V2_ROWS)
+    assert len(frame) == 2
+    assert frame.open_time.dtype == np.int64
+    assert frame.open_time.tolist() == [1700000000000, 1700000060000]
+    assert frame.close.tolist() == [64000.5, 64010.1]
+    assert frame.volume.tolist() == [3.0, 12.5]
+    assert frame.close.flags["C_CONTIGUOUS"]
+
+
+def test_from_spot():
+    frame = KlineFrame.from_spot(SPOT_ROWS)
+    assert frame.open.dtype == np.float64
+    assert frame.open.tolist() == [1.0, 1.5]
+    assert frame.high.tolist() == [2.0, 1.75]
+    assert frame.low.tolist() == [0.5, 1.25]
+
+
+def test_empty_and_concat():
+    assert len(KlineFrame.from_spot([])) == 0
+    frame = KlineFrame.concat([KlineFrame.from_spot(SPOT_ROWS[1:]), KlineFrame.from_spot(SPOT_ROWS[:1])])
+    assert frame.open_time.tolist() == [1700000000000, 1700000060000]
+    assert frame.close.tolist() == [1.5, 1.25]
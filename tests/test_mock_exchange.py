@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+import requests
+
+from bingX.aio import AsyncBingX
+from bingX.bulk import BulkOrderEngine, MassCanceller
+from bingX.exceptions import ClientError, ServerError
+from bingX.history import KlineDownloader
+from bingX.main import BingX
+from bingX.perpetual.v2.types import Order, OrderType, PositionSide, Side
+from bingX.retry import RetryPolicy
+from bingX.testing import MockExchange
+from bingX.transport import Transport
+
+NO_BACKOFF = dict(backoff_base=0.0, backoff_max=0.0)
+
+
+@pytest.fixture
+def exchange() -> MockExchange:
+    return MockExchange(secret_key="secret_key", listings=20)
+
+
+@pytest.fixture
+def client(exchange: MockExchange) -> BingX:
+    return BingX("api_key", "secret_key", exchange.transport(retry_policy=RetryPolicy(**NO_BACKOFF)))
+
+
+def order(price: float) -> Order:
+    return Order(symbol="BTC-USDT", side=Side.BUY, positionSide=PositionSide.LONG, type=OrderType.LIMIT, quantity=0.01, price=price)
+
+
+def test_market_endpoints(client: BingX):
+    assert len(client.perpetual_v2.market.get_contract_info()) == 20
+    assert len(client.perpetual_v2.market.get_market_depth("BTC-USDT", 50)["bids"]) == 50
+    assert len(client.spot.market.get_symbols()["symbols"]) == 20
+    assert len(client.standard.get_all_positions()) == 3
+
+
+def test_klines_are_contiguous(client: BingX):
+    history = KlineDownloader(client.perpetual_v2.market, page_size=100).download("BTC-USDT", "1m", 0, 1000 * 60_000)
+    assert len(history.rows) == 1000
+    assert history.is_contiguous
+
+
+def test_orders_are_kept(client: BingX):
+    result = BulkOrderEngine(client.perpetual_v2.trade).place([order(60000.0 + i) for i in range(7)])
+    assert result.ok and len(result.placed) == 7
+    assert len(client.perpetual_v2.trade.get_open_orders("BTC-USDT")["orders"]) == 7
+
+    order_ids = [placed["orderId"] for placed in result.placed]
+    cancelled = MassCanceller(client.perpetual_v2.trade).cancel({"BTC-USDT": order_ids})
+    assert cancelled.ok
+    assert client.perpetual_v2.trade.get_open_orders("BTC-USDT")["orders"] == []
+
+
+def test_server_errors_are_retried(exchange: MockExchange, client: BingX):
+    exchange.fail(503, times=2)
+    client.perpetual_v2.market.get_ticker("BTC-USDT")
+    assert exchange.calls["/openApi/swap/v2/quote/ticker"] == 3
+
+
+def test_rate_limited_requests_are_retried(exchange: MockExchange, client: BingX):
+    exchange.fail(429, endpoint="/openApi/swap/v2/quote/price", retry_after=0.05)
+    client.perpetual_v2.market.get_latest_price_of_trading_pair("BTC-USDT")
+    assert exchange.calls["/openApi/swap/v2/quote/price"] == 2
+
+
+def test_errors_are_raised(exchange: MockExchange):
+    client = BingX("api_key", "wrong_secret_key", exchange.transport(retry_policy=RetryPolicy(max_retries=0)))
+    with pytest.raises(ClientError):
+        client.perpetual_v2.account.get_details()
+
+    exchange.fail(500)
+    with pytest.raises(ServerError):
+        client.perpetual_v2.market.get_ticker("BTC-USDT")
+
+
+def test_session_factory_over_http(exchange: MockExchange):
+    sessions = []
+
+    def session_factory() -> requests.Session:
+        sessions.append(requests.Session())
+        return sessions[-1]
+
+    with exchange:
+        client = BingX("api_key", "secret_key", Transport(base_url=exchange.serve(), session_factory=session_factory))
+        assert client.perpetual_v2.market.get_latest_price_of_trading_pair("ETH-USDT")["symbol"] == "ETH-USDT"
+    assert len(sessions) == 1
+
+
+def test_async_send_hook(exchange: MockExchange):
+    async def main() -> list:
+        client = AsyncBingX("api_key", "secret_key", exchange.async_transport())
+        return await asyncio.gather(*(client.perpetual_v2.market.get_ticker("BTC-USDT") for _ in range(10)))
+
+    exchange.latency = 0.05
+    assert len(asyncio.run(main())) == 10
@@ -0,0 +1,54 @@
+import pytest
+
+from bingX.perpetual.v2.models import Depth, Position, Ticker
+from bingX.spot.models import Balance, Kline
+
+TICKER = {"symbol": "BTC-USDT", "priceChange": "-12.5", "priceChangePercent": "-0.02", "lastPrice": "64000.5", "lastQty": "0.01", "highPrice": "65000", "lowPrice": "63000", "volume": "1234.5", "quoteVolume": "79000000", "openPrice": "64013", "openTime": 1700000000000, "closeTime": 1700086400000}
+
+
+def test_model_fields():
+    ticker = Ticker(TICKER)
+    assert ticker.raw is TICKER
+    assert ticker.symbol == "BTC-USDT"
+    assert ticker.last_price == 64000.5
+    assert ticker.open_time == 1700000000000
+    assert ticker.to_dict()["quote_volume"] == 79000000.0
+
+
+def test_model_decodes_numbers_once():
+    ticker = Ticker(dict(TICKER))
+    assert ticker._values is None
+    assert ticker.volume == 1234.5
+    ticker.raw["volume"] = "1"
+    assert ticker.volume == 1234.5
+
+
+def test_model_is_slotted():
+    ticker = Ticker(TICKER)
+    assert not hasattr(ticker, "__dict__")
+    with pytest.raises(AttributeError):
+        ticker.extra = 1
+
+
+def test_missing_and_empty_values():
+    position = Position({"symbol": "BTC-USDT", "positionAmt": ""})
+    assert position.position_amount is None
+    assert position.average_price is None
+
+
+def test_levels():
+    depth = Depth({"T": 1, "bids": [["64000.5", "0.2"], ["64000", "1"]], "asks": [["64001", "0.3"]]})
+    assert depth.bids == [(64000.5, 0.2), (64000.0, 1.0)]
+    assert depth.asks == [(64001.0, 0.3)]
+
+
+def test_list_model():
+    klines = Kline.from_list([[1700000000000, "1.0", "2.0", "0.5", "1.5", "100", 1700000059999, "150"]])
+    assert klines[0].open_time == 1700000000000
+    assert klines[0].close == 1.5
+    assert klines[0].quote_volume == 150.0
+
+
+def test_equality():
+    assert Balance({"asset": "USDT", "free": "1"}) == Balance({"asset": "USDT", "free": "1"})
+    assert repr(Balance({"asset": "USDT", "free": "1", "locked": "0"})) == "Balance(asset='USDT', free=1.0, locked=0.0)"
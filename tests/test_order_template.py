@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from bingX._http_manager import _HTTPManager
+from bingX.aio import AsyncBingX
+from bingX.main import BingX
+from bingX.perpetual.v2.template import OrderTemplate
+from bingX.perpetual.v2.types import Order, OrderType, PositionSide, Side
+from bingX.testing import MockExchange
+
+PROTOTYPE = Order(symbol="BTC-USDT", side=Side.BUY, positionSide=PositionSide.LONG, type=OrderType.LIMIT, quantity=0.01, price=64000.0)
+
+
+@pytest.fixture
+def exchange() -> MockExchange:
+    return MockExchange(secret_key="secret_key", listings=5)
+
+
+@pytest.mark.parametrize("recv_window", [None, 5000])
+def test_signs_like_an_order(recv_window: int | None):
+    http_manager = _HTTPManager("api_key", "secret_key", recv_window=recv_window)
+    template = OrderTemplate(PROTOTYPE, http_manager)
+    order = Order(symbol="BTC-USDT", side=Side.BUY, positionSide=PositionSide.LONG, type=OrderType.LIMIT, quantity=0.02, price=64010.5, client_order_id="a b")
+
+    expected = http_manager._generate_query_string(order.to_dict(), 1700000000000).split("&")
+    query_string = http_manager._generate_query_string(template.payload(price=64010.5, quantity=0.02, client_order_id="a b"), 1700000000000).split("&")
+    assert sorted(query_string[:-1]) == sorted(expected[:-1])
+    assert http_manager._generate_signature("&".join(query_string[:-1]).replace("a%20b", "a b")) == query_string[-1].removeprefix("signature=")
+
+
+def test_separators_in_values_are_encoded():
+    http_manager = _HTTPManager("api_key", "secret_key")
+    query_string = http_manager._generate_query_string(OrderTemplate(PROTOTYPE, http_manager).payload(client_order_id="a&b=c"), 1700000000000)
+    assert "&clientOrderID=a%26b%3Dc&" in query_string
+    assert "&b=" not in query_string
+
+
+def test_create_order_from_template(exchange: MockExchange):
+    trade = BingX("api_key", "secret_key", exchange.transport()).perpetual_v2.trade
+    template = trade.order_template(PROTOTYPE)
+    for i in range(3):
+        trade.create_order_from_template(template, price=63000.0 + i, client_order_id=f"mm-{i}")
+
+    orders = trade.get_open_orders("BTC-USDT")["orders"]
+    assert sorted(float(order["price"]) for order in orders) == [63000.0, 63001.0, 63002.0]
+    assert template.payload()["quantity"] == 0.01
+
+
+def test_async_create_order_from_template(exchange: MockExchange):
+    async def main() -> dict:
+        trade = AsyncBingX("api_key", "secret_key", exchange.async_transport()).perpetual_v2.trade
+        return await trade.create_order_from_template(trade.order_template(PROTOTYPE), quantity=0.5)
+
+    assert asyncio.run(main())["order"]["origQty"] == "0.5"
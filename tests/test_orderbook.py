@@ -0,0 +1,60 @@
+import pytest
+
+from bingX.exceptions import OrderBookSequenceError
+from bingX.orderbook import OrderBook
+
+
+class TestOrderBook:
+    @pytest.fixture
+    def snapshot(self) -> dict:
+        return {
+            "bids": [["99.0", "2"], ["100.0", "1"], ["98.0", "3"]],
+            "asks": [["102.0", "2"], ["101.0", "1"], ["103.0", "3"]],
+            "lastUpdateId": 10,
+        }
+
+    @pytest.fixture
+    def book(self, snapshot: dict) -> OrderBook:
+        return OrderBook("BTC-USDT", lambda: snapshot)
+
+    def test_top_of_book(self, book: OrderBook):
+        assert book.best_bid == (100.0, 1.0)
+        assert book.best_ask == (101.0, 1.0)
+        assert book.mid == 100.5
+        assert book.spread == 1.0
+
+    def test_depth(self, book: OrderBook):
+        assert book.bid_depth(99.0) == 3.0
+        assert book.ask_depth(102.5) == 3.0
+        assert book.ask_depth(100.0) == 0.0
+
+    def test_vwap(self, book: OrderBook):
+        assert book.buy_vwap(1) == 101.0
+        assert book.buy_vwap(2) == pytest.approx((101.0 + 102.0) / 2)
+        assert book.sell_vwap(3) == pytest.approx((100.0 + 2 * 99.0) / 3)
+        with pytest.raises(ValueError):
+            book.buy_vwap(100)
+        with pytest.raises(ValueError):
+            book.sell_vwap(0)
+
+    def test_apply_update(self, book: OrderBook):
+        assert book.apply_update(bids=[["100.0", "0"], ["100.5", "4"]], asks=[["101.0", "0"]], first_update_id=11, last_update_id=12)
+        assert book.best_bid == (100.5, 4.0)
+        assert book.best_ask == (102.0, 2.0)
+        assert book.last_update_id == 12
+
+    def test_stale_update_is_ignored(self, book: OrderBook):
+        assert not book.apply_update(bids=[["100.0", "0"]], first_update_id=9, last_update_id=10)
+        assert book.best_bid == (100.0, 1.0)
+
+    def test_gap_triggers_resync(self, book: OrderBook):
+        book.apply_update(bids=[["100.0", "0"]], first_update_id=11, last_update_id=11)
+        assert not book.apply_update(asks=[["101.0", "0"]], first_update_id=20, last_update_id=21)
+        assert book.best_bid == (100.0, 1.0)
+        assert book.last_update_id == 10
+
+    def test_gap_without_snapshot(self, snapshot: dict):
+        book = OrderBook("BTC-USDT")
+        book.load_snapshot(snapshot)
+        with pytest.raises(OrderBookSequenceError):
+            book.apply_update(first_update_id=20, last_update_id=21)
@@ -0,0 +1,43 @@
+import time
+
+import pytest
+
+from bingX.rate_limiter import RateLimiter, TokenBucket
+
+
+class TestRateLimiter:
+    @pytest.fixture
+    def rate_limiter(self) -> RateLimiter:
+        return RateLimiter(groups={RateLimiter.MARKET: (100.0, 2.0), RateLimiter.TRADE: (100.0, 5.0)}, ip_limit=(100.0, 10.0), reserve=0.5)
+
+    def test_classify(self, rate_limiter: RateLimiter):
+        assert rate_limiter.classify("GET", "/openApi/swap/v2/quote/depth") == RateLimiter.MARKET
+        assert rate_limiter.classify("GET", "/openApi/spot/v1/common/symbols") == RateLimiter.MARKET
+        assert rate_limiter.classify("POST", "/openApi/swap/v2/trade/order") == RateLimiter.TRADE
+        assert rate_limiter.classify("DELETE", "/openApi/swap/v2/trade/batchOrders") == RateLimiter.TRADE
+        assert rate_limiter.classify("POST", "/api/v1/user/cancelOrder") == RateLimiter.TRADE
+        assert rate_limiter.classify("GET", "/openApi/swap/v2/trade/openOrders") == RateLimiter.ACCOUNT
+        assert rate_limiter.classify("GET", "/openApi/swap/v2/user/balance") == RateLimiter.ACCOUNT
+
+    def test_burst_then_wait(self, rate_limiter: RateLimiter):
+        assert rate_limiter.acquire("GET", "/openApi/swap/v2/quote/depth") < 0.005
+        assert rate_limiter.acquire("GET", "/openApi/swap/v2/quote/depth") < 0.005
+        assert rate_limiter.acquire("GET", "/openApi/swap/v2/quote/depth") >= 0.005
+
+    def test_reserve_is_kept_for_priority_groups(self, rate_limiter: RateLimiter):
+        rate_limiter.ip_bucket.tokens = 5.0
+        assert rate_limiter.acquire("POST", "/openApi/swap/v2/trade/order") < 0.005
+        assert rate_limiter.acquire("GET", "/openApi/swap/v2/user/balance") >= 0.005
+
+    def test_penalize(self, rate_limiter: RateLimiter):
+        rate_limiter.penalize(0.05)
+        started = time.monotonic()
+        rate_limiter.acquire("POST", "/openApi/swap/v2/trade/order")
+        assert time.monotonic() - started >= 0.04
+
+
+def test_token_bucket_wait_time():
+    bucket = TokenBucket(rate=10.0, capacity=1.0)
+    assert bucket.wait_time() == 0.0
+    bucket.consume()
+    assert bucket.wait_time() == pytest.approx(0.1)
@@ -0,0 +1,84 @@
+import threading
+import time
+
+from bingX.reference import ReferenceDataCache
+
+
+class Fetch:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"symbols": [{"symbol": "BTC-USDT", "tickSize": 0.01, "version": self.calls}, {"symbol": "ETH-USDT", "tickSize": 0.01}]}
+
+
+def test_lookup_by_symbol():
+    fetch = Fetch()
+    cache = ReferenceDataCache(fetch)
+    assert cache["BTC-USDT"]["tickSize"] == 0.01
+    assert "ETH-USDT" in cache
+    assert cache.get("DOGE-USDT") is None
+    assert len(cache.all()) == 2
+    assert fetch.calls == 1
+
+
+def test_list_response():
+    cache = ReferenceDataCache(lambda: [{"symbol": "BTC-USDT", "pricePrecision": 1}])
+    assert cache["BTC-USDT"]["pricePrecision"] == 1
+
+
+def test_stale_while_revalidate():
+    fetch = Fetch()
+    release = threading.Event()
+    cache = ReferenceDataCache(lambda: fetch() if fetch.calls == 0 or release.wait(1) else None, ttl=0.0, max_age=60.0)
+    assert cache["BTC-USDT"]["version"] == 1
+    time.sleep(0.01)
+    assert cache["BTC-USDT"]["version"] == 1 # served stale while the refresh waits
+    release.set()
+    deadline = time.monotonic() + 1
+    while fetch.calls < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    assert cache.all()["BTC-USDT"]["version"] >= 2
+
+
+def test_expired_data_waits_for_refresh():
+    fetch = Fetch()
+    cache = ReferenceDataCache(fetch, ttl=0.0, max_age=0.0)
+    cache.get("BTC-USDT")
+    time.sleep(0.01)
+    assert cache["BTC-USDT"]["version"] == 2
+
+
+def test_first_load_is_shared():
+    fetch = Fetch()
+
+    def slow_fetch():
+        time.sleep(0.05)
+        return fetch()
+
+    cache = ReferenceDataCache(slow_fetch)
+    threads = [threading.Thread(target=cache.get, args=("BTC-USDT",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert fetch.calls == 1
+
+
+def test_failed_refresh_backs_off():
+    attempts = []
+
+    def fetch():
+        attempts.append(time.monotonic())
+        if len(attempts) > 1:
+            raise ConnectionError("down")
+        return {"symbols": [{"symbol": "BTC-USDT"}]}
+
+    cache = ReferenceDataCache(fetch, ttl=0.0, max_age=60.0, retry_delay=60.0)
+    deadline = time.monotonic() + 0.3
+    while time.monotonic() < deadline:
+        assert cache["BTC-USDT"] == {"symbol": "BTC-USDT"}
+        time.sleep(0.005)
+    assert len(attempts) == 2 # the first load and a single failed refresh
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from bingX import _http_manager
+from bingX.aio import AsyncBingX
+from bingX.aio import _http_manager as aio_http_manager
+from bingX.exceptions import ClientError, NetworkError, ServerError
+from bingX.main import BingX
+from bingX.perpetual.v2.types import Order, OrderType, PositionSide, Side
+from bingX.retry import RetryAction, RetryBudget, RetryPolicy
+from bingX.testing import MockExchange
+
+ORDER_ENDPOINT = "/openApi/swap/v2/trade/order"
+
+
+class TestRetryPolicy:
+    @pytest.fixture
+    def policy(self) -> RetryPolicy:
+        return RetryPolicy(max_retries=2)
+
+    def test_get_is_retried(self, policy: RetryPolicy):
+        assert policy.decide("GET", "/openApi/swap/v2/quote/depth", {}, ServerError(503, ""), 0) == RetryAction.RETRY
+        assert policy.decide("GET", "/openApi/swap/v2/quote/depth", {}, ClientError(100503, ""), 0) == RetryAction.RETRY
+        assert policy.decide("GET", "/openApi/swap/v2/quote/depth", {}, NetworkError("", request_sent=True), 0) == RetryAction.RETRY
+
+    def test_retries_are_capped(self, policy: RetryPolicy):
+        assert policy.decide("GET", "/openApi/swap/v2/quote/depth", {}, ServerError(503, ""), 2) == RetryAction.RAISE
+
+    def test_other_errors_are_raised(self, policy: RetryPolicy):
+        assert policy.decide("GET", "/openApi/swap/v2/quote/depth", {}, ServerError(400, ""), 0) == RetryAction.RAISE
+        assert policy.decide("GET", "/openApi/swap/v2/quote/depth", {}, ClientError(100400, ""), 0) == RetryAction.RAISE
+
+    def test_order_without_client_order_id(self, policy: RetryPolicy):
+        assert policy.decide("POST", ORDER_ENDPOINT, {}, ServerError(503, ""), 0) == RetryAction.RAISE
+        assert policy.decide("POST", ORDER_ENDPOINT, {}, NetworkError("", request_sent=True), 0) == RetryAction.RAISE
+        assert policy.decide("POST", ORDER_ENDPOINT, {}, NetworkError("", request_sent=False), 0) == RetryAction.RETRY
+        assert policy.decide("POST", ORDER_ENDPOINT, {}, ServerError(429, ""), 0) == RetryAction.RETRY
+        assert policy.decide("POST", ORDER_ENDPOINT, {}, ServerError(504, ""), 0) == RetryAction.RAISE
+
+    def test_order_with_client_order_id(self, policy: RetryPolicy):
+        payload = {"symbol": "BTC-USDT", "clientOrderID": "abc"}
+        assert policy.decide("POST", ORDER_ENDPOINT, payload, ServerError(503, ""), 0) == RetryAction.RETRY
+        assert policy.decide("POST", ORDER_ENDPOINT, payload, ServerError(504, ""), 0) == RetryAction.RECONCILE
+        assert policy.reconciliation_request(ORDER_ENDPOINT, payload) == (ORDER_ENDPOINT, {"symbol": "BTC-USDT", "clientOrderId": "abc"})
+
+    def test_backoff_is_capped(self, policy: RetryPolicy):
+        assert 0 <= policy.backoff(100) <= policy.backoff_max
+
+    def test_budget(self):
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=1.0))
+        assert policy.decide("GET", "/openApi/swap/v2/quote/depth", {}, ServerError(503, ""), 0) == RetryAction.RETRY
+        assert policy.decide("GET", "/openApi/swap/v2/quote/depth", {}, ServerError(503, ""), 0) == RetryAction.RAISE
+
+
+class TestHTTPManagerRetries:
+    @pytest.fixture
+    def exchange(self) -> MockExchange:
+        return MockExchange(listings=5)
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch) -> list[float]:
+        sleeps: list[float] = []
+        monkeypatch.setattr(_http_manager.time, "sleep", sleeps.append)
+        return sleeps
+
+    def order(self, client_order_id: str) -> Order:
+        return Order(symbol="BTC-USDT", side=Side.BUY, positionSide=PositionSide.LONG, type=OrderType.LIMIT, quantity=0.01, price=60000.0, client_order_id=client_order_id)
+
+    def test_retries_back_off(self, exchange: MockExchange, sleeps: list[float]):
+        client = BingX("api_key", "secret_key", exchange.transport(retry_policy=RetryPolicy(max_retries=2, backoff_base=1.0)))
+        exchange.fail(503, times=2)
+        client.perpetual_v2.market.get_ticker("BTC-USDT")
+        assert exchange.calls["/openApi/swap/v2/quote/ticker"] == 3
+        assert len(sleeps) == 2 and all(0 <= sleep <= 2.0 for sleep in sleeps)
+
+    def test_retries_are_capped(self, exchange: MockExchange, sleeps: list[float]):
+        client = BingX("api_key", "secret_key", exchange.transport(retry_policy=RetryPolicy(max_retries=1)))
+        exchange.fail(503, times=5)
+        with pytest.raises(ServerError):
+            client.perpetual_v2.market.get_ticker("BTC-USDT")
+        assert exchange.calls["/openApi/swap/v2/quote/ticker"] == 2
+
+    def test_reconcile_finds_the_placed_order(self, exchange: MockExchange, sleeps: list[float]):
+        trade = BingX("api_key", "secret_key", exchange.transport(retry_policy=RetryPolicy())).perpetual_v2.trade
+        placed = trade.create_order(self.order("mm-1"))["order"]
+        exchange.fail(504, endpoint=ORDER_ENDPOINT)
+        assert trade.create_order(self.order("mm-1")) == {"order": placed} # the status lookup, not a second order
+        assert len(trade.get_open_orders("BTC-USDT")["orders"]) == 1
+        assert sleeps == []
+
+    def test_reconcile_resends_a_missing_order_after_backoff(self, exchange: MockExchange, sleeps: list[float]):
+        trade = BingX("api_key", "secret_key", exchange.transport(retry_policy=RetryPolicy())).perpetual_v2.trade
+        exchange.fail(504, endpoint=ORDER_ENDPOINT)
+        assert trade.create_order(self.order("mm-2"))["order"]["clientOrderId"] == "mm-2"
+        assert exchange.calls[ORDER_ENDPOINT] == 3 # the order, the status lookup and the resend
+        assert len(sleeps) == 1
+
+    def test_reconcile_resend_withdraws_from_the_budget(self, exchange: MockExchange, sleeps: list[float]):
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=0.0))
+        trade = BingX("api_key", "secret_key", exchange.transport(retry_policy=policy)).perpetual_v2.trade
+        exchange.fail(504, endpoint=ORDER_ENDPOINT)
+        with pytest.raises(ServerError):
+            trade.create_order(self.order("mm-3"))
+        assert exchange.calls[ORDER_ENDPOINT] == 2
+        assert trade.get_open_orders("BTC-USDT")["orders"] == []
+
+    def test_async_reconcile_resends_a_missing_order(self, exchange: MockExchange, monkeypatch):
+        sleeps: list[float] = []
+
+        async def sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr(aio_http_manager.asyncio, "sleep", sleep)
+
+        async def main() -> dict:
+            trade = AsyncBingX("api_key", "secret_key", exchange.async_transport(retry_policy=RetryPolicy())).perpetual_v2.trade
+            return await trade.create_order(self.order("mm-4"))
+
+        exchange.fail(504, endpoint=ORDER_ENDPOINT)
+        assert asyncio.run(main())["order"]["clientOrderId"] == "mm-4"
+        assert exchange.calls[ORDER_ENDPOINT] == 3
+        assert len(sleeps) == 1
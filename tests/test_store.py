@@ -0,0 +1,109 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bingX.spot.market import Market as SpotMarket
+from bingX.store import MarketDataStore
+
+MINUTE = 60 * 1000
+START = 1700000000000
+
+
+class FakeMarket:
+    def __init__(self, listed: int = START) -> None:
+        self.calls: list[tuple[int, int]] = []
+        self.listed = listed
+        self.trades = [{"time": START + i, "isBuyerMaker": i % 2 == 0, "price": "100", "qty": "1", "quoteQty": "100"} for i in range(3)]
+
+    def get_k_line_data(self, symbol: str, interval: str, start_time: int, end_time: int, limit: int):
+        self.calls.append((start_time, end_time))
+        return [{"time": t, "open": "1", "high": "2", "low": "0.5", "close": str(t), "volume": "1"} for t in range(max(start_time, self.listed), end_time + 1, MINUTE)]
+
+    def get_latest_trade_of_trading_pair(self, symbol: str, limit: int):
+        return self.trades
+
+
+class FakeSpotMarket(SpotMarket):
+    def __init__(self) -> None:
+        self.trades: list[dict] = []
+
+    def get_transaction_records(self, symbol: str, limit: int = 100):
+        return self.trades
+
+
+def test_klines_are_served_from_disk(tmp_path):
+    market = FakeMarket()
+    store = MarketDataStore(str(tmp_path), market)
+    frame = store.klines("BTC-USDT", "1m", START, START + 30 * MINUTE)
+    assert len(frame) == 30
+    assert market.calls
+
+    market.calls.clear()
+    frame = store.klines("BTC-USDT", "1m", START + 10 * MINUTE, START + 20 * MINUTE)
+    assert market.calls == []
+    assert len(frame) == 10
+    assert isinstance(frame.close.base, np.memmap) or isinstance(frame.close, np.memmap)
+    assert frame.open_time[0] == START + 10 * MINUTE
+
+
+def test_klines_fetch_only_the_tail(tmp_path):
+    market = FakeMarket()
+    store = MarketDataStore(str(tmp_path), market)
+    store.klines("BTC-USDT", "1m", START, START + 30 * MINUTE)
+    market.calls.clear()
+    frame = store.klines("BTC-USDT", "1m", START, START + 40 * MINUTE)
+    assert market.calls == [(START + 29 * MINUTE, START + 40 * MINUTE - 1)]
+    assert len(frame) == 40
+    assert np.all(np.diff(frame.open_time) == MINUTE)
+
+
+def test_klines_remember_the_listing_date(tmp_path):
+    market = FakeMarket(listed=START + 5 * MINUTE)
+    store = MarketDataStore(str(tmp_path), market)
+    assert len(store.klines("BTC-USDT", "1m", START, START + 10 * MINUTE)) == 5
+    market.calls.clear()
+    store.klines("BTC-USDT", "1m", START, START + 10 * MINUTE)
+    assert market.calls == []
+
+
+def test_missing_ranges():
+    open_time = np.array([START, START + MINUTE, START + 4 * MINUTE], dtype=np.int64)
+    assert MarketDataStore.missing_ranges(open_time, "1m", START, START + 5 * MINUTE, updated=START + 10 * MINUTE) == [(START + 2 * MINUTE, START + 4 * MINUTE)]
+    assert MarketDataStore.missing_ranges(open_time, "1m", START, START + 5 * MINUTE, [[START + 2 * MINUTE, START + 3 * MINUTE]], START + 10 * MINUTE) == []
+
+
+def test_trades_are_appended(tmp_path):
+    market = FakeMarket()
+    store = MarketDataStore(str(tmp_path), market)
+    assert store.trades("BTC-USDT")["time"].tolist() == [START, START + 1, START + 2]
+    market.trades = market.trades[1:] + [{"time": START + 3, "isBuyerMaker": True, "price": "101", "qty": "2", "quoteQty": "202"}]
+    trades = store.trades("BTC-USDT")
+    assert trades["time"].tolist() == [START, START + 1, START + 2, START + 3]
+    assert trades["price"][-1] == 101.0
+    assert trades["is_buyer_maker"].tolist() == [True, False, True, True]
+
+
+def test_trades_sharing_the_last_millisecond_are_kept(tmp_path):
+    market = FakeMarket()
+    store = MarketDataStore(str(tmp_path), market)
+    market.trades = [{"time": START, "isBuyerMaker": True, "price": "100", "qty": "1"}, {"time": START + 1, "isBuyerMaker": True, "price": "100", "qty": "1"}]
+    store.trades("BTC-USDT")
+    # the same trade at START + 1 comes back with a second one of the same millisecond, then an identical third one
+    market.trades = market.trades + [{"time": START + 1, "isBuyerMaker": False, "price": "101", "qty": "2"}]
+    assert store.trades("BTC-USDT")["price"].tolist() == [100.0, 100.0, 101.0]
+    market.trades = market.trades + [{"time": START + 1, "isBuyerMaker": True, "price": "100", "qty": "1"}]
+    trades = store.trades("BTC-USDT")
+    assert trades["time"].tolist() == [START, START + 1, START + 1, START + 1]
+    assert trades["price"].tolist() == [100.0, 100.0, 101.0, 100.0]
+    assert store.trades("BTC-USDT")["time"].tolist() == [START, START + 1, START + 1, START + 1]
+
+
+def test_spot_trades_are_deduplicated_by_id(tmp_path):
+    market = FakeSpotMarket()
+    store = MarketDataStore(str(tmp_path), market)
+    market.trades = [{"id": 1, "time": START, "buyerMaker": True, "price": "100", "qty": "1"}, {"id": 2, "time": START + 1, "buyerMaker": True, "price": "100", "qty": "1"}]
+    store.trades("BTC-USDT")
+    market.trades = market.trades[1:] + [{"id": 3, "time": START + 1, "buyerMaker": True, "price": "100", "qty": "1"}, {"id": 4, "time": START + 2, "buyerMaker": False, "price": "99", "qty": "3"}]
+    trades = store.trades("BTC-USDT")
+    assert trades["id"].tolist() == [1, 2, 3, 4]
+    assert trades["time"].tolist() == [START, START + 1, START + 1, START + 2]
@@ -0,0 +1,86 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bingX._http_manager import _HTTPManager
+from bingX.aio.transport import AsyncTransport
+from bingX.time_sync import TimeSync
+from bingX.transport import Transport
+
+OFFSET = 5_000
+
+
+class ServerTimeHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({"code": 0, "msg": "", "data": {"serverTime": int(time.time() * 1000) + OFFSET}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ServerTimeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def refresh_threads() -> set[threading.Thread]:
+    return {thread for thread in threading.enumerate() if thread.name == "bingx-time-sync"}
+
+
+class TestTimeSync:
+    def test_sync(self, base_url: str):
+        time_sync = TimeSync(base_url, samples=3, refresh_interval=0)
+        assert time_sync.sync() == pytest.approx(OFFSET, abs=200)
+        assert time_sync.round_trip_time is not None
+        assert time_sync.now() - int(time.time() * 1000) == pytest.approx(OFFSET, abs=200)
+
+    def test_unreachable_server_keeps_offset(self):
+        time_sync = TimeSync("http://127.0.0.1:1", samples=1, refresh_interval=0, timeout=0.5)
+        assert time_sync.sync() == 0.0
+        assert time_sync.round_trip_time is None
+
+    def test_corrected_timestamp_and_recv_window(self, base_url: str):
+        transport = Transport(time_sync=TimeSync(base_url, samples=3, refresh_interval=0))
+        http_manager = _HTTPManager("api_key", "secret_key", transport, recv_window=5000)
+        query_string, _ = http_manager._prepare_request("GET", {"symbol": "BTC-USDT"}, {}, transport.timestamp())
+        params = dict(param.split("=") for param in query_string.split("&"))
+        assert params["recvWindow"] == "5000"
+        assert int(params["timestamp"]) - int(time.time() * 1000) == pytest.approx(OFFSET, abs=200)
+
+    def test_close_stops_the_refresh(self, base_url: str):
+        before = refresh_threads()
+        time_sync = TimeSync(base_url, samples=1, refresh_interval=0.05)
+        transport = Transport(time_sync=time_sync)
+        assert len(refresh_threads() - before) == 1
+        transport.close()
+        assert refresh_threads() - before == set()
+
+        time_sync.start() # a stopped time sync can be started again
+        assert len(refresh_threads() - before) == 1
+        time_sync.stop()
+        assert refresh_threads() - before == set()
+
+    def test_async_transport_syncs_off_the_event_loop(self, base_url: str):
+        async def main():
+            time_sync = TimeSync(base_url, samples=3, refresh_interval=60.0)
+            transport = AsyncTransport(time_sync=time_sync)
+            assert time_sync.last_sync is None # constructing the transport sends nothing
+            await asyncio.gather(transport.start(), transport.start())
+            assert time_sync.last_sync is not None
+            assert transport.timestamp() - int(time.time() * 1000) == pytest.approx(OFFSET, abs=200)
+            await transport.close()
+
+        before = refresh_threads()
+        asyncio.run(main())
+        assert refresh_threads() - before == set()
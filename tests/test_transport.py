@@ -0,0 +1,29 @@
+from bingX._http_manager import _HTTPManager
+from bingX.main import BingX
+from bingX.transport import Transport
+
+
+class TestTransport:
+    def test_default_is_shared(self):
+        assert Transport.default() is Transport.default()
+
+    def test_sub_clients_borrow_transport(self):
+        transport = Transport(pool_maxsize=2)
+        client = BingX("api_key", "secret_key", transport)
+        assert client.perpetual_v2.market._Market__http_manager._HTTPManager__transport is transport
+        assert client.spot.transfer._Transfer__http_manager._HTTPManager__transport is transport
+
+    def test_http_manager_uses_default_transport(self):
+        http_manager = _HTTPManager("api_key", "secret_key")
+        assert http_manager._HTTPManager__transport is Transport.default()
+
+    def test_http2_client(self):
+        transport = Transport(http2=True)
+        assert transport.session._transport._pool._http2
+        assert transport.session._transport._pool._http1
+        transport.close()
+
+    def test_http2_prior_knowledge_over_plain_http(self):
+        transport = Transport(base_url="http://127.0.0.1:8080", http2=True)
+        assert not transport.session._transport._pool._http1
+        transport.close()
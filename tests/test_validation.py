@@ -0,0 +1,62 @@
+import pytest
+
+from bingX.exceptions import OrderValidationError
+from bingX.perpetual.v2.types import Order, OrderType, PositionSide, Side
+from bingX.reference import ReferenceDataCache
+from bingX.spot.types import Order as SpotOrder
+from bingX.spot.types import OrderType as SpotOrderType
+from bingX.spot.types import Side as SpotSide
+from bingX.validation import OrderValidator, SymbolFilters
+
+CONTRACTS = [
+    {"symbol": "BTC-USDT", "pricePrecision": 1, "quantityPrecision": 4, "tradeMinQuantity": 0.0001, "tradeMinUSDT": 2},
+    {"symbol": "DOGE-USDT", "pricePrecision": 5, "quantityPrecision": 0, "tradeMinQuantity": 1, "tradeMinUSDT": 2},
+]
+
+
+@pytest.fixture
+def validator() -> OrderValidator:
+    return OrderValidator(ReferenceDataCache(lambda: CONTRACTS))
+
+
+def order(symbol: str, quantity: float, price: float) -> Order:
+    return Order(symbol=symbol, side=Side.BUY, positionSide=PositionSide.LONG, type=OrderType.LIMIT, quantity=quantity, price=price)
+
+
+def test_filters_from_records():
+    filters = SymbolFilters.from_record({"symbol": "BTC-USDT", "tickSize": 0.01, "stepSize": 0.00001, "minQty": 0.0001, "maxQty": 100, "minNotional": 5, "maxNotional": 10000})
+    assert filters.snap_price(64000.016) == 64000.02
+    assert filters.snap_quantity(0.123456) == 0.12345
+    assert SymbolFilters.from_record(CONTRACTS[0]).tick_size == pytest.approx(0.1)
+
+
+def test_validate_snaps_price_and_quantity(validator: OrderValidator):
+    validated = validator.validate(order("BTC-USDT", 0.123456, 64000.06))
+    assert validated.price == 64000.1
+    assert validated.quantity == 0.1234
+
+
+def test_validate_rejects_locally(validator: OrderValidator):
+    with pytest.raises(OrderValidationError):
+        validator.validate(order("BTC-USDT", 0.00001, 64000.0)) # rounds down to 0
+    with pytest.raises(OrderValidationError):
+        validator.validate(order("DOGE-USDT", 10, 0.1)) # notional 1 below 2
+    with pytest.raises(OrderValidationError):
+        validator.validate(order("XYZ-USDT", 1, 1))
+
+
+def test_validate_spot_market_buy(validator: OrderValidator):
+    spot_order = SpotOrder(symbol="DOGE-USDT", side=SpotSide.BUY, type=SpotOrderType.MARKET, quote_order_qty=1.0)
+    with pytest.raises(OrderValidationError):
+        validator.validate(spot_order)
+
+
+def test_validate_batch(validator: OrderValidator):
+    orders = [order("BTC-USDT", 0.123456, 64000.06), order("DOGE-USDT", 20.7, 0.123456), order("DOGE-USDT", 10, 0.1), order("XYZ-USDT", 1, 1)]
+    with pytest.raises(OrderValidationError) as e:
+        validator.validate_batch(orders)
+    assert sorted(e.value.errors) == [2, 3]
+
+    validated = validator.validate_batch(orders[:2])
+    assert [(o.quantity, o.price) for o in validated] == [(0.1234, 64000.1), (20.0, 0.12346)]
+    assert validated == [validator.validate(o) for o in orders[:2]]